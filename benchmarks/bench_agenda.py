@@ -0,0 +1,65 @@
+"""Agregar y quitar elementos de una Agenda de N elementos.
+
+Mide Agenda.agregar y Agenda.quitar en posiciones al azar de agendas cada vez
+más grandes (lo que hacen agendar, cancelar y reprogramar con la agenda de un
+médico), y como contraste lo mismo sobre dos listas planas paralelas con
+insert y del, que mueven los punteros de toda la agenda.
+
+Uso:
+    python -m benchmarks.bench_agenda [operaciones] [tamaños...]
+"""
+import random
+import sys
+import time
+from bisect import bisect_left, bisect_right
+
+from src.agenda import Agenda
+
+
+class ListasPlanas:
+    """Claves y elementos en dos listas paralelas."""
+
+    def __init__(self, claves: list):
+        self.claves = list(claves)
+        self.elementos = list(claves)
+
+    def agregar(self, clave, elemento):
+        posicion = bisect_right(self.claves, clave)
+        self.claves.insert(posicion, clave)
+        self.elementos.insert(posicion, elemento)
+
+    def quitar(self, clave, elemento):
+        posicion = bisect_left(self.claves, clave)
+        while self.elementos[posicion] is not elemento:
+            posicion += 1
+        del self.claves[posicion]
+        del self.elementos[posicion]
+
+
+def medir(estructura, claves: list) -> float:
+    inicio = time.perf_counter()
+    for clave in claves:
+        estructura.agregar(clave, clave)
+    for clave in claves:
+        estructura.quitar(clave, clave)
+    return (time.perf_counter() - inicio) / (2 * len(claves))
+
+
+def main(operaciones: int, *tamanos: int):
+    azar = random.Random(1)
+    for cantidad in tamanos or (1_000, 10_000, 100_000, 1_000_000):
+        existentes = list(range(0, 2 * cantidad, 2))
+        agenda = Agenda()
+        for clave in existentes:
+            agenda.agregar(clave, clave)
+        # Claves impares: caen entre las existentes, repartidas por toda la agenda
+        claves = [2 * azar.randrange(cantidad) + 1 for _ in range(operaciones)]
+        tiempo_agenda = medir(agenda, claves)
+        tiempo_listas = medir(ListasPlanas(existentes), claves)
+        print(f"{cantidad:>10,} elementos: Agenda {tiempo_agenda * 1e6:6.2f} µs, "
+              f"listas planas {tiempo_listas * 1e6:7.2f} µs por operación")
+
+
+if __name__ == "__main__":
+    argumentos = [int(a) for a in sys.argv[1:]]
+    main(*(argumentos or [20_000]))
@@ -0,0 +1,87 @@
+"""Throughput de Clinica.agendar_turnos_lote frente a un bucle de agendar_turno.
+
+Cada lote reparte sus filas entre 20 médicos y 50 pacientes, así que el lote
+resuelve cada paciente, médico y cobertura una vez en lugar de una por fila.
+Se mide en memoria y con un journal (que el lote escribe una vez por lote en
+lugar de una por turno). Cada medición es la mejor de REPETICIONES corridas.
+
+Uso:
+    python -m benchmarks.bench_agendar_lote [filas por lote] [lotes]
+"""
+import os
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+from src.clinica import Clinica
+from src.paciente import Paciente
+from src.medico import Medico
+from src.especialidad import Especialidad
+
+DIAS = ['lunes', 'martes', 'miércoles', 'jueves', 'viernes']
+CANTIDAD_MEDICOS = 20
+CANTIDAD_PACIENTES = 50
+INICIO = datetime(2030, 1, 7, 8, 0)  # lunes
+REPETICIONES = 5
+
+
+def crear_clinica(ruta_journal: str | None = None) -> Clinica:
+    clinica = Clinica() if ruta_journal is None else Clinica.desde_journal(ruta_journal)
+    for i in range(CANTIDAD_PACIENTES):
+        clinica.agregar_paciente(Paciente("Paciente Prueba", str(10_000_000 + i), "01/01/1980"))
+    for i in range(CANTIDAD_MEDICOS):
+        medico = Medico(f"Dr. Médico {i}", f"M{i}")
+        # Turnos de un minuto: se agenda un turno por minuto y médico
+        medico.agregar_especialidad(Especialidad("Clínica", DIAS, duracion_minutos=1))
+        clinica.agregar_medico(medico)
+    return clinica
+
+
+def generar_solicitudes(cantidad: int, desplazamiento: int) -> list[tuple]:
+    solicitudes = []
+    for i in range(desplazamiento, desplazamiento + cantidad):
+        dia, minuto = divmod(i // CANTIDAD_MEDICOS, 600)
+        fecha_hora = INICIO + timedelta(weeks=dia // 5, days=dia % 5, minutes=minuto)
+        solicitudes.append((
+            str(10_000_000 + i % CANTIDAD_PACIENTES),
+            f"M{i % CANTIDAD_MEDICOS}",
+            "Clínica",
+            fecha_hora,
+        ))
+    return solicitudes
+
+
+def medir(filas: int, lotes: int, agendar, con_journal: bool = False) -> float:
+    with tempfile.TemporaryDirectory() as directorio:
+        clinica = crear_clinica(os.path.join(directorio, "clinica.journal") if con_journal else None)
+        todas = [generar_solicitudes(filas, n * filas) for n in range(lotes)]
+        inicio = time.perf_counter()
+        for solicitudes in todas:
+            agendar(clinica, solicitudes)
+        tiempo = time.perf_counter() - inicio
+        clinica.cerrar()
+    return filas * lotes / tiempo
+
+
+def en_bucle(clinica: Clinica, solicitudes: list[tuple]):
+    for solicitud in solicitudes:
+        clinica.agendar_turno(*solicitud)
+
+
+def en_lote(clinica: Clinica, solicitudes: list[tuple]):
+    clinica.agendar_turnos_lote(solicitudes)
+
+
+def main(filas: int, lotes: int):
+    print(f"{lotes} lotes de {filas} filas (turnos/s, mejor de {REPETICIONES})")
+    print(f"{'':<24} | {'en memoria':>10} | {'con journal':>11}")
+    for nombre, agendar in (("bucle de agendar_turno", en_bucle), ("agendar_turnos_lote", en_lote)):
+        en_memoria = max(medir(filas, lotes, agendar) for _ in range(REPETICIONES))
+        con_journal = max(medir(filas, lotes, agendar, con_journal=True) for _ in range(REPETICIONES))
+        print(f"{nombre:<24} | {en_memoria:>10,.0f} | {con_journal:>11,.0f}")
+
+
+if __name__ == "__main__":
+    argumentos = [int(a) for a in sys.argv[1:]]
+    main(*(argumentos + [500, 200][len(argumentos):]))
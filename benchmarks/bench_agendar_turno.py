@@ -0,0 +1,55 @@
+"""Latencia de Clinica.agendar_turno según la cantidad de turnos ya guardados.
+
+Uso:
+    python -m benchmarks.bench_agendar_turno [tamaño ...]
+
+Por defecto mide con 1k, 10k, 100k y 1M turnos previos.
+"""
+import sys
+import time
+from datetime import datetime, timedelta
+
+from src.clinica import Clinica
+from src.paciente import Paciente
+from src.medico import Medico
+from src.especialidad import Especialidad
+
+DIAS = ['lunes', 'martes', 'miércoles', 'jueves', 'viernes', 'sábado', 'domingo']
+CANTIDAD_MEDICOS = 100
+MUESTRAS = 2000
+INICIO = datetime(2030, 1, 1, 0, 0)
+
+
+def crear_clinica() -> Clinica:
+    clinica = Clinica()
+    clinica.agregar_paciente(Paciente("Juan Pérez", "12345678", "12/12/1990"))
+    for i in range(CANTIDAD_MEDICOS):
+        medico = Medico(f"Dr. Médico {i}", f"M{i}")
+        # Turnos de un minuto: se agenda un turno por minuto y médico
+        medico.agregar_especialidad(Especialidad("Clínica", DIAS, duracion_minutos=1))
+        clinica.agregar_medico(medico)
+    return clinica
+
+
+def agendar(clinica: Clinica, desde: int, hasta: int):
+    for i in range(desde, hasta):
+        fecha_hora = INICIO + timedelta(minutes=i // CANTIDAD_MEDICOS)
+        clinica.agendar_turno("12345678", f"M{i % CANTIDAD_MEDICOS}", "Clínica", fecha_hora)
+
+
+def main(tamanos: list[int]):
+    clinica = crear_clinica()
+    cargados = 0
+    print(f"{'turnos previos':>15} | {'µs por turno':>12}")
+    for tamano in sorted(tamanos):
+        agendar(clinica, cargados, tamano)
+        inicio = time.perf_counter()
+        agendar(clinica, tamano, tamano + MUESTRAS)
+        transcurrido = time.perf_counter() - inicio
+        cargados = tamano + MUESTRAS
+        print(f"{tamano:>15,} | {transcurrido / MUESTRAS * 1e6:>12.2f}")
+
+
+if __name__ == "__main__":
+    argumentos = [int(a) for a in sys.argv[1:]]
+    main(argumentos or [1_000, 10_000, 100_000, 1_000_000])
@@ -0,0 +1,66 @@
+"""Memoria por turno: lista de objetos Turno contra AlmacenTurnos.
+
+Crea N turnos repartidos entre pacientes y médicos ya existentes y mide con
+tracemalloc los bytes asignados por cada representación. También mide el
+costo de recorrer ambas (en el almacén cada Turno se arma al accederlo).
+
+Uso:
+    python -m benchmarks.bench_almacenturnos [turnos]
+"""
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+
+from src.almacenturnos import AlmacenTurnos
+from src.paciente import Paciente
+from src.medico import Medico
+from src.turno import Turno
+
+CANTIDAD_PACIENTES = 10_000
+CANTIDAD_MEDICOS = 200
+ESPECIALIDADES = ["Clínica", "Pediatría", "Cardiología"]
+INICIO = datetime(2030, 1, 1)
+
+
+def datos(cantidad: int):
+    pacientes = [Paciente("Paciente Prueba", str(10_000_000 + i), "01/01/1980") for i in range(CANTIDAD_PACIENTES)]
+    medicos = [Medico(f"Dr. Médico {i}", f"M{i}") for i in range(CANTIDAD_MEDICOS)]
+    for i in range(cantidad):
+        yield (pacientes[i % CANTIDAD_PACIENTES], medicos[i % CANTIDAD_MEDICOS],
+               ESPECIALIDADES[i % len(ESPECIALIDADES)], 30 * (i // CANTIDAD_MEDICOS))
+
+
+def medir(nombre: str, cantidad: int, construir):
+    filas = list(datos(cantidad))
+    tracemalloc.start()
+    contenedor = construir(filas)
+    memoria, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    inicio = time.perf_counter()
+    for turno in contenedor:
+        turno.obtener_fecha_hora()
+    recorrido = time.perf_counter() - inicio
+
+    print(f"{nombre:>15} | {memoria / cantidad:>6.1f} bytes/turno | {memoria / 1e6:>7.1f} MB | "
+          f"recorrido {recorrido:.2f} s")
+
+
+def main(cantidad: int):
+    print(f"{cantidad:,} turnos")
+    # Los datetime se crean dentro de la medición: en la lista cada turno conserva el suyo
+    medir("list[Turno]", cantidad, lambda filas: [
+        Turno.desde_registro(p, m, INICIO + timedelta(minutes=minutos), e) for p, m, e, minutos in filas
+    ])
+
+    def almacen(filas):
+        resultado = AlmacenTurnos()
+        for paciente, medico, especialidad, minutos in filas:
+            resultado.agregar(paciente, medico, especialidad, INICIO + timedelta(minutes=minutos))
+        return resultado
+    medir("AlmacenTurnos", cantidad, almacen)
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
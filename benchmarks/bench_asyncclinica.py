@@ -0,0 +1,60 @@
+"""Prueba de carga local de AsyncClinica con miles de solicitudes simultáneas.
+
+Uso:
+    python -m benchmarks.bench_asyncclinica [solicitudes] [médicos]
+"""
+import asyncio
+import sys
+import time
+from datetime import datetime, timedelta
+
+from src.asyncclinica import AsyncClinica
+from src.clinica import Clinica
+from src.paciente import Paciente
+from src.medico import Medico
+from src.especialidad import Especialidad
+
+DIAS = ['lunes', 'martes', 'miércoles', 'jueves', 'viernes', 'sábado', 'domingo']
+INICIO = datetime(2030, 1, 1)
+
+
+class ClinicaContadora(Clinica):
+    def __init__(self):
+        super().__init__(concurrente=True)
+        self.lotes = []
+
+    def agendar_turnos_lote(self, solicitudes, todo_o_nada=True):
+        self.lotes.append(len(solicitudes))
+        return super().agendar_turnos_lote(solicitudes, todo_o_nada)
+
+
+async def cargar(solicitudes: int, cantidad_medicos: int):
+    clinica = ClinicaContadora()
+    clinica.agregar_paciente(Paciente("Juan Pérez", "12345678", "12/12/1990"))
+    for i in range(cantidad_medicos):
+        medico = Medico(f"Dr. Médico {i}", f"M{i}")
+        # Turnos de un minuto: se agenda un turno por minuto y médico
+        medico.agregar_especialidad(Especialidad("Clínica", DIAS, duracion_minutos=1))
+        clinica.agregar_medico(medico)
+    async_clinica = AsyncClinica(clinica)
+
+    # Un 10% de las solicitudes repite un horario ya pedido
+    pedidos = []
+    for i in range(solicitudes):
+        j = i - 1 if i % 10 == 9 else i
+        fecha_hora = INICIO + timedelta(minutes=j // cantidad_medicos)
+        pedidos.append(async_clinica.agendar_turno("12345678", f"M{j % cantidad_medicos}", "Clínica", fecha_hora))
+
+    inicio = time.perf_counter()
+    resultados = await asyncio.gather(*pedidos, return_exceptions=True)
+    transcurrido = time.perf_counter() - inicio
+
+    rechazados = sum(isinstance(r, Exception) for r in resultados)
+    print(f"{solicitudes:,} solicitudes simultáneas, {cantidad_medicos} médicos")
+    print(f"  {transcurrido * 1000:.1f} ms, {solicitudes / transcurrido:,.0f} solicitudes/s")
+    print(f"  {len(clinica.lotes)} lotes enviados al ejecutor, {rechazados} rechazadas")
+
+
+if __name__ == "__main__":
+    argumentos = [int(a) for a in sys.argv[1:]]
+    asyncio.run(cargar(*(argumentos + [10_000, 50][len(argumentos):])))
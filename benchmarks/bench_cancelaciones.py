@@ -0,0 +1,80 @@
+"""Cancelar y reprogramar turnos en clínicas de distinto tamaño.
+
+Carga clínicas con N turnos y mide cuánto cuesta cancelar y reprogramar C
+turnos de cada una. Como contraste mide sacar esos turnos de la lista de
+turnos con list.remove, que es lo que costaría una cancelación que borrara el
+turno en vez de sacarlo de los índices por horario.
+
+Uso:
+    python -m benchmarks.bench_cancelaciones [operaciones] [tamaños...]
+"""
+import gc
+import sys
+import time
+from datetime import datetime, timedelta
+
+from src.clinica import Clinica
+
+CANTIDAD_MEDICOS = 100
+CANTIDAD_PACIENTES = 10_000
+INICIO = datetime(2030, 1, 7, 8, 0)
+DIAS = ['lunes', 'martes', 'miércoles', 'jueves', 'viernes', 'sábado', 'domingo']
+
+
+def horario(i: int) -> datetime:
+    return INICIO + timedelta(minutes=30 * (i // CANTIDAD_MEDICOS))
+
+
+def eventos(cantidad: int):
+    for i in range(CANTIDAD_MEDICOS):
+        yield {"op": "medico", "nombre": f"Dr. Médico {i}", "matricula": f"M{i}",
+               "especialidades": [{"tipo": "Clínica", "dias": DIAS}]}
+    for i in range(CANTIDAD_PACIENTES):
+        yield {"op": "paciente", "nombre": "Paciente Prueba", "dni": str(10_000_000 + i),
+               "fecha_nacimiento": "01/01/1980"}
+    for i in range(cantidad):
+        yield {"op": "turno", "dni": str(10_000_000 + i % CANTIDAD_PACIENTES), "matricula": f"M{i % CANTIDAD_MEDICOS}",
+               "especialidad": "Clínica", "fecha_hora": horario(i).isoformat()}
+
+
+def medir(cantidad: int, operaciones: int):
+    clinica = Clinica()
+    clinica._cargar_eventos(eventos(cantidad))
+    # Que la recolección pendiente de la carga no caiga dentro de la medición
+    gc.collect()
+    # Turnos repartidos a lo largo de toda la clínica
+    elegidos = [cantidad * k // operaciones for k in range(operaciones)]
+    mitad = operaciones // 2
+
+    inicio = time.perf_counter()
+    for i in elegidos[:mitad]:
+        clinica.cancelar_turno(f"M{i % CANTIDAD_MEDICOS}", horario(i))
+    tiempo_cancelar = time.perf_counter() - inicio
+
+    # Cada turno pasa al horario siguiente al último de su médico, que está libre
+    libre = horario(cantidad + CANTIDAD_MEDICOS)
+    inicio = time.perf_counter()
+    for k, i in enumerate(elegidos[mitad:]):
+        clinica.reprogramar_turno(f"M{i % CANTIDAD_MEDICOS}", horario(i), libre + timedelta(minutes=30 * k))
+    tiempo_reprogramar = time.perf_counter() - inicio
+
+    lista = clinica.obtener_turnos()
+    quitar = [lista[len(lista) * k // operaciones] for k in range(operaciones)]
+    inicio = time.perf_counter()
+    for turno in quitar:
+        lista.remove(turno)
+    tiempo_lista = time.perf_counter() - inicio
+
+    print(f"{cantidad:>10,} turnos: cancelar {tiempo_cancelar / mitad * 1e6:6.1f} µs, "
+          f"reprogramar {tiempo_reprogramar / (operaciones - mitad) * 1e6:6.1f} µs, "
+          f"list.remove {tiempo_lista / operaciones * 1e6:8.1f} µs por turno")
+
+
+def main(operaciones: int, *tamanos: int):
+    for cantidad in tamanos or (10_000, 100_000, 1_000_000):
+        medir(cantidad, operaciones)
+
+
+if __name__ == "__main__":
+    argumentos = [int(a) for a in sys.argv[1:]]
+    main(*(argumentos or [2_000]))
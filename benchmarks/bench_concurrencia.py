@@ -0,0 +1,118 @@
+"""Escalado de Clinica(concurrente=True) con varios hilos agendando turnos.
+
+Compara, para 1, 2, 4 y 8 hilos, los bloqueos por médico contra una
+Clinica(concurrente=False) con un único bloqueo global alrededor de cada
+llamada (la alternativa sin bloqueos por médico). Escenarios en memoria:
+- cada hilo agenda turnos de un médico y un paciente distintos (los hilos no
+  compiten por ningún bloqueo);
+- médicos distintos, pero todos los turnos para el mismo paciente (compiten
+  por el bloqueo y la historia clínica del paciente);
+- todos los hilos agendan turnos del mismo médico y paciente;
+- médicos y pacientes distintos con el bloqueo global.
+
+Con el GIL, agendar en memoria es trabajo de CPU y no hay nada que los hilos
+puedan hacer en paralelo, así que ahí sólo se espera que los bloqueos por
+médico no empeoren el escalado. Por eso se repiten los escenarios sin
+competencia con un journal que hace fsync en cada turno
+(eventos_por_sincronizacion=1): mientras un hilo espera al disco, con
+bloqueos por médico los demás validan y escriben sus turnos, y un fsync
+cubre varios; con el bloqueo global cada turno espera su propio fsync.
+
+Uso:
+    python -m benchmarks.bench_concurrencia [turnos por hilo]
+"""
+import os
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from contextlib import nullcontext
+from datetime import datetime, timedelta
+
+from src.clinica import Clinica
+from src.paciente import Paciente
+from src.medico import Medico
+from src.especialidad import Especialidad
+
+DIAS = ['lunes', 'martes', 'miércoles', 'jueves', 'viernes', 'sábado', 'domingo']
+INICIO = datetime(2030, 1, 1)
+REPETICIONES = 5
+
+
+def crear_clinica(cantidad: int, concurrente: bool, ruta_journal: str | None = None) -> Clinica:
+    if ruta_journal is None:
+        clinica = Clinica(concurrente=concurrente)
+    else:
+        clinica = Clinica.desde_journal(ruta_journal, concurrente, eventos_por_sincronizacion=1)
+    for i in range(cantidad):
+        clinica.agregar_paciente(Paciente("Paciente Prueba", str(10_000_000 + i), "12/12/1990"))
+        medico = Medico(f"Dr. Médico {i}", f"M{i}")
+        # Turnos de un minuto: se agenda un turno por minuto y médico
+        medico.agregar_especialidad(Especialidad("Clínica", DIAS, duracion_minutos=1))
+        clinica.agregar_medico(medico)
+    return clinica
+
+
+def medir(hilos: int, turnos: int, mismo_medico: bool = False, mismo_paciente: bool = False,
+          bloqueo_global: bool = False, con_journal: bool = False) -> float:
+    """Turnos por segundo, la mediana de REPETICIONES corridas (cada una con una clínica nueva)."""
+    return statistics.median(
+        medir_una_vez(hilos, turnos, mismo_medico, mismo_paciente, bloqueo_global, con_journal)
+        for _ in range(REPETICIONES)
+    )
+
+
+def medir_una_vez(hilos: int, turnos: int, mismo_medico: bool, mismo_paciente: bool,
+                  bloqueo_global: bool, con_journal: bool) -> float:
+    with tempfile.TemporaryDirectory() as directorio:
+        ruta_journal = os.path.join(directorio, "clinica.journal") if con_journal else None
+        clinica = crear_clinica(hilos, not bloqueo_global, ruta_journal)
+        bloqueo = threading.Lock() if bloqueo_global else nullcontext()
+        barrera = threading.Barrier(hilos + 1)
+
+        def trabajar(numero: int):
+            matricula = "M0" if mismo_medico else f"M{numero}"
+            dni = str(10_000_000 + (0 if mismo_paciente else numero))
+            barrera.wait()
+            for i in range(turnos):
+                fecha_hora = INICIO + timedelta(minutes=i * hilos + numero)
+                with bloqueo:
+                    clinica.agendar_turno(dni, matricula, "Clínica", fecha_hora)
+
+        trabajadores = [threading.Thread(target=trabajar, args=(n,)) for n in range(hilos)]
+        for trabajador in trabajadores:
+            trabajador.start()
+        barrera.wait()
+        inicio = time.perf_counter()
+        for trabajador in trabajadores:
+            trabajador.join()
+        tiempo = time.perf_counter() - inicio
+        clinica.cerrar()
+    return hilos * turnos / tiempo
+
+
+def main(turnos: int):
+    print(f"Python {sys.version.split()[0]}, turnos/s (mediana de {REPETICIONES} corridas)")
+    print(f"\nEn memoria, {turnos:,} turnos por hilo")
+    print(f"{'hilos':>5} | {'médicos y pacientes distintos':>29} | {'mismo paciente':>14} | "
+          f"{'mismo médico':>12} | {'concurrente=False + bloqueo global':>34}")
+    for hilos in (1, 2, 4, 8):
+        distintos = medir(hilos, turnos)
+        mismo_paciente = medir(hilos, turnos, mismo_paciente=True)
+        mismo_medico = medir(hilos, turnos, mismo_medico=True, mismo_paciente=True)
+        global_ = medir(hilos, turnos, bloqueo_global=True)
+        print(f"{hilos:>5} | {distintos:>29,.0f} | {mismo_paciente:>14,.0f} | "
+              f"{mismo_medico:>12,.0f} | {global_:>34,.0f}")
+
+    turnos_journal = max(turnos // 20, 1)
+    print(f"\nCon journal y fsync en cada turno, {turnos_journal:,} turnos por hilo")
+    print(f"{'hilos':>5} | {'médicos y pacientes distintos':>29} | {'concurrente=False + bloqueo global':>34}")
+    for hilos in (1, 2, 4, 8):
+        distintos = medir(hilos, turnos_journal, con_journal=True)
+        global_ = medir(hilos, turnos_journal, bloqueo_global=True, con_journal=True)
+        print(f"{hilos:>5} | {distintos:>29,.0f} | {global_:>34,.0f}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 20_000)
@@ -0,0 +1,70 @@
+"""Construcción de entidades: constructor con validación contra desde_registro.
+
+Crea N pacientes, médicos (con dos especialidades), turnos y recetas con cada
+camino y compara el tiempo. Las fechas de nacimiento varían para que la caché
+de fechas validadas no oculte el costo de strptime. Los turnos validados se
+crean en el futuro (el constructor rechaza los pasados).
+
+Uso:
+    python -m benchmarks.bench_constructores [cantidad]
+"""
+import sys
+import time
+from datetime import datetime, timedelta
+
+from src.especialidad import Especialidad
+from src.medico import Medico
+from src.paciente import Paciente
+from src.receta import Receta
+from src.turno import Turno
+
+INICIO = datetime(2030, 1, 1)
+
+
+def cronometrar(crear, filas) -> float:
+    inicio = time.perf_counter()
+    for fila in filas:
+        crear(*fila)
+    return time.perf_counter() - inicio
+
+
+def comparar(nombre: str, filas: list, validando, desde_registro):
+    lento = cronometrar(validando, filas)
+    rapido = cronometrar(desde_registro, filas)
+    print(f"{nombre:>12} | validando {len(filas) / lento:>12,.0f}/s | "
+          f"desde_registro {len(filas) / rapido:>12,.0f}/s | {lento / rapido:>5.1f}x")
+
+
+def main(cantidad: int):
+    print(f"{cantidad:,} entidades por tipo")
+    comparar("Paciente", [
+        ("Paciente Prueba", str(10_000_000 + i), f"{1 + i % 28:02d}/{1 + i // 28 % 12:02d}/{1930 + i // 336 % 90}")
+        for i in range(cantidad)
+    ], Paciente, Paciente.desde_registro)
+
+    def medico_validado(nombre, matricula, especialidades):
+        medico = Medico(nombre, matricula)
+        for tipo, dias in especialidades:
+            medico.agregar_especialidad(Especialidad(tipo, dias))
+        return medico
+
+    def medico_registrado(nombre, matricula, especialidades):
+        return Medico.desde_registro(nombre, matricula, [
+            Especialidad.desde_registro(tipo, dias) for tipo, dias in especialidades
+        ])
+    comparar("Medico", [
+        (f"Dr. Médico {i}", f"M{i}", [("Clínica", ["lunes", "martes"]), ("Pediatría", ["jueves"])])
+        for i in range(cantidad)
+    ], medico_validado, medico_registrado)
+
+    paciente = Paciente("Paciente Prueba", "10000000", "01/01/1980")
+    medico = Medico("Dr. Médico", "M1")
+    comparar("Turno", [
+        (paciente, medico, INICIO + timedelta(minutes=30 * i), "Clínica") for i in range(cantidad)
+    ], Turno, Turno.desde_registro)
+    comparar("Receta", [(paciente, medico, ["Paracetamol", "Ibuprofeno 400mg"]) for _ in range(cantidad)],
+             Receta, lambda p, m, medicamentos: Receta.desde_registro(p, m, medicamentos, INICIO))
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200_000)
@@ -0,0 +1,49 @@
+"""Exportación de todas las historias clínicas: tiempo y memoria adicional.
+
+Carga una clínica sintética reproduciendo eventos y compara el pico de
+memoria (tracemalloc) de exportar con Exportador contra armar el texto de
+todas las historias con str(historia).
+
+Uso:
+    python -m benchmarks.bench_exportador [eventos] [jsonl|csv]
+"""
+import os
+import sys
+import time
+import tracemalloc
+
+from src.clinica import Clinica
+from src.exportador import Exportador
+from benchmarks.bench_journal import generar_eventos
+
+
+def medir(funcion):
+    """Mide el tiempo sin tracemalloc (que lo distorsiona) y el pico de memoria en otra corrida."""
+    inicio = time.perf_counter()
+    resultado = funcion()
+    transcurrido = time.perf_counter() - inicio
+    tracemalloc.start()
+    funcion()
+    _, pico = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return resultado, transcurrido, pico
+
+
+def main(eventos: int, formato: str):
+    clinica = Clinica()
+    clinica._cargar_eventos(generar_eventos(eventos))
+    exportador = Exportador(clinica)
+
+    with open(os.devnull, "w", encoding="utf-8", newline="") as destino:
+        cantidad, transcurrido, pico = medir(lambda: exportador.exportar(destino, formato))
+    print(f"Exportador ({formato}): {cantidad:,} registros en {transcurrido:.2f} s "
+          f"({cantidad / transcurrido:,.0f} registros/s), pico {pico / 1e6:.2f} MB")
+
+    texto, transcurrido, pico = medir(
+        lambda: "\n".join(str(historia) for historia in clinica.iterar_historias_clinicas())
+    )
+    print(f"str(historia): {len(texto) / 1e6:.0f} MB de texto en {transcurrido:.2f} s, pico {pico / 1e6:.2f} MB")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 300_000, sys.argv[2] if len(sys.argv) > 2 else "jsonl")
@@ -0,0 +1,76 @@
+"""Consultas repetidas de una historia clínica: copias contra vistas de sólo lectura.
+
+Arma la historia de un paciente con N turnos y N recetas y la consulta C veces
+con obtener_turnos()/obtener_recetas() (una copia por llamada) y con
+vista_turnos()/vista_recetas(), recorriendo lo devuelto en cada consulta.
+Informa el tiempo total y los bytes asignados por consulta. Además compara
+"las últimas 5 recetas" y "los turnos de un mes" con las consultas por fecha
+de la historia contra copiar y recorrer la historia completa.
+
+Uso:
+    python -m benchmarks.bench_historias [entradas] [consultas]
+"""
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+
+from src.historiaclinica import HistoriaClinica
+from src.medico import Medico
+from src.paciente import Paciente
+from src.receta import Receta
+from src.turno import Turno
+
+INICIO = datetime(2030, 1, 1)
+
+
+def historia_con(entradas: int) -> HistoriaClinica:
+    paciente = Paciente("Paciente Prueba", "10000000", "01/01/1980")
+    medico = Medico("Dr. Médico", "M1")
+    historia = HistoriaClinica(paciente)
+    for i in range(entradas):
+        historia.agregar_turno(Turno.desde_registro(paciente, medico, INICIO + timedelta(minutes=30 * i), "Clínica"))
+        historia.agregar_receta(Receta.desde_registro(paciente, medico, ["Paracetamol"], INICIO + timedelta(minutes=i)))
+    return historia
+
+
+def medir(nombre: str, consultas: int, consultar):
+    inicio = time.perf_counter()
+    for _ in range(consultas):
+        turnos, recetas = consultar()
+        turnos[-1], recetas[-1]
+    tiempo = time.perf_counter() - inicio
+
+    tracemalloc.start()
+    resultado = consultar()
+    memoria, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del resultado
+    print(f"{nombre:>12} | {tiempo * 1000:>8.1f} ms en {consultas:,} consultas | {memoria:>8,} bytes/consulta")
+
+
+def cronometrar(nombre: str, consultas: int, consultar):
+    inicio = time.perf_counter()
+    for _ in range(consultas):
+        consultar()
+    print(f"{nombre:>30} | {(time.perf_counter() - inicio) * 1e6 / consultas:>8.1f} µs/consulta")
+
+
+def main(entradas: int, consultas: int):
+    historia = historia_con(entradas)
+    print(f"Historia con {entradas:,} turnos y {entradas:,} recetas")
+    medir("copias", consultas, lambda: (historia.obtener_turnos(), historia.obtener_recetas()))
+    medir("vistas", consultas, lambda: (historia.vista_turnos(), historia.vista_recetas()))
+
+    desde, hasta = INICIO + timedelta(days=30), INICIO + timedelta(days=60)
+    cronometrar("últimas 5 recetas (recorrido)", consultas, lambda: sorted(
+        historia.obtener_recetas(), key=lambda r: r.obtener_fecha())[-5:])
+    cronometrar("últimas 5 recetas (índice)", consultas, lambda: historia.obtener_ultimas_recetas(5))
+    cronometrar("turnos de un mes (recorrido)", consultas, lambda: [
+        t for t in historia.obtener_turnos() if desde <= t.obtener_fecha_hora() < hasta])
+    cronometrar("turnos de un mes (índice)", consultas, lambda: historia.obtener_turnos_entre(desde, hasta))
+
+
+if __name__ == "__main__":
+    argumentos = [int(a) for a in sys.argv[1:]]
+    main(*(argumentos + [5_000, 10_000][len(argumentos):]))
@@ -0,0 +1,53 @@
+"""Importación masiva de pacientes desde CSV y JSONL.
+
+Genera un archivo con N filas de pacientes (un 0,1% con errores o DNIs
+repetidos), lo importa en una clínica vacía y muestra el tiempo, las filas
+por segundo y el pico de memoria residente del proceso.
+
+Uso:
+    python -m benchmarks.bench_importador [filas] [csv|jsonl]
+"""
+import json
+import os
+import resource
+import sys
+import tempfile
+import time
+
+from src.clinica import Clinica
+from src.importador import Importador
+
+
+def generar(ruta: str, filas: int, formato: str):
+    with open(ruta, "w", encoding="utf-8") as archivo:
+        if formato == "csv":
+            archivo.write("nombre,dni,fecha_nacimiento\n")
+        for i in range(filas):
+            dni = str(10_000_000 + (i - 1 if i % 1000 == 999 else i))
+            fecha = "31/02/1990" if i % 1000 == 500 else f"{1 + i % 28:02d}/{1 + i % 12:02d}/{1940 + i % 80}"
+            if formato == "csv":
+                archivo.write(f"Paciente Prueba,{dni},{fecha}\n")
+            else:
+                archivo.write(json.dumps({"nombre": "Paciente Prueba", "dni": dni, "fecha_nacimiento": fecha}) + "\n")
+
+
+def main(filas: int, formato: str):
+    with tempfile.TemporaryDirectory() as directorio:
+        ruta = os.path.join(directorio, f"pacientes.{formato}")
+        generar(ruta, filas, formato)
+        tamano = os.path.getsize(ruta)
+
+        clinica = Clinica()
+        inicio = time.perf_counter()
+        reporte = Importador(clinica).importar_pacientes(ruta)
+        transcurrido = time.perf_counter() - inicio
+
+    pico = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    print(f"{filas:,} filas {formato} ({tamano / 1e6:.1f} MB) en {transcurrido:.2f} s "
+          f"({filas / transcurrido:,.0f} filas/s)")
+    print(f"  importados {reporte.obtener_importados():,}, rechazados {len(reporte.obtener_errores()):,}, "
+          f"pico de memoria {pico:.0f} MB")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000, sys.argv[2] if len(sys.argv) > 2 else "csv")
@@ -0,0 +1,62 @@
+"""Tiempo de reproducción de un journal grande al iniciar la clínica.
+
+Genera un journal sintético (pacientes, médicos, turnos y recetas) y mide
+Clinica.reproducir_journal.
+
+Uso:
+    python -m benchmarks.bench_journal [eventos]
+"""
+import json
+import os
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+from src.clinica import Clinica
+
+DIAS = ['lunes', 'martes', 'miércoles', 'jueves', 'viernes', 'sábado', 'domingo']
+CANTIDAD_MEDICOS = 200
+INICIO = datetime(2024, 1, 1)
+
+
+def generar_eventos(cantidad: int):
+    """Genera ~5% pacientes, ~10% recetas y el resto turnos."""
+    pacientes = max(1, cantidad // 20)
+    for i in range(CANTIDAD_MEDICOS):
+        yield {"op": "medico", "nombre": f"Dr. Médico {i}", "matricula": f"M{i}",
+               "especialidades": [{"tipo": "Clínica", "dias": DIAS}]}
+    for i in range(pacientes):
+        yield {"op": "paciente", "nombre": "Paciente Prueba", "dni": str(10_000_000 + i),
+               "fecha_nacimiento": "01/01/1980"}
+    restantes = cantidad - CANTIDAD_MEDICOS - pacientes
+    for i in range(restantes):
+        dni = str(10_000_000 + i % pacientes)
+        if i % 10 == 0:
+            yield {"op": "receta", "dni": dni, "matricula": f"M{i % CANTIDAD_MEDICOS}",
+                   "medicamentos": ["Paracetamol"], "fecha": (INICIO + timedelta(minutes=i)).isoformat()}
+        else:
+            fecha_hora = INICIO + timedelta(minutes=i // CANTIDAD_MEDICOS)
+            yield {"op": "turno", "dni": dni, "matricula": f"M{i % CANTIDAD_MEDICOS}",
+                   "especialidad": "Clínica", "fecha_hora": fecha_hora.isoformat()}
+
+
+def main(cantidad: int):
+    with tempfile.TemporaryDirectory() as directorio:
+        ruta = os.path.join(directorio, "clinica.journal")
+        with open(ruta, "w", encoding="utf-8") as archivo:
+            for evento in generar_eventos(cantidad):
+                archivo.write(json.dumps(evento, ensure_ascii=False, separators=(",", ":")) + "\n")
+        tamano = os.path.getsize(ruta)
+
+        inicio = time.perf_counter()
+        clinica = Clinica()
+        aplicados = clinica.reproducir_journal(ruta)
+        transcurrido = time.perf_counter() - inicio
+
+    print(f"{aplicados:,} eventos ({tamano / 1e6:.1f} MB) reproducidos en {transcurrido:.2f} s "
+          f"({aplicados / transcurrido:,.0f} eventos/s), {len(clinica.obtener_turnos()):,} turnos")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
@@ -0,0 +1,76 @@
+"""Catálogo de medicamentos: memoria de las recetas y consulta por medicamento.
+
+Emite N recetas con medicamentos tomados de un vademécum de V nombres (los
+nombres llegan como textos nuevos, como al leerlos de un archivo o del
+journal). Mide con tracemalloc la memoria de las recetas contra guardar una
+lista de textos nuevos por receta, y compara la consulta "quién recibió X" con el
+índice contra recorrer todas las historias clínicas.
+
+Uso:
+    python -m benchmarks.bench_medicamentos [recetas] [vademecum]
+"""
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+
+from src.clinica import Clinica
+
+CANTIDAD_PACIENTES = 10_000
+CANTIDAD_MEDICOS = 100
+INICIO = datetime(2024, 1, 1)
+
+
+def nombres(i: int, vademecum: int) -> list[str]:
+    # Textos nuevos en cada llamada, como los que produce json.loads
+    return [f"Medicamento {(i * 7 + k) % vademecum} 400mg" for k in range(1 + i % 3)]
+
+
+def eventos(cantidad: int, vademecum: int):
+    for i in range(CANTIDAD_MEDICOS):
+        yield {"op": "medico", "nombre": f"Dr. Médico {i}", "matricula": f"M{i}",
+               "especialidades": [{"tipo": "Clínica", "dias": ["lunes"]}]}
+    for i in range(CANTIDAD_PACIENTES):
+        yield {"op": "paciente", "nombre": "Paciente Prueba", "dni": str(10_000_000 + i),
+               "fecha_nacimiento": "01/01/1980"}
+    for i in range(cantidad):
+        yield {"op": "receta", "dni": str(10_000_000 + i % CANTIDAD_PACIENTES),
+               "matricula": f"M{i % CANTIDAD_MEDICOS}", "medicamentos": nombres(i, vademecum),
+               "fecha": (INICIO + timedelta(minutes=i)).isoformat()}
+
+
+def main(cantidad: int, vademecum: int):
+    tracemalloc.start()
+    listas = [nombres(i, vademecum) for i in range(cantidad)]
+    memoria_listas, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del listas
+
+    clinica = Clinica()
+    clinica._cargar_eventos(eventos(0, vademecum))
+    tracemalloc.start()
+    clinica._cargar_eventos(e for e in eventos(cantidad, vademecum) if e["op"] == "receta")
+    memoria_recetas, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{cantidad:,} recetas, vademécum de {vademecum} nombres")
+    print(f"  medicamentos como list[str]: {memoria_listas / cantidad:.1f} bytes/receta")
+    print(f"  recetas completas con textos del catálogo e índice: {memoria_recetas / cantidad:.1f} bytes/receta")
+
+    buscado = "medicamento 42 400MG"
+    inicio = time.perf_counter()
+    por_indice = clinica.obtener_recetas_con_medicamento(buscado)
+    tiempo_indice = time.perf_counter() - inicio
+
+    inicio = time.perf_counter()
+    por_recorrido = [receta for historia in clinica.iterar_historias_clinicas()
+                     for receta in historia.iterar_recetas()
+                     if any(m.casefold() == buscado.casefold() for m in receta.obtener_medicamentos())]
+    tiempo_recorrido = time.perf_counter() - inicio
+
+    print(f"  '{buscado}': {len(por_indice):,} recetas con el índice en {tiempo_indice * 1000:.2f} ms, "
+          f"{len(por_recorrido):,} recorriendo las historias en {tiempo_recorrido * 1000:.0f} ms")
+
+
+if __name__ == "__main__":
+    argumentos = [int(a) for a in sys.argv[1:]]
+    main(*(argumentos + [200_000, 500][len(argumentos):]))
@@ -0,0 +1,100 @@
+"""Huella de memoria de una clínica sintética, por tipo de entidad.
+
+Arma una clínica con P pacientes, M médicos (con una especialidad cada uno),
+T turnos por paciente y R recetas por paciente, y mide con tracemalloc los
+bytes asignados al crear cada tipo de entidad, y la huella total de la
+clínica con sus índices.
+
+Uso:
+    python -m benchmarks.bench_memoria [pacientes] [medicos] [turnos_por_paciente] [recetas_por_paciente]
+"""
+import gc
+import sys
+import tracemalloc
+from datetime import datetime, timedelta
+
+from src.clinica import Clinica
+from src.paciente import Paciente
+from src.medico import Medico
+from src.especialidad import Especialidad
+from src.turno import Turno
+from src.receta import Receta
+from src.historiaclinica import HistoriaClinica
+
+DIAS = ['lunes', 'martes', 'miércoles', 'jueves', 'viernes', 'sábado', 'domingo']
+INICIO = datetime(2030, 1, 1)
+
+
+def medir(nombre: str, cantidad: int, crear):
+    gc.collect()
+    tracemalloc.start()
+    objetos = crear()
+    memoria, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    # Se descuenta la lista que los contiene
+    memoria -= sys.getsizeof(objetos)
+    print(f"{nombre:>15} | {cantidad:>10,} | {memoria / cantidad:>8.1f} bytes")
+    return objetos
+
+
+def main(cantidad_pacientes: int, cantidad_medicos: int, turnos_por_paciente: int, recetas_por_paciente: int):
+    print(f"{'entidad':>15} | {'cantidad':>10} | bytes/entidad")
+    pacientes = medir("Paciente", cantidad_pacientes, lambda: [
+        Paciente("Paciente Prueba", str(10_000_000 + i), "01/01/1980") for i in range(cantidad_pacientes)
+    ])
+    especialidades = medir("Especialidad", cantidad_medicos, lambda: [
+        Especialidad("Clínica", DIAS) for _ in range(cantidad_medicos)
+    ])
+    medicos = medir("Medico", cantidad_medicos, lambda: [
+        Medico(f"Dr. Médico {i}", f"M{i}") for i in range(cantidad_medicos)
+    ])
+    for medico, especialidad in zip(medicos, especialidades):
+        medico.agregar_especialidad(especialidad)
+
+    cantidad_turnos = cantidad_pacientes * turnos_por_paciente
+    medir("Turno", cantidad_turnos, lambda: [
+        Turno.desde_registro(pacientes[i % cantidad_pacientes], medicos[i % cantidad_medicos],
+                         INICIO + timedelta(minutes=30 * (i // cantidad_medicos)), "Clínica")
+        for i in range(cantidad_turnos)
+    ])
+    cantidad_recetas = cantidad_pacientes * recetas_por_paciente
+    medir("Receta", cantidad_recetas, lambda: [
+        Receta.desde_registro(pacientes[i % cantidad_pacientes], medicos[i % cantidad_medicos],
+                          ["Paracetamol"], INICIO + timedelta(minutes=i))
+        for i in range(cantidad_recetas)
+    ])
+    medir("HistoriaClinica", cantidad_pacientes, lambda: [HistoriaClinica(p) for p in pacientes])
+
+    # Huella total: la clínica completa, con sus índices y entidades
+    del pacientes, medicos, especialidades
+    gc.collect()
+    tracemalloc.start()
+    clinica = Clinica()
+    clinica._cargar_eventos(eventos(cantidad_pacientes, cantidad_medicos, turnos_por_paciente, recetas_por_paciente))
+    total, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"Clínica completa: {total / 1e6:.1f} MB "
+          f"({cantidad_pacientes:,} pacientes, {cantidad_turnos:,} turnos, {cantidad_recetas:,} recetas)")
+    return clinica
+
+
+def eventos(cantidad_pacientes: int, cantidad_medicos: int, turnos_por_paciente: int, recetas_por_paciente: int):
+    for i in range(cantidad_medicos):
+        yield {"op": "medico", "nombre": f"Dr. Médico {i}", "matricula": f"M{i}",
+               "especialidades": [{"tipo": "Clínica", "dias": DIAS}]}
+    for i in range(cantidad_pacientes):
+        yield {"op": "paciente", "nombre": "Paciente Prueba", "dni": str(10_000_000 + i),
+               "fecha_nacimiento": "01/01/1980"}
+    for i in range(cantidad_pacientes * turnos_por_paciente):
+        yield {"op": "turno", "dni": str(10_000_000 + i % cantidad_pacientes),
+               "matricula": f"M{i % cantidad_medicos}", "especialidad": "Clínica",
+               "fecha_hora": (INICIO + timedelta(minutes=30 * (i // cantidad_medicos))).isoformat()}
+    for i in range(cantidad_pacientes * recetas_por_paciente):
+        yield {"op": "receta", "dni": str(10_000_000 + i % cantidad_pacientes),
+               "matricula": f"M{i % cantidad_medicos}", "medicamentos": ["Paracetamol"],
+               "fecha": (INICIO + timedelta(minutes=i)).isoformat()}
+
+
+if __name__ == "__main__":
+    argumentos = [int(a) for a in sys.argv[1:]]
+    main(*(argumentos + [100_000, 200, 5, 2][len(argumentos):]))
@@ -0,0 +1,62 @@
+"""Listados: primera página paginada contra la copia completa de obtener_*.
+
+Carga una clínica con P pacientes, M médicos y T turnos y mide cuánto tarda
+(y cuánta memoria asigna) mostrar los primeros elementos con obtener_pacientes()
+y obtener_turnos() contra obtener_pagina_pacientes() y obtener_pagina_turnos().
+
+Uso:
+    python -m benchmarks.bench_paginacion [pacientes] [medicos] [turnos]
+"""
+import gc
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+
+from src.clinica import Clinica
+
+INICIO = datetime(2030, 1, 1)
+TAMANO_PAGINA = 20
+DIAS = ['lunes', 'martes', 'miércoles', 'jueves', 'viernes', 'sábado', 'domingo']
+
+
+def eventos(cantidad_pacientes: int, cantidad_medicos: int, cantidad_turnos: int):
+    for i in range(cantidad_medicos):
+        yield {"op": "medico", "nombre": f"Dr. Médico {i}", "matricula": f"M{i}",
+               "especialidades": [{"tipo": "Clínica", "dias": DIAS}]}
+    for i in range(cantidad_pacientes):
+        yield {"op": "paciente", "nombre": "Paciente Prueba", "dni": str(10_000_000 + i),
+               "fecha_nacimiento": "01/01/1980"}
+    for i in range(cantidad_turnos):
+        yield {"op": "turno", "dni": str(10_000_000 + i % cantidad_pacientes),
+               "matricula": f"M{i % cantidad_medicos}", "especialidad": "Clínica",
+               "fecha_hora": (INICIO + timedelta(minutes=30 * (i // cantidad_medicos))).isoformat()}
+
+
+def medir(nombre: str, primera_pagina):
+    tracemalloc.start()
+    inicio = time.perf_counter()
+    elementos = primera_pagina()
+    tiempo = time.perf_counter() - inicio
+    _, pico = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{nombre:>30} | {len(elementos):>3} elementos | {tiempo * 1000:>8.2f} ms | pico {pico / 1e6:>6.2f} MB")
+
+
+def main(cantidad_pacientes: int, cantidad_medicos: int, cantidad_turnos: int):
+    clinica = Clinica()
+    clinica._cargar_eventos(eventos(cantidad_pacientes, cantidad_medicos, cantidad_turnos))
+    # La carga difiere la recolección; se hace antes para no cargársela a la primera medición
+    gc.collect()
+    print(f"{cantidad_pacientes:,} pacientes, {cantidad_medicos:,} médicos, {cantidad_turnos:,} turnos")
+
+    medir("obtener_pacientes()[:20]", lambda: clinica.obtener_pacientes()[:TAMANO_PAGINA])
+    medir("obtener_pagina_pacientes()", lambda: clinica.obtener_pagina_pacientes(0, TAMANO_PAGINA).obtener_elementos())
+    medir("sorted(obtener_turnos())[:20]", lambda: sorted(
+        clinica.obtener_turnos(), key=lambda t: t.obtener_fecha_hora())[:TAMANO_PAGINA])
+    medir("obtener_pagina_turnos()", lambda: clinica.obtener_pagina_turnos(None, TAMANO_PAGINA).obtener_elementos())
+
+
+if __name__ == "__main__":
+    argumentos = [int(a) for a in sys.argv[1:]]
+    main(*(argumentos + [200_000, 500, 500_000][len(argumentos):]))
@@ -0,0 +1,51 @@
+"""Reloj congelado e instantes enteros: construcción y orden de turnos.
+
+Crea N turnos con el reloj del sistema (una lectura de la hora por turno) y con
+un reloj congelado (una lectura por lote), y ordena los turnos por su
+fecha_hora (datetime armado en cada acceso) contra por su instante entero.
+
+Uso:
+    python -m benchmarks.bench_reloj [turnos]
+"""
+import random
+import sys
+import time
+from datetime import datetime, timedelta
+
+from src.medico import Medico
+from src.paciente import Paciente
+from src.reloj import RELOJ_SISTEMA
+from src.turno import Turno
+
+INICIO = datetime(2030, 1, 1)
+
+
+def cronometrar(nombre: str, cantidad: int, funcion):
+    inicio = time.perf_counter()
+    resultado = funcion()
+    tiempo = time.perf_counter() - inicio
+    print(f"{nombre:>30} | {tiempo:>6.3f} s | {cantidad / tiempo:>12,.0f}/s")
+    return resultado
+
+
+def main(cantidad: int):
+    paciente = Paciente("Paciente Prueba", "10000000", "01/01/1980")
+    medico = Medico("Dr. Médico", "M1")
+    horarios = [INICIO + timedelta(minutes=30 * i) for i in range(cantidad)]
+    random.Random(0).shuffle(horarios)
+    print(f"{cantidad:,} turnos")
+
+    cronometrar("Turno con reloj del sistema", cantidad, lambda: [
+        Turno(paciente, medico, horario, "Clínica") for horario in horarios
+    ])
+    congelado = RELOJ_SISTEMA.congelar()
+    turnos = cronometrar("Turno con reloj congelado", cantidad, lambda: [
+        Turno(paciente, medico, horario, "Clínica", congelado) for horario in horarios
+    ])
+
+    cronometrar("orden por obtener_fecha_hora", cantidad, lambda: sorted(turnos, key=Turno.obtener_fecha_hora))
+    cronometrar("orden por obtener_instante", cantidad, lambda: sorted(turnos, key=Turno.obtener_instante))
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 500_000)
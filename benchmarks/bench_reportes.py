@@ -0,0 +1,124 @@
+"""Reporte de ocupación con NumPy contra recorrer los turnos en Python.
+
+Carga M médicos con un año de turnos (cada médico atiende tres días por
+semana, con turnos de 20, 30 o 40 minutos, y tiene ocupado alrededor del 70%
+de su horario). Mide armar ReporteOcupacion para el año y para un trimestre
+y calcular sus resúmenes, y como contraste armar la misma matriz de
+ocupación recorriendo cada Turno en Python.
+
+Necesita NumPy.
+
+Uso:
+    python -m benchmarks.bench_reportes [medicos]
+"""
+import gc
+import sys
+import time
+from datetime import date, datetime, timedelta
+
+from src import reportes
+from src.clinica import Clinica
+from src.reportes import ReporteOcupacion
+
+INICIO = date(2030, 1, 7)  # lunes
+DIAS = 364
+DIAS_SEMANA = ['lunes', 'martes', 'miércoles', 'jueves', 'viernes', 'sábado', 'domingo']
+DURACIONES = (20, 30, 40)
+MINUTOS_BLOQUE = 30
+CANTIDAD_PACIENTES = 10_000
+
+
+def dias_de(medico: int) -> list[int]:
+    return [medico % 5, (medico + 2) % 5, 5 if medico % 2 else (medico + 4) % 5]
+
+
+def eventos(cantidad_medicos: int):
+    for i in range(CANTIDAD_PACIENTES):
+        yield {"op": "paciente", "nombre": "Paciente Prueba", "dni": str(10_000_000 + i),
+               "fecha_nacimiento": "01/01/1980"}
+    for m in range(cantidad_medicos):
+        yield {"op": "medico", "nombre": f"Dr. Médico {m}", "matricula": f"M{m}",
+               "especialidades": [{"tipo": "Clínica", "dias": [DIAS_SEMANA[d] for d in sorted(set(dias_de(m)))],
+                                   "duracion_minutos": DURACIONES[m % 3]}]}
+    cargados = 0
+    for m in range(cantidad_medicos):
+        duracion = DURACIONES[m % 3]
+        atiende = set(dias_de(m))
+        for dia in range(DIAS):
+            fecha = INICIO + timedelta(days=dia)
+            if fecha.weekday() not in atiende:
+                continue
+            for turno in range(12 * 60 // duracion):
+                if (m * 7919 + dia * 104729 + turno * 31) % 10 < 7:
+                    fecha_hora = datetime(fecha.year, fecha.month, fecha.day, 8) + timedelta(minutes=turno * duracion)
+                    yield {"op": "turno", "dni": str(10_000_000 + cargados % CANTIDAD_PACIENTES),
+                           "matricula": f"M{m}", "especialidad": "Clínica", "fecha_hora": fecha_hora.isoformat(),
+                           "duracion_minutos": duracion}
+                    cargados += 1
+
+
+def ocupacion_recorriendo(clinica: Clinica, desde: date, dias: int) -> list:
+    """La misma matriz médico × día × bloque, armada turno por turno en listas de Python."""
+    posicion = {matricula: i for i, matricula in enumerate(m.obtener_matricula() for m in clinica.obtener_medicos())}
+    bloques = 12 * 60 // MINUTOS_BLOQUE
+    ocupacion = [[[0] * bloques for _ in range(dias)] for _ in posicion]
+    for turno in clinica.iterar_turnos():
+        inicio = turno.obtener_fecha_hora()
+        dia = (inicio.date() - desde).days
+        if not 0 <= dia < dias:
+            continue
+        minuto = inicio.hour * 60 + inicio.minute - 8 * 60
+        fin = min(minuto + turno.obtener_duracion_minutos(), bloques * MINUTOS_BLOQUE)
+        fila = ocupacion[posicion[turno.obtener_medico().obtener_matricula()]][dia]
+        while minuto < fin:
+            bloque = minuto // MINUTOS_BLOQUE
+            siguiente = min((bloque + 1) * MINUTOS_BLOQUE, fin)
+            fila[bloque] += siguiente - minuto
+            minuto = siguiente
+    return ocupacion
+
+
+def cronometrar(funcion):
+    inicio = time.perf_counter()
+    resultado = funcion()
+    return resultado, time.perf_counter() - inicio
+
+
+def main(cantidad_medicos: int):
+    if reportes.np is None:
+        print("Este benchmark necesita NumPy (pip install numpy)")
+        return
+    clinica = Clinica()
+    clinica._cargar_eventos(eventos(cantidad_medicos))
+    gc.collect()
+    print(f"{cantidad_medicos} médicos, {len(clinica.obtener_turnos()):,} turnos en {DIAS} días")
+
+    fin_trimestre = INICIO + timedelta(days=91)
+    fin_anio = INICIO + timedelta(days=DIAS)
+    trimestre, tiempo = cronometrar(lambda: ReporteOcupacion(clinica, INICIO, fin_trimestre))
+    print(f"  ReporteOcupacion del trimestre:  {tiempo * 1000:8.1f} ms")
+    anio, tiempo = cronometrar(lambda: ReporteOcupacion(clinica, INICIO, fin_anio))
+    memoria = anio.obtener_ocupacion().nbytes + anio.obtener_capacidad().nbytes
+    print(f"  ReporteOcupacion del año:        {tiempo * 1000:8.1f} ms "
+          f"(matrices {anio.obtener_ocupacion().shape}, {memoria / 1e6:.1f} MB)")
+
+    for nombre, resumen in (
+            ("utilización total", anio.utilizacion),
+            ("utilización por médico", anio.utilizacion_por_medico),
+            ("mapa día × bloque", anio.utilizacion_por_dia_y_bloque),
+            ("mapa día de semana × bloque", anio.utilizacion_por_dia_semana_y_bloque),
+            ("capacidad ociosa", anio.obtener_capacidad_ociosa),
+            ("horas pico", anio.horas_pico)):
+        _, tiempo = cronometrar(resumen)
+        print(f"  {nombre + ':':<32} {tiempo * 1000:8.1f} ms")
+    print(f"  utilización {anio.utilizacion():.1%}; horas pico: "
+          + ", ".join(f"{hora:%H:%M} ({valor:.1%})" for hora, valor in anio.horas_pico()))
+
+    recorrida, tiempo = cronometrar(lambda: ocupacion_recorriendo(clinica, INICIO, DIAS))
+    print(f"  ocupación recorriendo los Turno: {tiempo * 1000:8.1f} ms")
+    if recorrida != anio.obtener_ocupacion().tolist():
+        print("  ERROR: las matrices no coinciden")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 500)
@@ -0,0 +1,76 @@
+"""Costo de guardar la clínica en SQLite frente a mantenerla sólo en memoria.
+
+Mide turnos agendados de a uno, turnos agendados en lotes (una transacción
+por lote) y el tiempo de carga al reabrir la base.
+
+Uso:
+    python -m benchmarks.bench_repositoriosqlite [turnos] [tamaño_lote]
+"""
+import os
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+from src.clinica import Clinica
+from src.repositoriosqlite import RepositorioSQLite
+from src.paciente import Paciente
+from src.medico import Medico
+from src.especialidad import Especialidad
+
+DIAS = ['lunes', 'martes', 'miércoles', 'jueves', 'viernes', 'sábado', 'domingo']
+CANTIDAD_MEDICOS = 50
+INICIO = datetime(2030, 1, 1)
+
+
+def poblar(clinica: Clinica):
+    clinica.agregar_paciente(Paciente("Juan Pérez", "12345678", "12/12/1990"))
+    for i in range(CANTIDAD_MEDICOS):
+        medico = Medico(f"Dr. Médico {i}", f"M{i}")
+        # Turnos de un minuto: se agenda un turno por minuto y médico
+        medico.agregar_especialidad(Especialidad("Clínica", DIAS, duracion_minutos=1))
+        clinica.agregar_medico(medico)
+
+
+def solicitudes(cantidad: int, desplazamiento: int = 0):
+    return [("12345678", f"M{i % CANTIDAD_MEDICOS}", "Clínica",
+             INICIO + timedelta(minutes=(i + desplazamiento) // CANTIDAD_MEDICOS))
+            for i in range(cantidad)]
+
+
+def medir(nombre: str, crear, cantidad: int, tamano_lote: int):
+    clinica = crear()
+    poblar(clinica)
+    inicio = time.perf_counter()
+    for solicitud in solicitudes(cantidad):
+        clinica.agendar_turno(*solicitud)
+    de_a_uno = time.perf_counter() - inicio
+
+    pendientes = solicitudes(cantidad, desplazamiento=cantidad)
+    inicio = time.perf_counter()
+    for i in range(0, cantidad, tamano_lote):
+        clinica.agendar_turnos_lote(pendientes[i:i + tamano_lote])
+    en_lotes = time.perf_counter() - inicio
+    clinica.cerrar()
+
+    print(f"{nombre:>8} | de a uno {cantidad / de_a_uno:>10,.0f} turnos/s | "
+          f"lotes de {tamano_lote} {cantidad / en_lotes:>10,.0f} turnos/s")
+
+
+def main(cantidad: int, tamano_lote: int):
+    medir("memoria", Clinica, cantidad, tamano_lote)
+    with tempfile.TemporaryDirectory() as directorio:
+        ruta = os.path.join(directorio, "clinica.db")
+        medir("sqlite", lambda: Clinica(repositorio=RepositorioSQLite(ruta)), cantidad, tamano_lote)
+
+        inicio = time.perf_counter()
+        clinica = Clinica(repositorio=RepositorioSQLite(ruta))
+        transcurrido = time.perf_counter() - inicio
+        print(f"carga de {len(clinica.obtener_turnos()):,} turnos desde SQLite ({os.path.getsize(ruta) / 1e6:.1f} MB)"
+              f" en {transcurrido:.2f} s")
+        clinica.cerrar()
+
+
+if __name__ == "__main__":
+    argumentos = [int(a) for a in sys.argv[1:]]
+    main(*(argumentos + [20_000, 500][len(argumentos):]))
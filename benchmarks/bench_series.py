@@ -0,0 +1,82 @@
+"""Series de turnos: un agendar_turno por ocurrencia contra agendar_serie.
+
+Agenda S series semanales de O ocurrencias (un paciente por serie, repartidas
+entre médicos y horarios) en una clínica en memoria y en una guardada en
+SQLite, y compara el tiempo de hacerlo turno por turno con el de una llamada
+a agendar_serie por serie.
+
+Uso:
+    python -m benchmarks.bench_series [series] [ocurrencias]
+"""
+import os
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+from src.clinica import Clinica
+from src.especialidad import Especialidad
+from src.medico import Medico
+from src.paciente import Paciente
+from src.repositoriosqlite import RepositorioSQLite
+
+DIAS = ['lunes', 'martes', 'miércoles', 'jueves', 'viernes', 'sábado', 'domingo']
+CANTIDAD_MEDICOS = 50
+INICIO = datetime(2030, 1, 7, 8, 0)
+SEMANA = timedelta(weeks=1)
+
+
+def poblar(clinica: Clinica, cantidad_series: int):
+    clinica.agregar_pacientes_lote(
+        Paciente("Paciente Prueba", str(10_000_000 + i), "01/01/1980") for i in range(cantidad_series)
+    )
+    for i in range(CANTIDAD_MEDICOS):
+        medico = Medico(f"Dr. Médico {i}", f"M{i}")
+        medico.agregar_especialidad(Especialidad("Clínica", DIAS))
+        clinica.agregar_medico(medico)
+
+
+def series(cantidad_series: int):
+    for i in range(cantidad_series):
+        yield (str(10_000_000 + i), f"M{i % CANTIDAD_MEDICOS}",
+               INICIO + timedelta(minutes=30 * (i // CANTIDAD_MEDICOS)))
+
+
+def de_a_uno(clinica: Clinica, cantidad_series: int, ocurrencias: int):
+    for dni, matricula, inicio in series(cantidad_series):
+        for semana in range(ocurrencias):
+            clinica.agendar_turno(dni, matricula, "Clínica", inicio + SEMANA * semana)
+
+
+def por_serie(clinica: Clinica, cantidad_series: int, ocurrencias: int):
+    for dni, matricula, inicio in series(cantidad_series):
+        clinica.agendar_serie(dni, matricula, "Clínica", inicio, cantidad=ocurrencias)
+
+
+def medir(nombre: str, crear, agendar, cantidad_series: int, ocurrencias: int):
+    clinica = crear()
+    poblar(clinica, cantidad_series)
+    inicio = time.perf_counter()
+    agendar(clinica, cantidad_series, ocurrencias)
+    tiempo = time.perf_counter() - inicio
+    clinica.cerrar()
+    turnos = cantidad_series * ocurrencias
+    print(f"{nombre:>28} | {tiempo:>7.3f} s | {turnos / tiempo:>10,.0f} turnos/s")
+
+
+def main(cantidad_series: int, ocurrencias: int):
+    print(f"{cantidad_series:,} series de {ocurrencias} turnos semanales")
+    with tempfile.TemporaryDirectory() as directorio:
+        bases = iter(range(4))
+
+        def sqlite():
+            return Clinica(repositorio=RepositorioSQLite(os.path.join(directorio, f"clinica{next(bases)}.db")))
+        medir("memoria, de a uno", Clinica, de_a_uno, cantidad_series, ocurrencias)
+        medir("memoria, agendar_serie", Clinica, por_serie, cantidad_series, ocurrencias)
+        medir("SQLite, de a uno", sqlite, de_a_uno, cantidad_series, ocurrencias)
+        medir("SQLite, agendar_serie", sqlite, por_serie, cantidad_series, ocurrencias)
+
+
+if __name__ == "__main__":
+    argumentos = [int(a) for a in sys.argv[1:]]
+    main(*(argumentos + [2_000, 26][len(argumentos):]))
@@ -0,0 +1,63 @@
+"""Tiempo de inicio según el tamaño de la historia, con y sin snapshot.
+
+Para cada tamaño genera un journal sintético, mide el inicio reproduciendo
+todo el journal, toma un snapshot, agrega una cola de 1% de eventos y mide
+el inicio desde el snapshot más la cola.
+
+Uso:
+    python -m benchmarks.bench_snapshot [eventos ...]
+"""
+import json
+import os
+import sys
+import tempfile
+import time
+
+from src.clinica import Clinica
+from benchmarks.bench_journal import generar_eventos
+
+
+def tamano_directorio(directorio: str) -> int:
+    return sum(os.path.getsize(os.path.join(directorio, nombre)) for nombre in os.listdir(directorio))
+
+
+def iniciar(directorio: str) -> tuple[float, Clinica]:
+    inicio = time.perf_counter()
+    clinica = Clinica.desde_directorio(directorio)
+    return time.perf_counter() - inicio, clinica
+
+
+def medir(cantidad: int):
+    with tempfile.TemporaryDirectory() as directorio:
+        eventos = list(generar_eventos(cantidad))
+        cola = max(1, cantidad // 100)
+        with open(os.path.join(directorio, "journal-000001.log"), "w", encoding="utf-8") as archivo:
+            for evento in eventos[:-cola]:
+                archivo.write(json.dumps(evento, ensure_ascii=False, separators=(",", ":")) + "\n")
+        tamano_journal = tamano_directorio(directorio)
+
+        sin_snapshot, clinica = iniciar(directorio)
+        clinica.tomar_snapshot()
+        clinica.cerrar()
+        with open(os.path.join(directorio, "journal-000002.log"), "a", encoding="utf-8") as archivo:
+            for evento in eventos[-cola:]:
+                if evento["op"] in ("turno", "receta"):
+                    archivo.write(json.dumps(evento, ensure_ascii=False, separators=(",", ":")) + "\n")
+        tamano_snapshot = tamano_directorio(directorio)
+
+        con_snapshot, clinica = iniciar(directorio)
+        clinica.cerrar()
+
+    print(f"{cantidad:>10,} | {sin_snapshot:>8.2f} s ({tamano_journal / 1e6:>6.1f} MB) | "
+          f"{con_snapshot:>8.2f} s ({tamano_snapshot / 1e6:>6.1f} MB)")
+
+
+def main(tamanos: list[int]):
+    print(f"{'eventos':>10} | {'sólo journal':>20} | {'snapshot + cola 1%':>20}")
+    for cantidad in tamanos:
+        medir(cantidad)
+
+
+if __name__ == "__main__":
+    argumentos = [int(a) for a in sys.argv[1:]]
+    main(argumentos or [100_000, 300_000, 1_000_000])
@@ -0,0 +1,83 @@
+"""Detección de superposiciones contra agendas de médicos cada vez más llenas.
+
+Carga un médico con N turnos de 30 minutos (días completos de 8 a 18) y mide
+cuánto cuesta validar un horario contra su agenda con validar_turno_no_duplicado
+(búsqueda binaria del turno anterior y del siguiente), y como contraste
+recorrer todos sus turnos comparando intervalos.
+
+Uso:
+    python -m benchmarks.bench_superposiciones [consultas] [tamaños...]
+"""
+import gc
+import sys
+import time
+from datetime import datetime, timedelta
+
+from src.clinica import Clinica
+from src.excepciones import TurnoOcupadoException
+from src.reloj import MICROSEGUNDOS_POR_MINUTO, a_instante
+
+INICIO = datetime(2030, 1, 7)
+DIAS = ['lunes', 'martes', 'miércoles', 'jueves', 'viernes', 'sábado', 'domingo']
+TURNOS_POR_DIA = 20
+
+
+def horario(i: int) -> datetime:
+    dia, turno = divmod(i, TURNOS_POR_DIA)
+    return INICIO + timedelta(days=dia, hours=8, minutes=30 * turno)
+
+
+def eventos(cantidad: int):
+    yield {"op": "medico", "nombre": "Dr. Médico", "matricula": "M0",
+           "especialidades": [{"tipo": "Clínica", "dias": DIAS, "duracion_minutos": 30}]}
+    yield {"op": "paciente", "nombre": "Paciente Prueba", "dni": "10000000", "fecha_nacimiento": "01/01/1980"}
+    for i in range(cantidad):
+        yield {"op": "turno", "dni": "10000000", "matricula": "M0", "especialidad": "Clínica",
+               "fecha_hora": horario(i).isoformat(), "duracion_minutos": 30}
+
+
+def consultas(cantidad: int, total: int) -> list[datetime]:
+    # La mitad cae sobre un turno (10 minutos después de su inicio), la otra mitad de noche, libre
+    return [horario(cantidad * k // total) + (timedelta(minutes=10) if k % 2 else timedelta(hours=12))
+            for k in range(total)]
+
+
+def superpuesto_recorriendo(turnos: list, inicio: int, fin: int) -> bool:
+    return any(t.obtener_instante() < fin and inicio < t.obtener_instante_fin() for t in turnos)
+
+
+def medir(cantidad: int, total: int):
+    clinica = Clinica()
+    clinica._cargar_eventos(eventos(cantidad))
+    gc.collect()
+    horarios = consultas(cantidad, total)
+
+    ocupados = 0
+    inicio = time.perf_counter()
+    for fecha_hora in horarios:
+        try:
+            clinica.validar_turno_no_duplicado("M0", fecha_hora, 30)
+        except TurnoOcupadoException:
+            ocupados += 1
+    tiempo_indice = time.perf_counter() - inicio
+
+    turnos = clinica.obtener_turnos()
+    muestra = horarios[:max(1, total // 100)]
+    inicio = time.perf_counter()
+    for fecha_hora in muestra:
+        instante = a_instante(fecha_hora)
+        superpuesto_recorriendo(turnos, instante, instante + 30 * MICROSEGUNDOS_POR_MINUTO)
+    tiempo_recorrido = time.perf_counter() - inicio
+
+    print(f"{cantidad:>9,} turnos del médico: {tiempo_indice / total * 1e6:5.2f} µs con la agenda "
+          f"({ocupados:,} de {total:,} ocupados), {tiempo_recorrido / len(muestra) * 1e6:9.1f} µs recorriendo")
+
+
+def main(total: int, *tamanos: int):
+    for cantidad in tamanos or (100, 10_000, 100_000, 1_000_000):
+        medir(cantidad, total)
+
+
+if __name__ == "__main__":
+    argumentos = [int(a) for a in sys.argv[1:]]
+    main(*(argumentos or [20_000]))
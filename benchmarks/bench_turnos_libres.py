@@ -0,0 +1,62 @@
+"""Tiempo de Clinica.buscar_turnos_libres con cientos de médicos y meses de turnos.
+
+Uso:
+    python -m benchmarks.bench_turnos_libres [médicos] [días con turnos]
+"""
+import sys
+import time
+from datetime import datetime, timedelta
+
+from src.clinica import Clinica
+from src.paciente import Paciente
+from src.medico import Medico
+from src.especialidad import Especialidad
+
+DIAS = ['lunes', 'martes', 'miércoles', 'jueves', 'viernes']
+INICIO = datetime(2030, 1, 7)  # lunes
+
+
+def crear_clinica(cantidad_medicos: int, dias_ocupados: int) -> Clinica:
+    clinica = Clinica()
+    clinica.agregar_paciente(Paciente("Juan Pérez", "12345678", "12/12/1990"))
+    for i in range(cantidad_medicos):
+        medico = Medico(f"Dr. Médico {i}", f"M{i}")
+        medico.agregar_especialidad(Especialidad("Cardiología", DIAS))
+        clinica.agregar_medico(medico)
+
+    # Agendas llenas salvo el último bloque de cada día
+    solicitudes = []
+    for dia in range(dias_ocupados):
+        fecha = INICIO + timedelta(days=dia)
+        if fecha.weekday() >= 5:
+            continue
+        for bloque in range(23):
+            fecha_hora = fecha + timedelta(hours=8, minutes=30 * bloque)
+            for i in range(cantidad_medicos):
+                solicitudes.append(("12345678", f"M{i}", "Cardiología", fecha_hora))
+    clinica.agendar_turnos_lote(solicitudes)
+    return clinica
+
+
+def medir(descripcion: str, funcion):
+    inicio = time.perf_counter()
+    cantidad = sum(1 for _ in funcion())
+    transcurrido = time.perf_counter() - inicio
+    print(f"{descripcion:<40} {cantidad:>8} horarios {transcurrido * 1000:>10.2f} ms")
+
+
+def main(cantidad_medicos: int, dias_ocupados: int):
+    clinica = crear_clinica(cantidad_medicos, dias_ocupados)
+    print(f"{cantidad_medicos} médicos, {len(clinica.obtener_turnos()):,} turnos agendados")
+    hasta = INICIO + timedelta(days=dias_ocupados + 30)
+    medir("primeros 10 libres", lambda: clinica.buscar_turnos_libres(
+        "Cardiología", INICIO, hasta, limite=10))
+    medir("primeros 10 tras el período ocupado", lambda: clinica.buscar_turnos_libres(
+        "Cardiología", INICIO + timedelta(days=dias_ocupados), hasta, limite=10))
+    medir("todos los libres del período", lambda: clinica.buscar_turnos_libres(
+        "Cardiología", INICIO, INICIO + timedelta(days=dias_ocupados)))
+
+
+if __name__ == "__main__":
+    argumentos = [int(a) for a in sys.argv[1:]]
+    main(*(argumentos + [300, 90][len(argumentos):]))
@@ -0,0 +1,178 @@
+from bisect import bisect_left, bisect_right
+
+
+class Agenda:
+    """Colección de elementos ordenados por una clave de fecha y hora (datetime o instante entero).
+
+    Los elementos se guardan en bloques ordenados de a lo sumo 2 * CARGA,
+    junto con la última clave de cada bloque. Ubicar una clave son dos
+    búsquedas binarias (el bloque y la posición dentro de él), así que las
+    consultas por rango y del próximo elemento cuestan O(log n) más el tamaño
+    del resultado, y agregar o quitar un elemento mueve sólo los punteros de
+    un bloque en lugar de los de toda la agenda.
+
+    Cada elemento puede llevar además un dato (por ejemplo un entero) que se
+    consulta por rango junto con las claves, sin tocar los elementos.
+    """
+
+    CARGA = 512
+
+    def __init__(self):
+        self.__claves = []      # bloques de claves, cada uno ordenado
+        self.__elementos = []   # bloques de elementos, en paralelo
+        self.__datos = []       # bloques de datos de cada elemento, en paralelo
+        self.__maximos = []     # última clave de cada bloque
+        self.__cantidad = 0
+
+    def agregar(self, clave, elemento, dato=None):
+        """Inserta un elemento manteniendo el orden (estable ante claves iguales)."""
+        if not self.__claves:
+            self.__claves.append([clave])
+            self.__elementos.append([elemento])
+            self.__datos.append([dato])
+            self.__maximos.append(clave)
+            self.__cantidad = 1
+            return
+        bloque = bisect_right(self.__maximos, clave)
+        if bloque == len(self.__maximos):
+            bloque -= 1
+        claves = self.__claves[bloque]
+        posicion = bisect_right(claves, clave)
+        claves.insert(posicion, clave)
+        self.__elementos[bloque].insert(posicion, elemento)
+        self.__datos[bloque].insert(posicion, dato)
+        self.__maximos[bloque] = claves[-1]
+        self.__cantidad += 1
+        if len(claves) > 2 * self.CARGA:
+            self._dividir(bloque)
+
+    def _dividir(self, bloque: int):
+        claves = self.__claves[bloque]
+        elementos = self.__elementos[bloque]
+        datos = self.__datos[bloque]
+        mitad = len(claves) // 2
+        self.__claves[bloque:bloque + 1] = [claves[:mitad], claves[mitad:]]
+        self.__elementos[bloque:bloque + 1] = [elementos[:mitad], elementos[mitad:]]
+        self.__datos[bloque:bloque + 1] = [datos[:mitad], datos[mitad:]]
+        self.__maximos[bloque:bloque + 1] = [claves[mitad - 1], claves[-1]]
+
+    def quitar(self, clave, elemento) -> bool:
+        """Quita un elemento buscándolo por su clave; devuelve False si no estaba.
+
+        La búsqueda es binaria y quitar mueve sólo los punteros de un bloque.
+        """
+        bloque, posicion = self._ubicar(clave)
+        while bloque < len(self.__claves) and self.__claves[bloque][posicion] == clave:
+            if self.__elementos[bloque][posicion] is elemento:
+                claves = self.__claves[bloque]
+                del claves[posicion]
+                del self.__elementos[bloque][posicion]
+                del self.__datos[bloque][posicion]
+                self.__cantidad -= 1
+                if claves:
+                    self.__maximos[bloque] = claves[-1]
+                else:
+                    del self.__claves[bloque]
+                    del self.__elementos[bloque]
+                    del self.__datos[bloque]
+                    del self.__maximos[bloque]
+                return True
+            bloque, posicion = self._siguiente(bloque, posicion)
+        return False
+
+    def _ubicar(self, clave, despues: bool = False) -> tuple[int, int]:
+        """Devuelve (bloque, posición) de la primera clave >= `clave` (> si `despues`).
+
+        Si no hay ninguna, devuelve (cantidad de bloques, 0).
+        """
+        buscar = bisect_right if despues else bisect_left
+        bloque = buscar(self.__maximos, clave)
+        if bloque == len(self.__maximos):
+            return bloque, 0
+        return bloque, buscar(self.__claves[bloque], clave)
+
+    def _siguiente(self, bloque: int, posicion: int) -> tuple[int, int]:
+        if posicion + 1 < len(self.__claves[bloque]):
+            return bloque, posicion + 1
+        return bloque + 1, 0
+
+    def _anterior(self, bloque: int, posicion: int) -> tuple[int, int] | None:
+        if posicion > 0:
+            return bloque, posicion - 1
+        if bloque > 0:
+            return bloque - 1, len(self.__claves[bloque - 1]) - 1
+        return None
+
+    def _elemento(self, ubicacion: tuple[int, int] | None):
+        if ubicacion is None or ubicacion[0] == len(self.__elementos):
+            return None
+        bloque, posicion = ubicacion
+        return self.__elementos[bloque][posicion]
+
+    def _tramo(self, bloques: list, desde: tuple[int, int], hasta: tuple[int, int] | None = None,
+               limite: int | None = None) -> list:
+        """Junta los valores de `bloques` desde una ubicación hasta otra (o hasta `limite` valores)."""
+        bloque, posicion = desde
+        resultado = []
+        while bloque < len(bloques) and (limite is None or len(resultado) < limite):
+            if hasta is not None and bloque == hasta[0]:
+                resultado.extend(bloques[bloque][posicion:hasta[1]])
+                break
+            resultado.extend(bloques[bloque][posicion:])
+            bloque, posicion = bloque + 1, 0
+        return resultado if limite is None else resultado[:limite]
+
+    def obtener_entre(self, desde, hasta) -> list:
+        """Devuelve los elementos con clave en el intervalo [desde, hasta)."""
+        return self._tramo(self.__elementos, self._ubicar(desde), self._ubicar(hasta))
+
+    def obtener_claves_entre(self, desde, hasta) -> list:
+        """Devuelve las claves en el intervalo [desde, hasta), sin tocar los elementos."""
+        return self._tramo(self.__claves, self._ubicar(desde), self._ubicar(hasta))
+
+    def obtener_datos_entre(self, desde, hasta) -> list:
+        """Devuelve los datos de los elementos con clave en [desde, hasta), en el orden de las claves."""
+        return self._tramo(self.__datos, self._ubicar(desde), self._ubicar(hasta))
+
+    def hay_entre(self, desde, hasta) -> bool:
+        """Indica si hay algún elemento con clave en el intervalo [desde, hasta)."""
+        bloque, posicion = self._ubicar(desde)
+        return bloque < len(self.__claves) and self.__claves[bloque][posicion] < hasta
+
+    def obtener_anterior(self, hasta):
+        """Devuelve el último elemento con clave menor que `hasta`, o None."""
+        return self._elemento(self._anterior(*self._ubicar(hasta)))
+
+    def obtener_vecinos(self, clave, saltear=None) -> tuple:
+        """Devuelve (anterior, siguiente) con una sola búsqueda binaria.
+
+        `anterior` es el último elemento con clave menor que `clave` y `siguiente`
+        el primero con clave mayor o igual (None si no hay). Si alguno de los dos
+        es `saltear`, se devuelve en su lugar el que le sigue en esa dirección.
+        """
+        ubicacion = self._ubicar(clave)
+        anterior = self._anterior(*ubicacion)
+        if saltear is not None and anterior is not None and self._elemento(anterior) is saltear:
+            anterior = self._anterior(*anterior)
+        siguiente = self._elemento(ubicacion)
+        if saltear is not None and siguiente is saltear:
+            siguiente = self._elemento(self._siguiente(*ubicacion))
+        return self._elemento(anterior), siguiente
+
+    def obtener_proximo(self, desde):
+        """Devuelve el primer elemento con clave mayor o igual a `desde`, o None."""
+        return self._elemento(self._ubicar(desde))
+
+    def obtener_primeros(self, limite: int) -> list:
+        """Devuelve hasta `limite` elementos desde el principio."""
+        return self._tramo(self.__elementos, (0, 0), limite=limite)
+
+    def obtener_siguientes(self, desde, limite: int, incluir_desde: bool = True) -> list:
+        """Devuelve hasta `limite` elementos con clave >= desde (o > desde), en orden."""
+        return self._tramo(self.__elementos, self._ubicar(desde, despues=not incluir_desde), limite=limite)
+
+    def obtener_elementos(self) -> list:
+        return [elemento for bloque in self.__elementos for elemento in bloque]
+
+    def __len__(self) -> int:
+        return self.__cantidad
@@ -0,0 +1,143 @@
+from array import array
+from bisect import bisect_left, bisect_right
+from datetime import datetime, timedelta
+
+from .especialidad import Especialidad
+from .turno import Turno
+from .excepciones import DatosInvalidosException
+from .reloj import EPOCA, MICROSEGUNDOS_POR_MINUTO
+
+_MINUTO = timedelta(minutes=1)
+
+
+class AlmacenTurnos:
+    """Turnos guardados en columnas de arrays tipados en lugar de un objeto por turno.
+
+    Cada turno ocupa 15 bytes en las columnas: id de paciente, id de médico,
+    id de especialidad, si está cancelado y minutos desde 1970; y 4 más en el
+    índice por médico, que guarda las posiciones de sus turnos ordenadas por
+    horario. Pacientes, médicos y especialidades se guardan una sola vez en
+    tablas de ids; el id de especialidad identifica el par nombre y duración
+    del turno. Los objetos Turno se arman recién al accederlos (indexando o
+    iterando) y no se conservan.
+
+    Sólo acepta horarios en minutos exactos. No es seguro para usar desde
+    varios hilos sin un bloqueo externo.
+    """
+
+    def __init__(self):
+        self.__pacientes = []        # id -> Paciente
+        self.__medicos = []          # id -> Medico
+        self.__especialidades = []   # id -> (nombre, duración en minutos)
+        self.__id_paciente = {}      # dni -> id
+        self.__id_medico = {}        # matrícula -> id
+        self.__id_especialidad = {}  # (nombre, duración) -> id
+        self.__columna_paciente = array("I")
+        self.__columna_medico = array("I")
+        self.__columna_especialidad = array("H")
+        self.__columna_cancelado = array("b")
+        self.__columna_minutos = array("i")
+        self.__por_medico = []       # id de médico -> array de posiciones ordenadas por minutos
+
+    @classmethod
+    def desde_turnos(cls, turnos) -> "AlmacenTurnos":
+        almacen = cls()
+        for turno in turnos:
+            almacen.agregar_turno(turno)
+        return almacen
+
+    def agregar(self, paciente, medico, especialidad: str, fecha_hora: datetime,
+                duracion_minutos: int = Especialidad.DURACION_PREDETERMINADA, cancelado: bool = False) -> int:
+        """Agrega un turno y devuelve su posición."""
+        if not isinstance(fecha_hora, datetime):
+            raise DatosInvalidosException("La fecha_hora debe ser un objeto datetime")
+        minutos, resto = divmod(fecha_hora - EPOCA, _MINUTO)
+        if resto:
+            raise DatosInvalidosException("El almacén sólo guarda horarios en minutos exactos")
+
+        id_paciente = self._id(paciente.obtener_dni(), paciente, self.__id_paciente, self.__pacientes)
+        id_medico = self._id(medico.obtener_matricula(), medico, self.__id_medico, self.__medicos)
+        clave = (especialidad, duracion_minutos)
+        id_especialidad = self._id(clave, clave, self.__id_especialidad, self.__especialidades)
+        if id_medico == len(self.__por_medico):
+            self.__por_medico.append(array("I"))
+
+        posicion = len(self.__columna_minutos)
+        self.__columna_paciente.append(id_paciente)
+        self.__columna_medico.append(id_medico)
+        self.__columna_especialidad.append(id_especialidad)
+        self.__columna_cancelado.append(bool(cancelado))
+        self.__columna_minutos.append(minutos)
+
+        indice = self.__por_medico[id_medico]
+        if indice and self.__columna_minutos[indice[-1]] > minutos:
+            # Fuera de orden: a igual horario queda después de los anteriores
+            indice.insert(bisect_right(indice, minutos, key=self.__columna_minutos.__getitem__), posicion)
+        else:
+            indice.append(posicion)
+        return posicion
+
+    def agregar_turno(self, turno: Turno) -> int:
+        return self.agregar(turno.obtener_paciente(), turno.obtener_medico(), turno.obtener_especialidad(),
+                            turno.obtener_fecha_hora(), turno.obtener_duracion_minutos(), turno.esta_cancelado())
+
+    def _id(self, clave, valor, ids: dict, tabla: list) -> int:
+        identificador = ids.get(clave)
+        if identificador is None:
+            identificador = ids[clave] = len(tabla)
+            tabla.append(valor)
+        return identificador
+
+    @staticmethod
+    def _armar(paciente, medico, minutos: int, especialidad: tuple, cancelado: int) -> Turno:
+        nombre, duracion_minutos = especialidad
+        turno = Turno.desde_registro(paciente, medico, minutos * MICROSEGUNDOS_POR_MINUTO, nombre, duracion_minutos)
+        if cancelado:
+            turno.cancelar()
+        return turno
+
+    def __len__(self) -> int:
+        return len(self.__columna_minutos)
+
+    def __getitem__(self, indice: int) -> Turno:
+        """Arma el Turno de la posición indicada (admite índices negativos)."""
+        return self._armar(
+            self.__pacientes[self.__columna_paciente[indice]],
+            self.__medicos[self.__columna_medico[indice]],
+            self.__columna_minutos[indice],
+            self.__especialidades[self.__columna_especialidad[indice]],
+            self.__columna_cancelado[indice],
+        )
+
+    def __iter__(self):
+        pacientes, medicos, especialidades = self.__pacientes, self.__medicos, self.__especialidades
+        for paciente, medico, especialidad, cancelado, minutos in zip(
+                self.__columna_paciente, self.__columna_medico, self.__columna_especialidad,
+                self.__columna_cancelado, self.__columna_minutos):
+            yield self._armar(pacientes[paciente], medicos[medico], minutos, especialidades[especialidad], cancelado)
+
+    def obtener_minutos(self, indice: int) -> int:
+        """Devuelve el horario del turno en minutos desde 1970, sin armar el Turno."""
+        return self.__columna_minutos[indice]
+
+    def indices_medico_entre(self, matricula: str, desde: datetime, hasta: datetime) -> list[int]:
+        """Devuelve las posiciones de los turnos del médico con horario en [desde, hasta), ordenadas por horario.
+
+        Busca en el índice del médico con búsqueda binaria, en O(log n) más el
+        tamaño del resultado; los Turno se arman después con almacen[indice]
+        si hacen falta.
+        """
+        medico = self.__id_medico.get(matricula)
+        if medico is None:
+            return []
+        inicio = -((EPOCA - desde) // _MINUTO)  # redondeo hacia arriba
+        fin = -((EPOCA - hasta) // _MINUTO)
+        indice, minutos = self.__por_medico[medico], self.__columna_minutos.__getitem__
+        return indice[bisect_left(indice, inicio, key=minutos):bisect_left(indice, fin, key=minutos)].tolist()
+
+    def obtener_bytes_por_turno(self) -> int:
+        """Bytes de las columnas y del índice por médico por turno (sin contar las tablas de ids)."""
+        return sum(columna.itemsize for columna in (
+            self.__columna_paciente, self.__columna_medico, self.__columna_especialidad,
+            self.__columna_cancelado, self.__columna_minutos,
+        )) + array("I").itemsize
@@ -0,0 +1,97 @@
+import asyncio
+from concurrent.futures import Executor
+from datetime import datetime
+from functools import partial
+
+from .clinica import Clinica
+from .excepciones import DatosInvalidosException
+from .historiaclinica import HistoriaClinica
+from .turno import Turno
+
+
+class AsyncClinica:
+    """Fachada asyncio sobre Clinica.
+
+    Las solicitudes de turno concurrentes para un mismo médico se agrupan y se
+    agendan en un único lote (agendar_turnos_lote) dentro del ejecutor, de modo
+    que el bucle de eventos nunca se bloquea. Mientras un lote de un médico está
+    en curso, las nuevas solicitudes de ese médico se acumulan para el siguiente.
+    """
+
+    def __init__(self, clinica: Clinica | None = None, ejecutor: Executor | None = None):
+        """Si se pasa una clínica propia, debe haberse creado con concurrente=True."""
+        if clinica is None:
+            clinica = Clinica(concurrente=True)
+        elif not clinica.es_concurrente():
+            # El ejecutor la usa desde varios hilos a la vez
+            raise DatosInvalidosException("AsyncClinica necesita una Clinica creada con concurrente=True")
+        self.__clinica = clinica
+        self.__ejecutor = ejecutor
+        self.__pendientes = {}  # matricula -> [(solicitud, futuro)]
+        self.__en_curso = set()  # matrículas con un lote programado o ejecutándose
+
+    def obtener_clinica(self) -> Clinica:
+        return self.__clinica
+
+    async def agendar_turno(self, dni: str, matricula: str, especialidad: str, fecha_hora: datetime) -> Turno:
+        """Agenda un turno y devuelve el Turno creado, o lanza la excepción de Clinica."""
+        loop = asyncio.get_running_loop()
+        futuro = loop.create_future()
+        self.__pendientes.setdefault(matricula, []).append(((dni, matricula, especialidad, fecha_hora), futuro))
+        self._programar_lote(loop, matricula)
+        return await futuro
+
+    async def emitir_receta(self, dni: str, matricula: str, medicamentos: list[str]):
+        await self.ejecutar_en_segundo_plano(self.__clinica.emitir_receta, dni, matricula, medicamentos)
+
+    async def obtener_historia_clinica(self, dni: str) -> HistoriaClinica:
+        # Es una búsqueda en un diccionario: no vale la pena pasar por el ejecutor
+        return self.__clinica.obtener_historia_clinica(dni)
+
+    async def ejecutar_en_segundo_plano(self, funcion, *args, **kwargs):
+        """Ejecuta trabajo lento (persistencia, generación de reportes) en el ejecutor."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.__ejecutor, partial(funcion, *args, **kwargs))
+
+    def _programar_lote(self, loop: asyncio.AbstractEventLoop, matricula: str):
+        """Programa el despacho del lote de un médico si no hay otro en curso."""
+        if matricula in self.__en_curso:
+            return
+        self.__en_curso.add(matricula)
+        # call_soon deja que se acumulen las solicitudes de esta misma vuelta del bucle
+        loop.call_soon(self._despachar_lote, loop, matricula)
+
+    def _despachar_lote(self, loop: asyncio.AbstractEventLoop, matricula: str):
+        pendientes = self.__pendientes.pop(matricula, [])
+        pendientes = [(solicitud, futuro) for solicitud, futuro in pendientes if not futuro.cancelled()]
+        if not pendientes:
+            self.__en_curso.discard(matricula)
+            return
+
+        solicitudes = [solicitud for solicitud, _ in pendientes]
+        tarea = loop.run_in_executor(
+            self.__ejecutor,
+            partial(self.__clinica.agendar_turnos_lote, solicitudes, todo_o_nada=False),
+        )
+        tarea.add_done_callback(partial(self._resolver_lote, loop, matricula, pendientes))
+
+    def _resolver_lote(self, loop: asyncio.AbstractEventLoop, matricula: str, pendientes: list, tarea):
+        error = asyncio.CancelledError() if tarea.cancelled() else tarea.exception()
+        if error is None:
+            resultado = tarea.result()
+            turnos = resultado.obtener_turnos()
+            errores = resultado.obtener_errores()
+
+        for indice, (_, futuro) in enumerate(pendientes):
+            if futuro.done():
+                continue
+            if error is not None:
+                futuro.set_exception(error)
+            elif indice in errores:
+                futuro.set_exception(errores[indice])
+            else:
+                futuro.set_result(turnos[indice])
+
+        self.__en_curso.discard(matricula)
+        if self.__pendientes.get(matricula):
+            self._programar_lote(loop, matricula)
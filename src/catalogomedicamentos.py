@@ -0,0 +1,60 @@
+import threading
+
+
+class CatalogoMedicamentos:
+    """Catálogo de medicamentos: asigna a cada nombre un id entero compacto.
+
+    Los nombres se normalizan (espacios repetidos colapsados, sin distinguir
+    mayúsculas) antes de buscarlos, así "Ibuprofeno  400mg" e "ibuprofeno 400mg"
+    son el mismo medicamento. Sólo se guarda la clave normalizada y una forma
+    de escribir el nombre (la primera que se registró), así que el catálogo
+    crece con los medicamentos distintos y no con sus variantes de escritura.
+    Cada clínica tiene el suyo.
+    """
+
+    def __init__(self):
+        self.__nombres = []  # id -> nombre tal como se registró la primera vez
+        self.__ids = {}      # clave normalizada -> id
+        self.__bloqueo = threading.Lock()
+
+    @staticmethod
+    def normalizar(nombre: str) -> str:
+        """Devuelve la clave de búsqueda de un nombre de medicamento."""
+        return " ".join(nombre.split()).casefold()
+
+    def obtener_id(self, nombre: str) -> int:
+        """Devuelve el id del medicamento, registrándolo si es nuevo."""
+        clave = self.normalizar(nombre)
+        identificador = self.__ids.get(clave)
+        if identificador is not None:
+            return identificador
+        with self.__bloqueo:
+            identificador = self.__ids.get(clave)
+            if identificador is None:
+                identificador = len(self.__nombres)
+                self.__nombres.append(" ".join(nombre.split()))
+                self.__ids[clave] = identificador
+            return identificador
+
+    def buscar_id(self, nombre: str) -> int | None:
+        """Devuelve el id del medicamento sin registrarlo, o None si no está en el catálogo."""
+        return self.__ids.get(self.normalizar(nombre))
+
+    def obtener_nombre(self, identificador: int) -> str:
+        return self.__nombres[identificador]
+
+    def internar(self, nombre: str) -> str:
+        """Devuelve el nombre sin espacios de más, registrándolo si es nuevo.
+
+        Si se escribe igual que en el catálogo devuelve el texto del catálogo,
+        así las recetas con el mismo medicamento comparten un único texto; si
+        no, devuelve su propia escritura.
+        """
+        if not nombre or not nombre.strip():
+            return nombre
+        limpio = " ".join(nombre.split())
+        guardado = self.__nombres[self.obtener_id(limpio)]
+        return guardado if guardado == limpio else limpio
+
+    def __len__(self) -> int:
+        return len(self.__nombres)
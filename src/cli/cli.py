@@ -1,4 +1,4 @@
-from datetime import datetime
+from datetime import date, datetime, timedelta
 import sys
 import src 
 import os
@@ -11,23 +11,40 @@ from src.clinica import Clinica
 from src.paciente import Paciente
 from src.medico import Medico
 from src.especialidad import Especialidad
+from src.importador import Importador
+from src.exportador import Exportador
+from src.reportes import ReporteOcupacion
 from src.excepciones import (
     PacienteNoEncontradoException,
     MedicoNoEncontradoException,
     MedicoNoDisponibleException,
     TurnoOcupadoException,
+    TurnoNoEncontradoException,
     RecetaInvalidaException,
     PacienteDuplicadoException,
     MedicoDuplicadoException,
     EspecialidadDuplicadaException,
-    DatosInvalidosException
+    DatosInvalidosException,
+    DependenciaNoDisponibleException
 )
 
 
+# Directorio con el snapshot y el journal para recuperar los datos al reiniciar
+DIRECTORIO_DATOS = os.environ.get("CLINICA_DATOS", "clinica_datos")
+EVENTOS_POR_SNAPSHOT = 1000
+# Elementos por página en los listados
+TAMANO_PAGINA = 20
+# Días que abarca el reporte de ocupación
+DIAS_REPORTE = 91
+
+
 class CLI:
     
-    def __init__(self):
-        self.clinica = Clinica()
+    def __init__(self, directorio_datos: str | None = DIRECTORIO_DATOS):
+        if directorio_datos:
+            self.clinica = Clinica.desde_directorio(directorio_datos, eventos_por_snapshot=EVENTOS_POR_SNAPSHOT)
+        else:
+            self.clinica = Clinica()
 
     def mostrar_menu(self):
         """Muestra el menú principal."""
@@ -43,6 +60,12 @@ class CLI:
         print("7) Ver todos los turnos")
         print("8) Ver todos los pacientes")
         print("9) Ver todos los médicos")
+        print("10) Importar pacientes o médicos desde archivo")
+        print("11) Exportar historias clínicas")
+        print("12) Agendar serie semanal de turnos")
+        print("13) Cancelar turno")
+        print("14) Reprogramar turno")
+        print("15) Reporte de ocupación del próximo trimestre")
         print("0) Salir")
         print("="*50)
 
@@ -76,6 +99,18 @@ class CLI:
                     self.ver_pacientes()
                 elif opcion == "9":
                     self.ver_medicos()
+                elif opcion == "10":
+                    self.importar_archivo()
+                elif opcion == "11":
+                    self.exportar_historias()
+                elif opcion == "12":
+                    self.agendar_serie()
+                elif opcion == "13":
+                    self.cancelar_turno()
+                elif opcion == "14":
+                    self.reprogramar_turno()
+                elif opcion == "15":
+                    self.reporte_ocupacion()
                 else:
                     print("ERROR: Opción inválida. Por favor, seleccione una opción válida.")
                     
@@ -84,6 +119,8 @@ class CLI:
                 break
             except Exception as e:
                 print(f"ERROR: Error inesperado: {e}")
+        
+        self.clinica.cerrar()
 
     def agregar_paciente(self):
         """Solicita datos y agrega un paciente."""
@@ -167,7 +204,7 @@ class CLI:
                     break
                 
                 dias = [dia.strip() for dia in dias_str.split(',')]
-                especialidad = Especialidad(tipo, dias)
+                especialidad = Especialidad(tipo, dias, self._pedir_duracion())
                 medico.agregar_especialidad(especialidad)
                 
                 print(f"OK: Especialidad {tipo} agregada.")
@@ -181,6 +218,14 @@ class CLI:
             except Exception as e:
                 print(f"ERROR: Error al agregar especialidad: {e}")
 
+    def _pedir_duracion(self) -> int:
+        duracion_str = input(f"Duración de cada turno en minutos (Enter para {Especialidad.DURACION_PREDETERMINADA}): ").strip()
+        if not duracion_str:
+            return Especialidad.DURACION_PREDETERMINADA
+        if not duracion_str.isdigit():
+            raise DatosInvalidosException("La duración debe ser un número entero de minutos")
+        return int(duracion_str)
+
     def agregar_especialidad(self):
         """Agrega una especialidad a un médico existente."""
         print("\nAGREGAR ESPECIALIDAD A MEDICO")
@@ -218,7 +263,7 @@ class CLI:
                 return
             
             dias = [dia.strip() for dia in dias_str.split(',')]
-            especialidad = Especialidad(tipo, dias)
+            especialidad = Especialidad(tipo, dias, self._pedir_duracion())
             medico.agregar_especialidad(especialidad)
             
             print(f"OK: Especialidad {tipo} agregada al Dr. {medico.obtener_nombre()}.")
@@ -298,6 +343,114 @@ class CLI:
         except Exception as e:
             print(f"ERROR: Error al agendar turno: {e}")
 
+    def agendar_serie(self):
+        """Agenda el mismo horario semana a semana."""
+        print("\nAGENDAR SERIE SEMANAL DE TURNOS")
+        print("-" * 35)
+        
+        try:
+            dni = input("DNI del paciente: ").strip()
+            matricula = input("Matrícula del médico: ").strip()
+            especialidad = input("Especialidad: ").strip()
+            if not dni or not matricula or not especialidad:
+                print("ERROR: DNI, matrícula y especialidad son obligatorios.")
+                return
+            
+            fecha_str = input("Fecha del primer turno (dd/mm/aaaa): ").strip()
+            hora_str = input("Hora (HH:MM): ").strip()
+            inicio = datetime.strptime(f"{fecha_str} {hora_str}", "%d/%m/%Y %H:%M")
+            semanas = int(input("Cantidad de semanas: ").strip())
+            
+            fechas = self.clinica.expandir_serie(inicio, cantidad=semanas)
+            resultado = self.clinica.agendar_serie(dni, matricula, especialidad, inicio, cantidad=semanas)
+            if resultado.es_exitoso():
+                print(f"OK: Se agendaron {len(fechas)} turnos.")
+                return
+            
+            print("ERROR: No se agendó la serie. Turnos con problemas:")
+            for indice, error in sorted(resultado.obtener_errores().items()):
+                print(f"- {fechas[indice].strftime('%d/%m/%Y %H:%M')}: {error}")
+            
+        except DatosInvalidosException as e:
+            print(f"ERROR: {e}")
+        except ValueError as e:
+            print(f"ERROR: Formato de fecha, hora o cantidad inválido: {e}")
+        except Exception as e:
+            print(f"ERROR: Error al agendar la serie: {e}")
+
+    def _pedir_fecha_hora(self, mensaje: str) -> datetime:
+        fecha_str = input(f"Fecha {mensaje}(dd/mm/aaaa): ").strip()
+        hora_str = input("Hora (HH:MM): ").strip()
+        return datetime.strptime(f"{fecha_str} {hora_str}", "%d/%m/%Y %H:%M")
+
+    def cancelar_turno(self):
+        """Cancela un turno y libera el horario."""
+        print("\nCANCELAR TURNO")
+        print("-" * 25)
+        
+        try:
+            matricula = input("Matrícula del médico: ").strip()
+            fecha_hora = self._pedir_fecha_hora("del turno ")
+            turno = self.clinica.cancelar_turno(matricula, fecha_hora)
+            print(f"OK: Turno cancelado: {turno}")
+            
+        except (MedicoNoEncontradoException, TurnoNoEncontradoException, DatosInvalidosException) as e:
+            print(f"ERROR: {e}")
+        except ValueError as e:
+            print(f"ERROR: Formato de fecha u hora inválido: {e}")
+        except Exception as e:
+            print(f"ERROR: Error al cancelar turno: {e}")
+
+    def reprogramar_turno(self):
+        """Mueve un turno a otro horario y, opcionalmente, a otro médico."""
+        print("\nREPROGRAMAR TURNO")
+        print("-" * 25)
+        
+        try:
+            matricula = input("Matrícula del médico: ").strip()
+            fecha_hora = self._pedir_fecha_hora("del turno actual ")
+            nueva_fecha_hora = self._pedir_fecha_hora("nueva ")
+            nueva_matricula = input("Matrícula del nuevo médico (Enter para el mismo): ").strip() or None
+            turno = self.clinica.reprogramar_turno(matricula, fecha_hora, nueva_fecha_hora, nueva_matricula)
+            print(f"OK: Turno reprogramado: {turno}")
+            
+        except (MedicoNoEncontradoException, MedicoNoDisponibleException, TurnoOcupadoException,
+                TurnoNoEncontradoException, DatosInvalidosException) as e:
+            print(f"ERROR: {e}")
+        except ValueError as e:
+            print(f"ERROR: Formato de fecha u hora inválido: {e}")
+        except Exception as e:
+            print(f"ERROR: Error al reprogramar turno: {e}")
+
+    def reporte_ocupacion(self):
+        """Muestra la utilización de los próximos DIAS_REPORTE días por médico y por franja horaria."""
+        print("\nREPORTE DE OCUPACIÓN")
+        print("-" * 25)
+        
+        try:
+            desde = date.today()
+            reporte = ReporteOcupacion(self.clinica, desde, desde + timedelta(days=DIAS_REPORTE))
+            if not reporte.obtener_matriculas():
+                print("No hay médicos registrados.")
+                return
+            print(f"Del {desde.strftime('%d/%m/%Y')} al {reporte.obtener_dias()[-1].strftime('%d/%m/%Y')}: "
+                  f"{self._porcentaje(reporte.utilizacion())} de la capacidad ocupada")
+            print("\nPor médico:")
+            for matricula, valor in zip(reporte.obtener_matriculas(), reporte.utilizacion_por_medico()):
+                print(f"  {matricula}: {self._porcentaje(valor)}")
+            print("\nHoras pico:")
+            for hora, valor in reporte.horas_pico():
+                print(f"  {hora.strftime('%H:%M')}: {self._porcentaje(valor)}")
+            
+        except DependenciaNoDisponibleException as e:
+            print(f"ERROR: {e}")
+        except Exception as e:
+            print(f"ERROR: Error al generar el reporte: {e}")
+
+    @staticmethod
+    def _porcentaje(valor: float) -> str:
+        return "sin atención" if valor != valor else f"{valor:.1%}"
+
     def emitir_receta(self):
         """Emite una receta médica."""
         print("\nEMITIR RECETA")
@@ -390,13 +543,7 @@ class CLI:
         print("-" * 30)
         
         try:
-            turnos = self.clinica.obtener_turnos()
-            if not turnos:
-                print("No hay turnos agendados.")
-                return
-            
-            for i, turno in enumerate(turnos, 1):
-                print(f"{i}) {turno}")
+            self._mostrar_paginas(self.clinica.obtener_pagina_turnos, None, "No hay turnos agendados.")
         except Exception as e:
             print(f"ERROR: Error al obtener turnos: {e}")
 
@@ -406,13 +553,7 @@ class CLI:
         print("-" * 35)
         
         try:
-            pacientes = self.clinica.obtener_pacientes()
-            if not pacientes:
-                print("No hay pacientes registrados.")
-                return
-            
-            for i, paciente in enumerate(pacientes, 1):
-                print(f"{i}) {paciente}")
+            self._mostrar_paginas(self.clinica.obtener_pagina_pacientes, 0, "No hay pacientes registrados.")
         except Exception as e:
             print(f"ERROR: Error al obtener pacientes: {e}")
 
@@ -422,15 +563,77 @@ class CLI:
         print("-" * 35)
         
         try:
-            medicos = self.clinica.obtener_medicos()
-            if not medicos:
-                print("No hay médicos registrados.")
+            self._mostrar_paginas(self.clinica.obtener_pagina_medicos, 0, "No hay médicos registrados.")
+        except Exception as e:
+            print(f"ERROR: Error al obtener médicos: {e}")
+
+    def _mostrar_paginas(self, obtener_pagina, cursor, mensaje_vacio: str):
+        """Muestra un listado de a TAMANO_PAGINA elementos, pidiendo confirmación entre páginas."""
+        numero = 0
+        while True:
+            pagina = obtener_pagina(cursor, TAMANO_PAGINA)
+            if numero == 0 and not len(pagina):
+                print(mensaje_vacio)
                 return
             
-            for i, medico in enumerate(medicos, 1):
-                print(f"{i}) {medico}")
+            for elemento in pagina:
+                numero += 1
+                print(f"{numero}) {elemento}")
+            
+            if not pagina.hay_siguiente():
+                return
+            if input("Enter para ver más, 'q' para volver: ").strip().lower() == "q":
+                return
+            cursor = pagina.obtener_siguiente()
+
+    def importar_archivo(self):
+        """Importa pacientes o médicos desde un archivo CSV o JSONL."""
+        print("\nIMPORTAR DESDE ARCHIVO")
+        print("-" * 35)
+        
+        try:
+            tipo = input("¿Importar pacientes o médicos? (p/m): ").strip().lower()
+            if tipo not in ("p", "m"):
+                print("ERROR: Opción inválida.")
+                return
+            
+            ruta = input("Ruta del archivo (.csv o .jsonl): ").strip()
+            if not ruta:
+                print("ERROR: La ruta no puede estar vacía.")
+                return
+            
+            importador = Importador(self.clinica)
+            if tipo == "p":
+                reporte = importador.importar_pacientes(ruta)
+            else:
+                reporte = importador.importar_medicos(ruta)
+            
+            print(f"OK: {reporte}")
+            
+        except (DatosInvalidosException, OSError) as e:
+            print(f"ERROR: {e}")
         except Exception as e:
-            print(f"ERROR: Error al obtener médicos: {e}")
+            print(f"ERROR: Error al importar: {e}")
+
+    def exportar_historias(self):
+        """Exporta las historias clínicas de todos los pacientes a un archivo JSONL o CSV."""
+        print("\nEXPORTAR HISTORIAS CLINICAS")
+        print("-" * 35)
+        
+        try:
+            ruta = input("Ruta del archivo (.jsonl o .csv): ").strip()
+            if not ruta:
+                print("ERROR: La ruta no puede estar vacía.")
+                return
+            
+            formato = "csv" if ruta.lower().endswith(".csv") else "jsonl"
+            cantidad = Exportador(self.clinica).exportar(ruta, formato)
+            print(f"OK: {cantidad} registros exportados a {ruta}.")
+            
+        except (DatosInvalidosException, OSError) as e:
+            print(f"ERROR: {e}")
+        except Exception as e:
+            print(f"ERROR: Error al exportar: {e}")
 
 
 def main():
@@ -1,25 +1,156 @@
-from datetime import datetime
+import heapq
+import threading
+from array import array
+from contextlib import ExitStack, nullcontext
+from datetime import datetime, time, timedelta
+from itertools import islice
 from .paciente import Paciente
 from .medico import Medico
+from .especialidad import Especialidad
 from .turno import Turno
 from .receta import Receta
+from .catalogomedicamentos import CatalogoMedicamentos
 from .historiaclinica import HistoriaClinica
+from .agenda import Agenda
+from .resultadolote import ResultadoLote
+from .pagina import Pagina
+from .journal import Journal
+from .persistencia import Persistencia
+from .repositorio import Repositorio
+from .reloj import RELOJ_SISTEMA, Reloj, MICROSEGUNDO, MICROSEGUNDOS_POR_MINUTO, a_instante, desde_instante
 from .excepciones import (
     PacienteNoEncontradoException,
     MedicoNoEncontradoException,
     MedicoNoDisponibleException,
     TurnoOcupadoException,
+    TurnoNoEncontradoException,
     PacienteDuplicadoException,
     MedicoDuplicadoException,
     DatosInvalidosException
 )
 
+
 class Clinica:
-    def __init__(self):
+    HORA_INICIO_ATENCION = time(8, 0)
+    HORA_FIN_ATENCION = time(20, 0)
+    CANTIDAD_BLOQUEOS_PACIENTES = 64
+    MAXIMO_TURNOS_SERIE = 1000
+
+    def __init__(self, concurrente: bool = False, journal: Journal | Persistencia | None = None,
+                 repositorio: Repositorio | None = None, reloj: Reloj | None = None):
+        """Con concurrente=True la clínica puede usarse desde varios hilos.
+        
+        Los turnos de un mismo médico se serializan con un bloqueo por matrícula,
+        de modo que turnos de médicos distintos se agendan en paralelo. Las
+        historias clínicas se protegen con un conjunto fijo de bloqueos repartidos
+        por DNI y las altas de pacientes y médicos con un bloqueo de registro.
+        
+        Si se pasa un journal (o una Persistencia), cada operación que modifica
+        la clínica se registra en él antes de aplicarse.
+        
+        Si se pasa un repositorio (por ejemplo RepositorioSQLite), la clínica se
+        carga con sus datos y cada cambio se guarda en él antes de aplicarse. Por
+        defecto los datos viven sólo en memoria.
+        
+        El reloj da la hora actual para validar turnos y fechar recetas (por
+        defecto, la del sistema); los lotes usan una misma hora para todas sus filas.
+        """
+        self.__concurrente = concurrente
+        self.__journal = journal
+        self.__reloj = reloj if reloj is not None else RELOJ_SISTEMA
+        self.__sin_bloqueo = nullcontext()
+        self.__bloqueo_registro = threading.RLock() if concurrente else self.__sin_bloqueo
+        self.__bloqueos_medicos = {}
+        self.__bloqueos_pacientes = [threading.Lock() for _ in range(self.CANTIDAD_BLOQUEOS_PACIENTES)]
+        self.__bloqueo_recetas = threading.Lock() if concurrente else self.__sin_bloqueo
         self.__pacientes = {}  
         self.__medicos = {}    
+        # Listas sólo de agregado en orden de alta: las posiciones sirven de cursor estable
+        self.__orden_pacientes = []
+        self.__orden_medicos = []
         self.__turnos = []
+        self.__turnos_por_horario = {}  # (matricula, instante) -> Turno
+        self.__agendas = {}  # matricula -> Agenda ordenada por instante
+        self.__medicos_por_especialidad = {}  # especialidad -> día (0-6) -> {matricula: None}
         self.__historias_clinicas = {} 
+        self.__catalogo = CatalogoMedicamentos()
+        self.__recetas_por_medicamento = {}  # id en el catálogo -> [Receta] en orden de emisión
+        
+        self.__repositorio = Repositorio()
+        if repositorio is not None:
+            self._cargar_eventos(repositorio.leer_eventos())
+            self.__repositorio = repositorio
+
+    @classmethod
+    def desde_journal(cls, ruta: str, concurrente: bool = False,
+                      eventos_por_sincronizacion: int = 100) -> "Clinica":
+        """Reconstruye una clínica reproduciendo un journal y sigue registrando en él."""
+        clinica = cls(concurrente=concurrente)
+        clinica.reproducir_journal(ruta)
+        clinica.__journal = Journal(ruta, eventos_por_sincronizacion)
+        return clinica
+
+    @classmethod
+    def desde_directorio(cls, directorio: str, concurrente: bool = False,
+                         eventos_por_sincronizacion: int = 100,
+                         eventos_por_snapshot: int | None = None) -> "Clinica":
+        """Reconstruye una clínica desde el último snapshot más la cola del journal.
+        
+        Con eventos_por_snapshot se toma un snapshot automáticamente cada esa
+        cantidad de eventos registrados.
+        """
+        persistencia = Persistencia(directorio, eventos_por_sincronizacion, eventos_por_snapshot)
+        clinica = cls(concurrente=concurrente)
+        
+        snapshot = persistencia.cargar_ultimo_snapshot()
+        desde = 0
+        if snapshot is not None:
+            desde, estado = snapshot
+            clinica._importar_estado(estado)
+        clinica._cargar_eventos(persistencia.leer_eventos_desde(desde))
+        
+        persistencia.abrir()
+        clinica.__journal = persistencia
+        return clinica
+
+    def tomar_snapshot(self):
+        """Guarda un snapshot del estado actual y elimina el journal que cubre."""
+        if not isinstance(self.__journal, Persistencia):
+            raise DatosInvalidosException("La clínica no se abrió con desde_directorio")
+        
+        with self._bloquear_todo():
+            numero = self.__journal.rotar()
+            estado = self._exportar_estado()
+        self.__journal.guardar_snapshot(numero, estado)
+
+    def _snapshot_si_corresponde(self):
+        # reservar_snapshot consulta y reinicia el contador de una vez: un solo hilo lo toma
+        if isinstance(self.__journal, Persistencia) and self.__journal.reservar_snapshot():
+            self.tomar_snapshot()
+
+    def reproducir_journal(self, ruta: str) -> int:
+        """Aplica en orden los eventos de un journal y devuelve cuántos se aplicaron.
+        
+        Los eventos ya fueron validados al registrarse, por lo que se aplican sin
+        volver a pasar por las validaciones de Clinica ni por el journal.
+        """
+        if self.__journal is not None:
+            raise DatosInvalidosException("No se puede reproducir un journal en una clínica que registra en uno")
+        return self._cargar_eventos(Journal.leer(ruta))
+
+    def _cargar_eventos(self, eventos) -> int:
+        """Aplica eventos ya validados sin registrarlos y devuelve cuántos se aplicaron."""
+        cantidad = 0
+        for evento in eventos:
+            self._aplicar_evento(evento)
+            cantidad += 1
+        return cantidad
+
+    def cerrar(self):
+        """Sincroniza y cierra el journal y el repositorio."""
+        if self.__journal is not None:
+            self.__journal.cerrar()
+        self.__repositorio.cerrar()
 
     def agregar_paciente(self, paciente: Paciente):
         """Registra un paciente y crea su historia clínica."""
@@ -27,11 +158,43 @@ class Clinica:
             raise DatosInvalidosException("El parámetro debe ser una instancia de Paciente")
         
         dni = paciente.obtener_dni()
-        if dni in self.__pacientes:
-            raise PacienteDuplicadoException(f"Ya existe un paciente con DNI {dni}")
+        with self.__bloqueo_registro:
+            if dni in self.__pacientes:
+                raise PacienteDuplicadoException(f"Ya existe un paciente con DNI {dni}")
+            
+            self._registrar_evento(self._evento_paciente(paciente))
+            self._alta_paciente(paciente)
+        self._snapshot_si_corresponde()
+
+    def agregar_pacientes_lote(self, pacientes: list[Paciente]):
+        """Registra varios pacientes con una sola escritura en el journal y el repositorio.
         
-        self.__pacientes[dni] = paciente
+        Si algún DNI ya está registrado o se repite en el lote no se registra ninguno.
+        """
+        pacientes = list(pacientes)
+        for paciente in pacientes:
+            if not isinstance(paciente, Paciente):
+                raise DatosInvalidosException("Los elementos deben ser instancias de Paciente")
+        
+        with self.__bloqueo_registro:
+            dnis = set()
+            for paciente in pacientes:
+                dni = paciente.obtener_dni()
+                if dni in self.__pacientes or dni in dnis:
+                    raise PacienteDuplicadoException(f"Ya existe un paciente con DNI {dni}")
+                dnis.add(dni)
+            
+            if pacientes:
+                self._registrar_evento(*(self._evento_paciente(paciente) for paciente in pacientes))
+            for paciente in pacientes:
+                self._alta_paciente(paciente)
+        self._snapshot_si_corresponde()
+
+    def _alta_paciente(self, paciente: Paciente):
+        dni = paciente.obtener_dni()
         self.__historias_clinicas[dni] = HistoriaClinica(paciente)
+        self.__pacientes[dni] = paciente
+        self.__orden_pacientes.append(paciente)
 
     def agregar_medico(self, medico: Medico):
         """Registra un médico."""
@@ -39,10 +202,108 @@ class Clinica:
             raise DatosInvalidosException("El parámetro debe ser una instancia de Medico")
         
         matricula = medico.obtener_matricula()
-        if matricula in self.__medicos:
-            raise MedicoDuplicadoException(f"Ya existe un médico con matrícula {matricula}")
+        with self.__bloqueo_registro:
+            if matricula in self.__medicos:
+                raise MedicoDuplicadoException(f"Ya existe un médico con matrícula {matricula}")
+            
+            self._registrar_evento(self._evento_medico(medico))
+            self._alta_medico(medico)
+        self._snapshot_si_corresponde()
+
+    def agregar_medicos_lote(self, medicos: list[Medico]):
+        """Registra varios médicos con una sola escritura en el journal y el repositorio.
         
-        self.__medicos[matricula] = medico
+        Si alguna matrícula ya está registrada o se repite en el lote no se registra ninguno.
+        """
+        medicos = list(medicos)
+        for medico in medicos:
+            if not isinstance(medico, Medico):
+                raise DatosInvalidosException("Los elementos deben ser instancias de Medico")
+        
+        with self.__bloqueo_registro:
+            matriculas = set()
+            for medico in medicos:
+                matricula = medico.obtener_matricula()
+                if matricula in self.__medicos or matricula in matriculas:
+                    raise MedicoDuplicadoException(f"Ya existe un médico con matrícula {matricula}")
+                matriculas.add(matricula)
+            
+            if medicos:
+                self._registrar_evento(*(self._evento_medico(medico) for medico in medicos))
+            for medico in medicos:
+                self._alta_medico(medico)
+        self._snapshot_si_corresponde()
+
+    def _alta_medico(self, medico: Medico):
+        matricula = medico.obtener_matricula()
+        with self.__bloqueo_registro:
+            if self.__concurrente:
+                self.__bloqueos_medicos[matricula] = threading.Lock()
+            self.__agendas[matricula] = Agenda()
+            
+            for especialidad in medico.obtener_especialidades():
+                self._indexar_especialidad(medico, especialidad)
+            medico.agregar_observador(self._especialidad_agregada)
+            self.__medicos[matricula] = medico
+            self.__orden_medicos.append(medico)
+
+    def _especialidad_agregada(self, medico: Medico, especialidad: Especialidad):
+        """Observador de Medico: registra e indexa especialidades agregadas tras el alta."""
+        with self.__bloqueo_registro:
+            self._registrar_evento({
+                "op": "especialidad",
+                "matricula": medico.obtener_matricula(),
+                "tipo": especialidad.obtener_especialidad(),
+                "dias": especialidad.obtener_dias(),
+                "duracion_minutos": especialidad.obtener_duracion_minutos(),
+            })
+            self._indexar_especialidad(medico, especialidad)
+
+    def _indexar_especialidad(self, medico: Medico, especialidad: Especialidad):
+        """Agrega al índice invertido los días en que el médico atiende la especialidad."""
+        nombre = especialidad.obtener_especialidad()
+        with self.__bloqueo_registro:
+            por_dia = self.__medicos_por_especialidad.setdefault(nombre.lower(), {})
+            for dia in especialidad.obtener_dias_semana():
+                # Sólo cuenta si es la especialidad que el médico atiende efectivamente ese día
+                if medico.obtener_especialidad_para_dia(dia) == nombre:
+                    por_dia.setdefault(dia, {})[medico.obtener_matricula()] = None
+
+    def _bloqueo_medico(self, matricula: str):
+        """Devuelve el bloqueo que serializa los turnos de un médico (o uno nulo)."""
+        if not self.__concurrente:
+            return self.__sin_bloqueo
+        return self.__bloqueos_medicos[matricula]
+
+    def _bloquear_medicos(self, matriculas) -> ExitStack:
+        """Toma los bloqueos de varios médicos en orden de matrícula para evitar interbloqueos."""
+        pila = ExitStack()
+        if self.__concurrente:
+            for matricula in sorted(set(matriculas)):
+                if matricula in self.__bloqueos_medicos:
+                    pila.enter_context(self.__bloqueos_medicos[matricula])
+        return pila
+
+    def _bloquear_todo(self) -> ExitStack:
+        """Toma todos los bloqueos (registro, médicos y pacientes) para ver un estado consistente."""
+        pila = ExitStack()
+        if self.__concurrente:
+            pila.enter_context(self.__bloqueo_registro)
+            for matricula in sorted(self.__bloqueos_medicos):
+                pila.enter_context(self.__bloqueos_medicos[matricula])
+            for bloqueo in self.__bloqueos_pacientes:
+                pila.enter_context(bloqueo)
+        return pila
+
+    def _bloqueo_paciente(self, dni: str):
+        """Devuelve el bloqueo que protege la historia clínica de un paciente (o uno nulo)."""
+        if not self.__concurrente:
+            return self.__sin_bloqueo
+        return self.__bloqueos_pacientes[hash(dni) % self.CANTIDAD_BLOQUEOS_PACIENTES]
+
+    def es_concurrente(self) -> bool:
+        """Indica si la clínica se creó con concurrente=True (segura para usar desde varios hilos)."""
+        return self.__concurrente
 
     def obtener_pacientes(self) -> list[Paciente]:
         """Devuelve todos los pacientes registrados."""
@@ -52,6 +313,59 @@ class Clinica:
         """Devuelve todos los médicos registrados."""
         return list(self.__medicos.values())
 
+    def iterar_pacientes(self):
+        """Recorre los pacientes en orden de alta sin copiarlos (sin los registrados durante el recorrido)."""
+        return islice(self.__orden_pacientes, len(self.__orden_pacientes))
+
+    def iterar_medicos(self):
+        """Recorre los médicos en orden de alta sin copiarlos (sin los registrados durante el recorrido)."""
+        return islice(self.__orden_medicos, len(self.__orden_medicos))
+
+    def obtener_pagina_pacientes(self, desde: int = 0, limite: int = 20) -> Pagina:
+        """Devuelve hasta `limite` pacientes en orden de alta a partir de la posición `desde`."""
+        return self._paginar(self.__orden_pacientes, desde, limite)
+
+    def obtener_pagina_medicos(self, desde: int = 0, limite: int = 20) -> Pagina:
+        """Devuelve hasta `limite` médicos en orden de alta a partir de la posición `desde`."""
+        return self._paginar(self.__orden_medicos, desde, limite)
+
+    def _paginar(self, lista: list, desde: int, limite: int) -> Pagina:
+        """Corta una página de una lista sólo de agregado.
+        
+        Como los elementos nunca cambian de posición, el cursor sigue siendo
+        válido aunque se agreguen elementos entre una página y la siguiente.
+        """
+        self._validar_pagina(limite)
+        if not isinstance(desde, int) or desde < 0:
+            raise DatosInvalidosException("El cursor debe ser una posición no negativa")
+        elementos = lista[desde:desde + limite]
+        fin = desde + len(elementos)
+        return Pagina(elementos, fin if fin < len(lista) else None)
+
+    def _validar_pagina(self, limite: int):
+        if not isinstance(limite, int) or limite < 1:
+            raise DatosInvalidosException("El límite de la página debe ser un entero positivo")
+
+    def medicos_para(self, especialidad: str, dia: int | str) -> list[Medico]:
+        """Devuelve los médicos que atienden la especialidad ese día (entero de weekday() o nombre)."""
+        if isinstance(dia, str):
+            dia = dia.lower().strip()
+            if dia not in Especialidad.DIAS_VALIDOS:
+                return []
+            dia = Especialidad.DIAS_VALIDOS.index(dia)
+        
+        with self.__bloqueo_registro:
+            por_dia = self.__medicos_por_especialidad.get(especialidad.strip().lower(), {})
+            return [self.__medicos[matricula] for matricula in por_dia.get(dia, ())]
+
+    def existe_paciente(self, dni: str) -> bool:
+        """Indica si hay un paciente registrado con ese DNI."""
+        return dni in self.__pacientes
+
+    def existe_medico(self, matricula: str) -> bool:
+        """Indica si hay un médico registrado con esa matrícula."""
+        return matricula in self.__medicos
+
     def obtener_medico_por_matricula(self, matricula: str) -> Medico:
         """Devuelve un médico por su matrícula."""
         self.validar_existencia_medico(matricula)
@@ -66,25 +380,417 @@ class Clinica:
         paciente = self.__pacientes[dni]
         medico = self.__medicos[matricula]
         
-        # Validar que no haya turno duplicado
-        self.validar_turno_no_duplicado(matricula, fecha_hora)
+        with self._bloqueo_medico(matricula):
+            # Validar que no se superponga con otro turno del médico
+            duracion = self._duracion_turno(medico, fecha_hora)
+            self.validar_turno_no_duplicado(matricula, fecha_hora, duracion)
+            
+            # Validar que el médico atienda esa especialidad ese día
+            self.validar_especialidad_en_dia(medico, especialidad, fecha_hora.weekday())
+            
+            # Crear y agendar el turno
+            turno = Turno(paciente, medico, fecha_hora, especialidad, self.__reloj, duracion)
+            self._registrar_evento(self._evento_turno(turno))
+            self._registrar_turno(turno)
+        self._snapshot_si_corresponde()
+
+    def agendar_turnos_lote(self, solicitudes: list[tuple], todo_o_nada: bool = True) -> ResultadoLote:
+        """Agenda varios turnos (dni, matricula, especialidad, fecha_hora) validándolos juntos.
+        
+        Detecta superposiciones contra los turnos existentes y dentro del mismo lote.
+        Cada paciente, médico y (médico, especialidad, día de la semana) distinto
+        del lote se resuelve una sola vez; por fila sólo se busca la superposición.
+        Con todo_o_nada=True no se agenda ninguna fila si alguna es rechazada;
+        con todo_o_nada=False se agendan las filas válidas.
+        """
+        solicitudes = list(solicitudes)
+        # Todo el lote se valida contra la misma hora
+        reloj = self.__reloj.congelar()
+        matriculas = [s[1] for s in solicitudes
+                      if isinstance(s, (tuple, list)) and len(s) == 4 and isinstance(s[1], str)]
         
-        # Obtener día de la semana en español
-        dia_semana = self.obtener_dia_semana_en_espanol(fecha_hora)
+        with self._bloquear_medicos(matriculas):
+            resultado = ResultadoLote()
+            validados = []
+            pacientes = {}  # dni -> Paciente, o la excepción si no está registrado
+            medicos = {}  # matrícula -> (Medico, Agenda o None), o la excepción si no está registrado
+            cobertura = {}  # (matrícula, especialidad, día) -> (duración, excepción o None si la atiende)
+            agendas_lote = {}  # matrícula -> Agenda con los turnos ya aceptados del lote
+            fines_lote = {}  # matrícula -> fin del último de esos turnos
+            
+            for indice, solicitud in enumerate(solicitudes):
+                try:
+                    try:
+                        dni, matricula, especialidad, fecha_hora = solicitud
+                    except (TypeError, ValueError):
+                        raise DatosInvalidosException("Cada solicitud debe ser (dni, matricula, especialidad, fecha_hora)")
+                    if not isinstance(fecha_hora, datetime):
+                        raise DatosInvalidosException("La fecha_hora debe ser un objeto datetime")
+                    if not isinstance(especialidad, str) or not especialidad.strip():
+                        raise DatosInvalidosException("La especialidad no puede estar vacía")
+                
+                    paciente = self._resolver_una_vez(pacientes, dni, self._paciente_registrado)
+                    medico, agenda = self._resolver_una_vez(medicos, matricula, self._medico_y_agenda)
+                    dia = fecha_hora.weekday()
+                    duracion, no_atiende = self._resolver_una_vez(
+                        cobertura, (matricula, especialidad, dia),
+                        lambda clave: self._cobertura(medico, especialidad, dia))
+                
+                    inicio = a_instante(fecha_hora)
+                    # Si la fila empieza después del último turno aceptado del médico en el lote
+                    # (lo habitual), no puede chocar con ninguno: no hace falta buscar
+                    if (inicio < fines_lote.get(matricula, inicio)
+                            and self._buscar_superposicion(agendas_lote[matricula], inicio, duracion) is not None):
+                        raise TurnoOcupadoException(
+                            f"Otra solicitud del lote ya ocupa el {fecha_hora.strftime('%d/%m/%Y %H:%M')}"
+                        )
+                    choque = self._buscar_superposicion(agenda, inicio, duracion)
+                    if choque is not None:
+                        raise self._turno_ocupado(choque)
+                    if no_atiende is not None:
+                        raise no_atiende.with_traceback(None)
+                
+                    turno = Turno(paciente, medico, fecha_hora, especialidad, reloj, duracion)
+                except (PacienteNoEncontradoException, MedicoNoEncontradoException,
+                        MedicoNoDisponibleException, TurnoOcupadoException, DatosInvalidosException) as e:
+                    resultado.registrar_error(indice, e)
+                    continue
+            
+                agendas_lote.setdefault(matricula, Agenda()).agregar(inicio, turno)
+                fines_lote[matricula] = max(fines_lote.get(matricula, 0), turno.obtener_instante_fin())
+                validados.append((indice, turno))
+            
+            self._confirmar_lote(resultado, validados, todo_o_nada)
         
-        # Validar que el médico atienda esa especialidad ese día
-        self.validar_especialidad_en_dia(medico, especialidad, dia_semana)
+        self._snapshot_si_corresponde()
+        return resultado
+
+    @staticmethod
+    def _resolver_una_vez(resueltos: dict, clave, resolver):
+        """Devuelve resolver(clave) calculándolo sólo la primera vez (también si lanza una excepción)."""
+        if clave not in resueltos:
+            try:
+                resueltos[clave] = resolver(clave)
+            except (PacienteNoEncontradoException, MedicoNoEncontradoException) as e:
+                resueltos[clave] = e
+        valor = resueltos[clave]
+        if isinstance(valor, Exception):
+            raise valor.with_traceback(None)
+        return valor
+
+    def _paciente_registrado(self, dni: str) -> Paciente:
+        self.validar_existencia_paciente(dni)
+        return self.__pacientes[dni]
+
+    def _medico_y_agenda(self, matricula: str) -> tuple[Medico, Agenda | None]:
+        self.validar_existencia_medico(matricula)
+        return self.__medicos[matricula], self.__agendas.get(matricula)
+
+    def _cobertura(self, medico: Medico, especialidad: str, dia: int) -> tuple[int, Exception | None]:
+        """Duración de un turno con el médico ese día y la excepción si ese día no atiende la especialidad."""
+        duracion = medico.obtener_duracion_para_dia(dia)
+        try:
+            self.validar_especialidad_en_dia(medico, especialidad, dia)
+        except MedicoNoDisponibleException as e:
+            return Especialidad.DURACION_PREDETERMINADA if duracion is None else duracion, e
+        return duracion, None
+
+    def _confirmar_lote(self, resultado: ResultadoLote, validados: list[tuple[int, Turno]], todo_o_nada: bool):
+        """Registra con una sola escritura los turnos validados de un lote (con los bloqueos tomados)."""
+        if todo_o_nada and not resultado.es_exitoso():
+            return
+        if validados:
+            self._registrar_evento(*(self._evento_turno(turno) for _, turno in validados))
+        for indice, turno in validados:
+            self._registrar_turno(turno)
+            resultado.registrar_turno(indice, turno)
+
+    def agendar_serie(self, dni: str, matricula: str, especialidad: str, inicio: datetime,
+                      intervalo: timedelta = timedelta(weeks=1), cantidad: int | None = None,
+                      hasta: datetime | None = None, todo_o_nada: bool = True) -> ResultadoLote:
+        """Agenda una serie de turnos periódicos (por ejemplo, todos los martes a las 10:00).
+        
+        Las ocurrencias son las de expandir_serie. Paciente, médico y especialidad
+        se validan una vez; la cobertura del médico se consulta una vez por día de
+        la semana y cada ocurrencia sólo se busca en el índice de turnos, todo con
+        un solo bloqueo, una sola hora de referencia y una sola escritura. Si el
+        intervalo es menor que la duración del turno, las ocurrencias que se
+        superponen con la anterior aceptada se rechazan. Con
+        todo_o_nada=True no se agenda ninguna si alguna es rechazada; el resultado
+        indica qué ocurrencias (por posición en la serie) chocan y por qué.
+        """
+        fechas = self.expandir_serie(inicio, intervalo, cantidad, hasta)
+        if not isinstance(especialidad, str) or not especialidad.strip():
+            raise DatosInvalidosException("La especialidad no puede estar vacía")
+        self.validar_existencia_paciente(dni)
+        self.validar_existencia_medico(matricula)
+        paciente = self.__pacientes[dni]
+        medico = self.__medicos[matricula]
+        reloj = self.__reloj.congelar()
+        
+        with self._bloqueo_medico(matricula):
+            resultado = ResultadoLote()
+            validados = []
+            cobertura = {}  # día de la semana -> excepción, o None si atiende la especialidad
+            fin_anterior = None
+            for indice, fecha_hora in enumerate(fechas):
+                dia = fecha_hora.weekday()
+                if dia not in cobertura:
+                    try:
+                        self.validar_especialidad_en_dia(medico, especialidad, dia)
+                        cobertura[dia] = None
+                    except MedicoNoDisponibleException as e:
+                        cobertura[dia] = e
+                try:
+                    if cobertura[dia] is not None:
+                        raise cobertura[dia]
+                    # Atiende la especialidad ese día, así que la duración es la de la especialidad
+                    duracion = medico.obtener_duracion_para_dia(dia)
+                    if fin_anterior is not None and a_instante(fecha_hora) < fin_anterior:
+                        raise TurnoOcupadoException(
+                            f"El turno anterior de la serie sigue en curso el {fecha_hora.strftime('%d/%m/%Y %H:%M')}"
+                        )
+                    self.validar_turno_no_duplicado(matricula, fecha_hora, duracion)
+                    turno = Turno(paciente, medico, fecha_hora, especialidad, reloj, duracion)
+                    validados.append((indice, turno))
+                    fin_anterior = turno.obtener_instante_fin()
+                except (MedicoNoDisponibleException, TurnoOcupadoException, DatosInvalidosException) as e:
+                    resultado.registrar_error(indice, e)
+            
+            self._confirmar_lote(resultado, validados, todo_o_nada)
+        
+        self._snapshot_si_corresponde()
+        return resultado
+
+    @classmethod
+    def expandir_serie(cls, inicio: datetime, intervalo: timedelta = timedelta(weeks=1),
+                       cantidad: int | None = None, hasta: datetime | None = None) -> list[datetime]:
+        """Devuelve las fechas de la serie: `inicio` y cada `intervalo`, hasta juntar
+        `cantidad` o llegar a `hasta` (excluido), lo que ocurra primero."""
+        if not isinstance(inicio, datetime):
+            raise DatosInvalidosException("El inicio de la serie debe ser un objeto datetime")
+        if not isinstance(intervalo, timedelta) or intervalo <= timedelta(0):
+            raise DatosInvalidosException("El intervalo debe ser un timedelta positivo")
+        if cantidad is None and hasta is None:
+            raise DatosInvalidosException("Debe indicar la cantidad de turnos o la fecha de fin de la serie")
+        if cantidad is not None and (not isinstance(cantidad, int) or cantidad <= 0):
+            raise DatosInvalidosException("La cantidad de turnos debe ser un entero positivo")
+        if hasta is not None and not isinstance(hasta, datetime):
+            raise DatosInvalidosException("La fecha de fin de la serie debe ser un objeto datetime")
+        if hasta is not None and hasta <= inicio:
+            raise DatosInvalidosException("La fecha de fin de la serie debe ser posterior al inicio")
+        
+        if hasta is not None:
+            hasta_cantidad = -((inicio - hasta) // intervalo)  # redondeo hacia arriba
+            cantidad = hasta_cantidad if cantidad is None else min(cantidad, hasta_cantidad)
+        if cantidad > cls.MAXIMO_TURNOS_SERIE:
+            raise DatosInvalidosException(f"Una serie no puede tener más de {cls.MAXIMO_TURNOS_SERIE} turnos")
+        return [inicio + intervalo * i for i in range(cantidad)]
+
+    def _registrar_turno(self, turno: Turno):
+        """Guarda un turno ya validado y actualiza los índices (un turno cancelado sólo va a la historia)."""
+        matricula = turno.obtener_medico().obtener_matricula()
+        dni = turno.obtener_paciente().obtener_dni()
         
-        # Crear y agendar el turno
-        turno = Turno(paciente, medico, fecha_hora, especialidad)
         self.__turnos.append(turno)
+        if not turno.esta_cancelado():
+            self.__turnos_por_horario[(matricula, turno.obtener_instante())] = turno
+            self.__agendas[matricula].agregar(turno.obtener_instante(), turno, turno.obtener_duracion_minutos())
         
         # Agregar a la historia clínica
-        self.__historias_clinicas[dni].agregar_turno(turno)
+        with self._bloqueo_paciente(dni):
+            self.__historias_clinicas[dni].agregar_turno(turno)
+
+    def cancelar_turno(self, matricula: str, fecha_hora: datetime) -> Turno:
+        """Cancela el turno de un médico en un horario y deja el horario libre.
+        
+        El turno sigue en la historia clínica del paciente, marcado como cancelado.
+        """
+        self.validar_existencia_medico(matricula)
+        with self._bloqueo_medico(matricula):
+            turno = self._obtener_turno_agendado(matricula, fecha_hora)
+            self._registrar_evento(self._evento_cancelacion(turno))
+            self._cancelar(turno)
+        self._snapshot_si_corresponde()
+        return turno
+
+    def reprogramar_turno(self, matricula: str, fecha_hora: datetime, nueva_fecha_hora: datetime,
+                          nueva_matricula: str | None = None) -> Turno:
+        """Mueve un turno a otro horario (y opcionalmente a otro médico) y devuelve el turno nuevo.
+        
+        El nuevo horario se valida como un turno nuevo de la misma especialidad
+        (puede superponerse con el propio turno que se mueve); si no es válido
+        el turno original no se toca. El original queda cancelado
+        en la historia clínica y ambos cambios se registran en una sola escritura.
+        """
+        if nueva_matricula is None:
+            nueva_matricula = matricula
+        self.validar_existencia_medico(matricula)
+        self.validar_existencia_medico(nueva_matricula)
+        if not isinstance(nueva_fecha_hora, datetime):
+            raise DatosInvalidosException("La nueva fecha_hora debe ser un objeto datetime")
+        
+        with self._bloquear_medicos([matricula, nueva_matricula]):
+            anterior = self._obtener_turno_agendado(matricula, fecha_hora)
+            medico = self.__medicos[nueva_matricula]
+            especialidad = anterior.obtener_especialidad()
+            duracion = self._duracion_turno(medico, nueva_fecha_hora)
+            self.validar_turno_no_duplicado(nueva_matricula, nueva_fecha_hora, duracion, ignorar=anterior)
+            self.validar_especialidad_en_dia(medico, especialidad, nueva_fecha_hora.weekday())
+            nuevo = Turno(anterior.obtener_paciente(), medico, nueva_fecha_hora, especialidad, self.__reloj, duracion)
+            
+            self._registrar_evento(self._evento_cancelacion(anterior), self._evento_turno(nuevo))
+            self._cancelar(anterior)
+            self._registrar_turno(nuevo)
+        self._snapshot_si_corresponde()
+        return nuevo
+
+    def _obtener_turno_agendado(self, matricula: str, fecha_hora: datetime) -> Turno:
+        """Devuelve el turno vigente del médico en ese horario (con su bloqueo tomado)."""
+        if not isinstance(fecha_hora, datetime):
+            raise DatosInvalidosException("La fecha_hora debe ser un objeto datetime")
+        turno = self.__turnos_por_horario.get((matricula, a_instante(fecha_hora)))
+        if turno is None:
+            raise TurnoNoEncontradoException(
+                f"El médico no tiene un turno agendado para {fecha_hora.strftime('%d/%m/%Y %H:%M')}"
+            )
+        return turno
+
+    def _cancelar(self, turno: Turno):
+        """Saca un turno de los índices de horarios y lo marca cancelado: O(log n) en la agenda del médico."""
+        matricula = turno.obtener_medico().obtener_matricula()
+        del self.__turnos_por_horario[(matricula, turno.obtener_instante())]
+        self.__agendas[matricula].quitar(turno.obtener_instante(), turno)
+        turno.cancelar()
 
     def obtener_turnos(self) -> list[Turno]:
-        """Devuelve todos los turnos agendados."""
-        return self.__turnos.copy()
+        """Devuelve todos los turnos agendados (sin los cancelados)."""
+        return [turno for turno in self.__turnos if not turno.esta_cancelado()]
+
+    def iterar_turnos(self):
+        """Recorre los turnos en orden de agendamiento sin copiarlos (sin los agendados durante el recorrido
+        ni los cancelados)."""
+        return (turno for turno in islice(self.__turnos, len(self.__turnos)) if not turno.esta_cancelado())
+
+    def obtener_pagina_turnos(self, despues_de: tuple[datetime, str] | None = None, limite: int = 20) -> Pagina:
+        """Devuelve hasta `limite` turnos en orden cronológico (y por matrícula a igual horario).
+        
+        El cursor es el par (fecha_hora, matricula) del último turno de la página
+        anterior, así que los turnos agendados entre páginas no corren los
+        siguientes ni hacen repetir elementos. Cada página toma de cada agenda
+        sólo los primeros turnos posteriores al cursor y los mezcla.
+        """
+        self._validar_pagina(limite)
+        if despues_de is not None:
+            self._validar_datetime(despues_de[0], mensaje="El cursor debe empezar con un objeto datetime")
+        with self.__bloqueo_registro:
+            agendas = list(self.__agendas.items())
+        
+        candidatos = []
+        for matricula, agenda in agendas:
+            with self._bloqueo_medico(matricula):
+                # Uno de más para saber si hay otra página
+                if despues_de is None:
+                    turnos = agenda.obtener_primeros(limite + 1)
+                else:
+                    fecha_hora, ultima_matricula = despues_de
+                    turnos = agenda.obtener_siguientes(a_instante(fecha_hora), limite + 1,
+                                                       incluir_desde=matricula > ultima_matricula)
+            candidatos.append([((turno.obtener_instante(), matricula), turno) for turno in turnos])
+        
+        elementos = list(islice(heapq.merge(*candidatos, key=lambda candidato: candidato[0]), limite + 1))
+        siguiente = None
+        if len(elementos) > limite:
+            instante, matricula = elementos[limite - 1][0]
+            siguiente = (desde_instante(instante), matricula)
+        return Pagina([turno for _, turno in elementos[:limite]], siguiente)
+
+    def obtener_turnos_medico_entre(self, matricula: str, desde: datetime, hasta: datetime) -> list[Turno]:
+        """Devuelve los turnos de un médico con fecha en [desde, hasta), ordenados."""
+        self.validar_existencia_medico(matricula)
+        self._validar_datetime(desde, hasta, mensaje="Las fechas desde y hasta deben ser objetos datetime")
+        with self._bloqueo_medico(matricula):
+            return self.__agendas[matricula].obtener_entre(a_instante(desde), a_instante(hasta))
+
+    def obtener_intervalos_turnos_medico(self, matricula: str, desde: datetime,
+                                         hasta: datetime) -> tuple[list[int], list[int]]:
+        """Devuelve los turnos vigentes del médico que empiezan en [desde, hasta) como dos listas
+        paralelas de enteros: instantes de inicio, en orden, y la duración en minutos guardada en
+        cada turno. No toca los objetos Turno (para reportes sobre muchos turnos)."""
+        self.validar_existencia_medico(matricula)
+        self._validar_datetime(desde, hasta, mensaje="Las fechas desde y hasta deben ser objetos datetime")
+        inicio, fin = a_instante(desde), a_instante(hasta)
+        with self._bloqueo_medico(matricula):
+            agenda = self.__agendas[matricula]
+            return agenda.obtener_claves_entre(inicio, fin), agenda.obtener_datos_entre(inicio, fin)
+
+    def obtener_proximo_turno_medico(self, matricula: str, desde: datetime) -> Turno | None:
+        """Devuelve el primer turno del médico a partir de `desde`, o None."""
+        self.validar_existencia_medico(matricula)
+        self._validar_datetime(desde, mensaje="La fecha desde debe ser un objeto datetime")
+        with self._bloqueo_medico(matricula):
+            return self.__agendas[matricula].obtener_proximo(a_instante(desde))
+
+    def buscar_turnos_libres(self, especialidad: str, desde: datetime, hasta: datetime,
+                             duracion: timedelta | None = None, limite: int | None = None):
+        """Genera en orden cronológico los horarios libres (fecha_hora, medico) de una especialidad.
+        
+        Recorre, para cada médico que atiende la especialidad, los bloques de `duracion`
+        (por defecto, la duración de los turnos de su especialidad) dentro del horario
+        de atención de los días que la atiende, con inicio en [desde, hasta), y
+        descarta los bloques que se superponen con turnos agendados.
+        Los candidatos se generan a demanda, por lo que pedir los primeros `limite`
+        no recorre el rango completo.
+        """
+        if not isinstance(desde, datetime) or not isinstance(hasta, datetime):
+            raise DatosInvalidosException("Las fechas desde y hasta deben ser objetos datetime")
+        if duracion is not None and (not isinstance(duracion, timedelta) or duracion <= timedelta(0)):
+            raise DatosInvalidosException("La duración debe ser un timedelta positivo")
+        if limite is not None and (not isinstance(limite, int) or limite < 1):
+            raise DatosInvalidosException("El límite debe ser un entero positivo")
+        
+        dias_por_medico = {}
+        with self.__bloqueo_registro:
+            por_dia = self.__medicos_por_especialidad.get(especialidad.strip().lower(), {})
+            for dia, matriculas in por_dia.items():
+                for matricula in matriculas:
+                    dias_por_medico.setdefault(matricula, set()).add(dia)
+        
+        candidatos = heapq.merge(*(
+            self._horarios_libres_medico(matricula, dias, desde, hasta, duracion)
+            for matricula, dias in dias_por_medico.items()
+        ))
+        return ((fecha_hora, self.__medicos[matricula])
+                for fecha_hora, matricula in islice(candidatos, limite))
+
+    def _horarios_libres_medico(self, matricula: str, dias: set[int], desde: datetime,
+                                hasta: datetime, duracion: timedelta | None):
+        """Genera los bloques libres de un médico en los días de la semana indicados.
+        
+        La agenda se lee con el bloqueo del médico tomado, un día por vez: el
+        bloqueo no queda tomado entre un candidato y el siguiente.
+        """
+        agenda = self.__agendas[matricula]
+        medico = self.__medicos[matricula]
+        dia = desde.date()
+        while dia <= hasta.date():
+            if dia.weekday() in dias:
+                libres = []
+                with self._bloqueo_medico(matricula):
+                    paso = duracion or timedelta(minutes=medico.obtener_duracion_para_dia(dia.weekday()))
+                    largo = paso // MICROSEGUNDO
+                    horario = datetime.combine(dia, self.HORA_INICIO_ATENCION)
+                    cierre = datetime.combine(dia, self.HORA_FIN_ATENCION)
+                    while horario + paso <= cierre and horario < hasta:
+                        inicio = a_instante(horario)
+                        # Primero lo barato: si algún turno empieza dentro del bloque, está ocupado
+                        if horario >= desde and not agenda.hay_entre(inicio, inicio + largo):
+                            anterior = agenda.obtener_anterior(inicio)
+                            if anterior is None or anterior.obtener_instante_fin() <= inicio:
+                                libres.append((horario, matricula))
+                        horario += paso
+                yield from libres
+            dia += timedelta(days=1)
 
     def emitir_receta(self, dni: str, matricula: str, medicamentos: list[str]):
         """Emite una receta para un paciente."""
@@ -96,16 +802,261 @@ class Clinica:
         medico = self.__medicos[matricula]
         
         # Crear y emitir la receta
-        receta = Receta(paciente, medico, medicamentos)
+        receta = Receta(paciente, medico, self._internar_medicamentos(medicamentos), self.__reloj)
         
         # Agregar a la historia clínica
-        self.__historias_clinicas[dni].agregar_receta(receta)
+        with self._bloqueo_paciente(dni):
+            self._registrar_evento({
+                "op": "receta",
+                "dni": dni,
+                "matricula": matricula,
+                "medicamentos": receta.obtener_medicamentos(),
+                "fecha": receta.obtener_fecha().isoformat(),
+            })
+            self._registrar_receta(receta)
+        self._snapshot_si_corresponde()
+
+    def _internar_medicamentos(self, medicamentos):
+        """Pasa los nombres por el catálogo, así las recetas comparten los textos que coinciden."""
+        return [self.__catalogo.internar(med) for med in medicamentos or ()]
+
+    def _registrar_receta(self, receta: Receta):
+        """Agrega una receta a la historia y al índice por medicamento (con el bloqueo del paciente tomado)."""
+        self.__historias_clinicas[receta.obtener_paciente().obtener_dni()].agregar_receta(receta)
+        with self.__bloqueo_recetas:
+            for id_medicamento in {self.__catalogo.obtener_id(med) for med in receta.obtener_medicamentos()}:
+                self.__recetas_por_medicamento.setdefault(id_medicamento, []).append(receta)
+
+    def obtener_recetas_con_medicamento(self, medicamento: str) -> list[Receta]:
+        """Devuelve las recetas que incluyen el medicamento, en orden de emisión.
+        
+        Usa el índice por medicamento, sin recorrer las historias clínicas. El
+        nombre se normaliza como en el catálogo (mayúsculas y espacios no importan).
+        """
+        id_medicamento = self.__catalogo.buscar_id(medicamento)
+        if id_medicamento is None:
+            return []
+        with self.__bloqueo_recetas:
+            return list(self.__recetas_por_medicamento.get(id_medicamento, ()))
 
     def obtener_historia_clinica(self, dni: str) -> HistoriaClinica:
         """Devuelve la historia clínica completa de un paciente."""
         self.validar_existencia_paciente(dni)
         return self.__historias_clinicas[dni]
 
+    def iterar_historias_clinicas(self, dnis=None):
+        """Genera las historias clínicas de todos los pacientes, o de los DNIs indicados.
+        
+        No arma listas de historias: sólo se toma una foto de las claves al empezar,
+        así los pacientes registrados durante el recorrido no lo interrumpen.
+        """
+        if dnis is None:
+            with self.__bloqueo_registro:
+                dnis = list(self.__historias_clinicas)
+        for dni in dnis:
+            self.validar_existencia_paciente(dni)
+            yield self.__historias_clinicas[dni]
+
+    def _registrar_evento(self, *eventos: dict):
+        # El repositorio va primero: puede rechazar el cambio por una restricción de la base.
+        # Confirma recién después del journal, así si el journal falla no queda nada guardado
+        with self.__repositorio.transaccion(*eventos):
+            if self.__journal is not None:
+                self.__journal.registrar(*eventos)
+
+    def _evento_paciente(self, paciente: Paciente) -> dict:
+        return {
+            "op": "paciente",
+            "nombre": paciente.obtener_nombre(),
+            "dni": paciente.obtener_dni(),
+            "fecha_nacimiento": paciente.obtener_fecha_nacimiento(),
+        }
+
+    def _evento_medico(self, medico: Medico) -> dict:
+        return {
+            "op": "medico",
+            "nombre": medico.obtener_nombre(),
+            "matricula": medico.obtener_matricula(),
+            "especialidades": [
+                {"tipo": esp.obtener_especialidad(), "dias": esp.obtener_dias(),
+                 "duracion_minutos": esp.obtener_duracion_minutos()}
+                for esp in medico.obtener_especialidades()
+            ],
+        }
+
+    def _evento_turno(self, turno: Turno) -> dict:
+        return {
+            "op": "turno",
+            "dni": turno.obtener_paciente().obtener_dni(),
+            "matricula": turno.obtener_medico().obtener_matricula(),
+            "especialidad": turno.obtener_especialidad(),
+            "fecha_hora": turno.obtener_fecha_hora().isoformat(),
+            "duracion_minutos": turno.obtener_duracion_minutos(),
+        }
+
+    def _evento_cancelacion(self, turno: Turno) -> dict:
+        return {
+            "op": "cancelacion",
+            "matricula": turno.obtener_medico().obtener_matricula(),
+            "fecha_hora": turno.obtener_fecha_hora().isoformat(),
+        }
+
+    def _aplicar_evento(self, evento: dict):
+        """Aplica un evento del journal sobre el estado en memoria."""
+        operacion = evento.get("op")
+        if operacion == "cancelacion":
+            instante = a_instante(datetime.fromisoformat(evento["fecha_hora"]))
+            self._cancelar(self.__turnos_por_horario[(evento["matricula"], instante)])
+        elif operacion == "turno":
+            turno = Turno.desde_registro(
+                self.__pacientes[evento["dni"]],
+                self.__medicos[evento["matricula"]],
+                datetime.fromisoformat(evento["fecha_hora"]),
+                evento["especialidad"],
+                # Los eventos anteriores a las duraciones no la traen
+                evento.get("duracion_minutos", Especialidad.DURACION_PREDETERMINADA),
+            )
+            self._registrar_turno(turno)
+        elif operacion == "receta":
+            receta = Receta.desde_registro(
+                self.__pacientes[evento["dni"]],
+                self.__medicos[evento["matricula"]],
+                self._internar_medicamentos(evento["medicamentos"]),
+                datetime.fromisoformat(evento["fecha"]),
+            )
+            self._registrar_receta(receta)
+        elif operacion == "paciente":
+            self._alta_paciente(Paciente.desde_registro(evento["nombre"], evento["dni"], evento["fecha_nacimiento"]))
+        elif operacion == "medico":
+            self._alta_medico(Medico.desde_registro(evento["nombre"], evento["matricula"], [
+                Especialidad.desde_registro(especialidad["tipo"], especialidad["dias"], especialidad.get(
+                    "duracion_minutos", Especialidad.DURACION_PREDETERMINADA))
+                for especialidad in evento["especialidades"]
+            ]))
+        elif operacion == "especialidad":
+            medico = self.__medicos[evento["matricula"]]
+            # Un snapshot puede haber capturado ya la especialidad antes de su evento
+            if all(esp.obtener_especialidad() != evento["tipo"] for esp in medico.obtener_especialidades()):
+                medico.agregar_especialidad(Especialidad.desde_registro(
+                    evento["tipo"], evento["dias"], evento.get("duracion_minutos", Especialidad.DURACION_PREDETERMINADA)
+                ))
+        else:
+            raise DatosInvalidosException(f"Evento de journal desconocido: {operacion}")
+
+    def _exportar_estado(self) -> dict:
+        """Devuelve el estado completo en columnas, listo para serializar (sólo tipos básicos y bytes)."""
+        pacientes = list(self.__pacientes.values())
+        medicos = list(self.__medicos.values())
+        posicion_paciente = {p.obtener_dni(): i for i, p in enumerate(pacientes)}
+        posicion_medico = {m.obtener_matricula(): i for i, m in enumerate(medicos)}
+        especialidades = {}
+        
+        turnos = {
+            "paciente": array("I"), "medico": array("I"), "especialidad": array("I"), "fecha_hora": array("q"),
+            "cancelado": array("B"), "duracion": array("H"),
+        }
+        for turno in self.__turnos:
+            turnos["paciente"].append(posicion_paciente[turno.obtener_paciente().obtener_dni()])
+            turnos["medico"].append(posicion_medico[turno.obtener_medico().obtener_matricula()])
+            turnos["especialidad"].append(
+                especialidades.setdefault(turno.obtener_especialidad(), len(especialidades))
+            )
+            turnos["fecha_hora"].append(turno.obtener_instante())
+            turnos["cancelado"].append(turno.esta_cancelado())
+            turnos["duracion"].append(turno.obtener_duracion_minutos())
+        
+        recetas = {"paciente": array("I"), "medico": array("I"), "fecha": array("q"), "medicamentos": []}
+        for posicion, paciente in enumerate(pacientes):
+            for receta in self.__historias_clinicas[paciente.obtener_dni()].iterar_recetas():
+                recetas["paciente"].append(posicion)
+                recetas["medico"].append(posicion_medico[receta.obtener_medico().obtener_matricula()])
+                recetas["fecha"].append(receta.obtener_instante())
+                recetas["medicamentos"].append(receta.obtener_medicamentos())
+        
+        columnas = {nombre: columna.tobytes() for nombre, columna in turnos.items()}
+        columnas["especialidades"] = list(especialidades)
+        return {
+            "pacientes": {
+                "nombre": [p.obtener_nombre() for p in pacientes],
+                "dni": [p.obtener_dni() for p in pacientes],
+                "fecha_nacimiento": [p.obtener_fecha_nacimiento() for p in pacientes],
+            },
+            "medicos": {
+                "nombre": [m.obtener_nombre() for m in medicos],
+                "matricula": [m.obtener_matricula() for m in medicos],
+                "especialidades": [
+                    [(esp.obtener_especialidad(), esp.obtener_dias(), esp.obtener_duracion_minutos())
+                     for esp in m.obtener_especialidades()]
+                    for m in medicos
+                ],
+            },
+            "turnos": columnas,
+            "recetas": {
+                "paciente": recetas["paciente"].tobytes(),
+                "medico": recetas["medico"].tobytes(),
+                "fecha": recetas["fecha"].tobytes(),
+                "medicamentos": recetas["medicamentos"],
+            },
+        }
+
+    def _importar_estado(self, estado: dict):
+        """Carga en una clínica vacía el estado producido por _exportar_estado."""
+        datos = estado["pacientes"]
+        pacientes = [
+            Paciente.desde_registro(nombre, dni, fecha)
+            for nombre, dni, fecha in zip(datos["nombre"], datos["dni"], datos["fecha_nacimiento"])
+        ]
+        for paciente in pacientes:
+            self._alta_paciente(paciente)
+        
+        datos = estado["medicos"]
+        medicos = []
+        for nombre, matricula, especialidades in zip(datos["nombre"], datos["matricula"], datos["especialidades"]):
+            medico = Medico.desde_registro(nombre, matricula, [
+                # Los snapshots anteriores a las duraciones guardan sólo (tipo, dias)
+                Especialidad.desde_registro(*especialidad) for especialidad in especialidades
+            ])
+            self._alta_medico(medico)
+            medicos.append(medico)
+        
+        datos = estado["turnos"]
+        columnas = {}
+        for nombre, tipo in (("paciente", "I"), ("medico", "I"), ("especialidad", "I"), ("fecha_hora", "q")):
+            columnas[nombre] = array(tipo)
+            columnas[nombre].frombytes(datos[nombre])
+        # Los snapshots anteriores a las cancelaciones no traen la columna
+        columnas["cancelado"] = array("B")
+        columnas["cancelado"].frombytes(datos.get("cancelado", bytes(len(columnas["fecha_hora"]))))
+        if "duracion" in datos:
+            columnas["duracion"] = array("H")
+            columnas["duracion"].frombytes(datos["duracion"])
+        else:
+            columnas["duracion"] = array("H", [Especialidad.DURACION_PREDETERMINADA]) * len(columnas["fecha_hora"])
+        for paciente, medico, especialidad, fecha_hora, cancelado, duracion in zip(
+                columnas["paciente"], columnas["medico"], columnas["especialidad"], columnas["fecha_hora"],
+                columnas["cancelado"], columnas["duracion"]):
+            turno = Turno.desde_registro(
+                pacientes[paciente], medicos[medico], fecha_hora,
+                datos["especialidades"][especialidad], duracion,
+            )
+            if cancelado:
+                turno.cancelar()
+            self._registrar_turno(turno)
+        
+        datos = estado["recetas"]
+        columnas = {}
+        for nombre, tipo in (("paciente", "I"), ("medico", "I"), ("fecha", "q")):
+            columnas[nombre] = array(tipo)
+            columnas[nombre].frombytes(datos[nombre])
+        for paciente, medico, fecha, medicamentos in zip(
+                columnas["paciente"], columnas["medico"], columnas["fecha"], datos["medicamentos"]):
+            receta = Receta.desde_registro(
+                pacientes[paciente], medicos[medico], self._internar_medicamentos(medicamentos), fecha)
+            self._registrar_receta(receta)
+        # El snapshot guarda las recetas por paciente: el índice vuelve al orden de emisión
+        for recetas in self.__recetas_por_medicamento.values():
+            recetas.sort(key=Receta.obtener_instante)
+
     def validar_existencia_paciente(self, dni: str):
         """Verifica si un paciente está registrado."""
         if not dni or dni not in self.__pacientes:
@@ -116,12 +1067,56 @@ class Clinica:
         if not matricula or matricula not in self.__medicos:
             raise MedicoNoEncontradoException(f"No se encontró un médico con matrícula {matricula}")
 
-    def validar_turno_no_duplicado(self, matricula: str, fecha_hora: datetime):
-        """Verifica que no haya un turno duplicado."""
-        for turno in self.__turnos:
-            if (turno.obtener_medico().obtener_matricula() == matricula and 
-                turno.obtener_fecha_hora() == fecha_hora):
-                raise TurnoOcupadoException(f"El médico ya tiene un turno agendado para {fecha_hora.strftime('%d/%m/%Y %H:%M')}")
+    def validar_turno_no_duplicado(self, matricula: str, fecha_hora: datetime,
+                                   duracion_minutos: int = Especialidad.DURACION_PREDETERMINADA,
+                                   ignorar: Turno | None = None):
+        """Verifica que un turno de `duracion_minutos` en ese horario no se superponga con otro del médico.
+        
+        `ignorar` es un turno que no cuenta como ocupado (el que se está reprogramando).
+        """
+        self._validar_datetime(fecha_hora)
+        choque = self._buscar_superposicion(self.__agendas.get(matricula), a_instante(fecha_hora),
+                                            duracion_minutos, ignorar)
+        if choque is not None:
+            raise self._turno_ocupado(choque)
+
+    @staticmethod
+    def _turno_ocupado(choque: Turno) -> TurnoOcupadoException:
+        inicio = choque.obtener_fecha_hora()
+        return TurnoOcupadoException(
+            f"El médico ya tiene un turno agendado para {inicio.strftime('%d/%m/%Y %H:%M')} "
+            f"(hasta las {choque.obtener_fecha_hora_fin().strftime('%H:%M')})"
+        )
+
+    @staticmethod
+    def _validar_datetime(*fechas, mensaje: str = "La fecha_hora debe ser un objeto datetime"):
+        """Rechaza lo que no sea datetime antes de pasarlo a instante (un date o un str no sirven)."""
+        if not all(isinstance(fecha, datetime) for fecha in fechas):
+            raise DatosInvalidosException(mensaje)
+
+    @staticmethod
+    def _buscar_superposicion(agenda: Agenda | None, inicio: int, duracion_minutos: int,
+                              ignorar: Turno | None = None) -> Turno | None:
+        """Devuelve un turno de la agenda que se superpone con [inicio, inicio + duración), o None.
+        
+        Los turnos de una agenda no se superponen entre sí, así que sólo pueden
+        chocar el último que empieza antes de `inicio` y el primero que empieza
+        desde `inicio` (sin contar `ignorar`): una búsqueda binaria, sin recorrer
+        la agenda.
+        """
+        if agenda is None:
+            return None
+        anterior, siguiente = agenda.obtener_vecinos(inicio, ignorar)
+        if anterior is not None and anterior.obtener_instante_fin() > inicio:
+            return anterior
+        if siguiente is not None and siguiente.obtener_instante() < inicio + duracion_minutos * MICROSEGUNDOS_POR_MINUTO:
+            return siguiente
+        return None
+
+    def _duracion_turno(self, medico: Medico, fecha_hora: datetime) -> int:
+        """Duración de un turno con el médico ese día (la predeterminada si ese día no atiende)."""
+        duracion = medico.obtener_duracion_para_dia(fecha_hora.weekday()) if isinstance(fecha_hora, datetime) else None
+        return Especialidad.DURACION_PREDETERMINADA if duracion is None else duracion
 
     def obtener_dia_semana_en_espanol(self, fecha_hora: datetime) -> str:
         """Traduce un objeto datetime al día de la semana en español."""
@@ -135,9 +1130,15 @@ class Clinica:
             raise MedicoNoDisponibleException(f"El médico no atiende los {dia_semana}")
         return especialidad
 
-    def validar_especialidad_en_dia(self, medico: Medico, especialidad_solicitada: str, dia_semana: str):
-        """Verifica que el médico atienda esa especialidad ese día."""
+    def validar_especialidad_en_dia(self, medico: Medico, especialidad_solicitada: str, dia_semana: int | str):
+        """Verifica que el médico atienda esa especialidad ese día (entero de weekday() o nombre)."""
         especialidad_disponible = medico.obtener_especialidad_para_dia(dia_semana)
+        if especialidad_disponible and especialidad_disponible.lower() == especialidad_solicitada.lower():
+            return
+        
+        # Sólo en el camino de error se traduce el día para el mensaje
+        if isinstance(dia_semana, int):
+            dia_semana = Especialidad.DIAS_VALIDOS[dia_semana]
         
         if not especialidad_disponible:
             raise MedicoNoDisponibleException(f"El Dr. {medico.obtener_nombre()} no atiende los {dia_semana}")
@@ -1,13 +1,37 @@
 from .excepciones import DatosInvalidosException
 class Especialidad:
+    __slots__ = ("__tipo", "__dias", "__dias_semana", "__duracion_minutos")
     DIAS_VALIDOS = ['lunes', 'martes', 'miércoles', 'jueves', 'viernes', 'sábado', 'domingo']
+    # Duración de los turnos de una especialidad que no indica otra
+    DURACION_PREDETERMINADA = 30
     
-    def _init_(self, tipo: str, dias: list[str]):
+    def __init__(self, tipo: str, dias: list[str], duracion_minutos: int = DURACION_PREDETERMINADA):
         self._validar_tipo(tipo)
         self._validar_dias(dias)
+        self.validar_duracion(duracion_minutos)
         
         self.__tipo = tipo.strip()
         self.__dias = [d.lower().strip() for d in dias]
+        self.__dias_semana = [self.DIAS_VALIDOS.index(d) for d in self.__dias]
+        self.__duracion_minutos = duracion_minutos
+
+    @classmethod
+    def desde_registro(cls, tipo: str, dias: list[str],
+                       duracion_minutos: int = DURACION_PREDETERMINADA) -> "Especialidad":
+        """Reconstruye una especialidad ya validada, con los días ya normalizados."""
+        especialidad = cls.__new__(cls)
+        especialidad.__tipo = tipo
+        especialidad.__dias = list(dias)
+        especialidad.__dias_semana = [_NUMERO_DIA[d] for d in dias]
+        especialidad.__duracion_minutos = duracion_minutos
+        return especialidad
+
+    @staticmethod
+    def validar_duracion(duracion_minutos: int):
+        """Valida que la duración de los turnos sea una cantidad entera y positiva de minutos (menos de un día)."""
+        if (not isinstance(duracion_minutos, int) or isinstance(duracion_minutos, bool)
+                or not 0 < duracion_minutos < 24 * 60):
+            raise DatosInvalidosException("La duración de los turnos debe ser un entero de minutos entre 1 y 1439")
 
     def _validar_tipo(self, tipo: str):
         """Valida que el tipo de especialidad no esté vacío."""
@@ -44,7 +68,18 @@ class Especialidad:
     def obtener_dias(self) -> list[str]:
         return self.__dias.copy()
 
-    def _str_(self) -> str:
+    def obtener_dias_semana(self) -> list[int]:
+        """Devuelve los días de atención como enteros (0 = lunes, como datetime.weekday())."""
+        return self.__dias_semana.copy()
+
+    def obtener_duracion_minutos(self) -> int:
+        """Devuelve cuántos minutos dura cada turno de la especialidad."""
+        return self.__duracion_minutos
+
+    def __str__(self) -> str:
         dias_str = ', '.join(self.__dias)
-        return f"{self.__tipo} (Días: {dias_str})"
-    
\ No newline at end of file
+        return f"{self.__tipo} (Días: {dias_str}; turnos de {self.__duracion_minutos} min)"
+
+
+# Día normalizado -> número de día (0 = lunes)
+_NUMERO_DIA = {dia: numero for numero, dia in enumerate(Especialidad.DIAS_VALIDOS)}
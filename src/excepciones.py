@@ -14,6 +14,10 @@ class TurnoOcupadoException(Exception):
     pass
 
 
+class TurnoNoEncontradoException(Exception):
+    pass
+
+
 class RecetaInvalidaException(Exception):
     pass
 
@@ -31,4 +35,8 @@ class EspecialidadDuplicadaException(Exception):
 
 
 class DatosInvalidosException(Exception):
+    pass
+
+
+class DependenciaNoDisponibleException(Exception):
     pass
\ No newline at end of file
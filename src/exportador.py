@@ -0,0 +1,85 @@
+import csv
+import json
+from datetime import datetime
+
+from .clinica import Clinica
+from .excepciones import DatosInvalidosException
+
+# json.dumps con argumentos propios crea un encoder nuevo en cada llamada
+_codificar_json = json.JSONEncoder(ensure_ascii=False, separators=(",", ":")).encode
+
+
+class Exportador:
+    """Exporta las historias clínicas a JSONL o CSV, registro por registro.
+
+    Cada turno y cada receta es un registro con los datos del paciente y del
+    médico. Los registros se generan a demanda y se escriben a medida que se
+    generan, así que exportar todas las historias no las copia en memoria.
+    El destino puede ser una ruta o cualquier archivo de texto abierto
+    (sys.stdout, un pipe, un socket envuelto con makefile).
+    """
+
+    FORMATOS = ("jsonl", "csv")
+    CAMPOS = ("tipo", "dni", "paciente", "matricula", "medico", "especialidad", "fecha", "medicamentos")
+
+    def __init__(self, clinica: Clinica):
+        self.__clinica = clinica
+
+    def registros(self, dnis=None, desde: datetime | None = None, hasta: datetime | None = None):
+        """Genera un dict por turno y por receta, paciente por paciente.
+
+        Con `dnis` se exportan sólo esas historias; con `desde`/`hasta` sólo los
+        registros con fecha en [desde, hasta).
+        """
+        for historia in self.__clinica.iterar_historias_clinicas(dnis):
+            paciente = historia.obtener_paciente()
+            dni = paciente.obtener_dni()
+            nombre = paciente.obtener_nombre()
+
+            # Las historias están ordenadas por fecha: el rango se ubica con búsqueda binaria
+            for turno in historia.iterar_turnos(desde, hasta):
+                medico = turno.obtener_medico()
+                yield {
+                    "tipo": "turno cancelado" if turno.esta_cancelado() else "turno",
+                    "dni": dni, "paciente": nombre,
+                    "matricula": medico.obtener_matricula(), "medico": medico.obtener_nombre(),
+                    "especialidad": turno.obtener_especialidad(), "fecha": turno.obtener_fecha_hora().isoformat(),
+                    "medicamentos": [],
+                }
+
+            for receta in historia.iterar_recetas(desde, hasta):
+                medico = receta.obtener_medico()
+                yield {
+                    "tipo": "receta", "dni": dni, "paciente": nombre,
+                    "matricula": medico.obtener_matricula(), "medico": medico.obtener_nombre(),
+                    "especialidad": "", "fecha": receta.obtener_fecha().isoformat(),
+                    "medicamentos": receta.obtener_medicamentos(),
+                }
+
+    def exportar(self, destino, formato: str = "jsonl", dnis=None,
+                 desde: datetime | None = None, hasta: datetime | None = None) -> int:
+        """Escribe los registros en `destino` (ruta o archivo abierto) y devuelve cuántos escribió."""
+        if formato not in self.FORMATOS:
+            raise DatosInvalidosException(f"Formato no soportado: '{formato}'. Formatos: {', '.join(self.FORMATOS)}")
+
+        registros = self.registros(dnis, desde, hasta)
+        if isinstance(destino, str):
+            with open(destino, "w", encoding="utf-8", newline="") as archivo:
+                return self._escribir(archivo, formato, registros)
+        return self._escribir(destino, formato, registros)
+
+    def _escribir(self, archivo, formato: str, registros) -> int:
+        cantidad = 0
+        if formato == "csv":
+            escritor = csv.writer(archivo)
+            escritor.writerow(self.CAMPOS)
+            for registro in registros:
+                registro["medicamentos"] = "|".join(registro["medicamentos"])
+                escritor.writerow([registro[campo] for campo in self.CAMPOS])
+                cantidad += 1
+        else:
+            for registro in registros:
+                archivo.write(_codificar_json(registro) + "\n")
+                cantidad += 1
+        archivo.flush()
+        return cantidad
@@ -1,28 +1,182 @@
+import heapq
+from bisect import bisect_left, bisect_right
+from itertools import chain
+
+from .reloj import a_instante, desde_instante
+from .vistalista import VistaLista
+
+
+def _instante(entrada) -> int:
+    return entrada.obtener_instante()
+
+
+def _ultimo_instante(bloque: list) -> int:
+    return bloque[-1].obtener_instante()
+
+
+def _insertar_ordenado(bloques: list, elemento, carga: int):
+    """Inserta manteniendo el orden por fecha en una lista de bloques ordenados.
+
+    Agregar al final del último bloque lo modifica; insertar en cualquier otro
+    lugar arma un bloque nuevo (de a lo sumo 2 * carga elementos) en reemplazo
+    del anterior, así las vistas y recorridos ya entregados nunca ven corrido
+    un elemento y la inserción cuesta O(carga) en lugar de O(n).
+    """
+    instante = elemento.obtener_instante()
+    if not bloques:
+        bloques.append([elemento])
+        return
+    numero = min(bisect_right(bloques, instante, key=_ultimo_instante), len(bloques) - 1)
+    bloque = bloques[numero]
+    posicion = bisect_right(bloque, instante, key=_instante)
+    if numero == len(bloques) - 1 and posicion == len(bloque):
+        bloque.append(elemento)
+    else:
+        bloque = bloque.copy()
+        bloque.insert(posicion, elemento)
+        bloques[numero] = bloque
+    if len(bloque) > 2 * carga:
+        bloques[numero:numero + 1] = [bloque[:carga], bloque[carga:]]
+
+
+def _ubicar(bloques: list, fecha) -> tuple[int, int]:
+    """Devuelve (bloque, posición) de la primera entrada con fecha >= `fecha`, o (cantidad de bloques, 0)."""
+    instante = a_instante(fecha)
+    numero = bisect_left(bloques, instante, key=_ultimo_instante)
+    if numero == len(bloques):
+        return numero, 0
+    return numero, bisect_left(bloques[numero], instante, key=_instante)
+
+
+def _rango(bloques: list, desde, hasta) -> tuple[tuple[int, int], tuple[int, int]]:
+    inicio = (0, 0) if desde is None else _ubicar(bloques, desde)
+    fin = (len(bloques), 0) if hasta is None else _ubicar(bloques, hasta)
+    return inicio, fin
+
+
+def _tramo(bloques: list, inicio: tuple[int, int], fin: tuple[int, int]):
+    # Sin copiar el tramo ni recorrer lo anterior a `inicio`
+    if inicio >= fin:
+        return
+    (numero, posicion), (ultimo, hasta) = inicio, fin
+    while numero < len(bloques):
+        bloque = bloques[numero]
+        final = hasta if numero == ultimo else len(bloque)
+        yield from (bloque[i] for i in range(posicion, final))
+        if numero == ultimo:
+            return
+        numero, posicion = numero + 1, 0
+
+
+def _entre(bloques: list, desde, hasta) -> list:
+    return list(_tramo(bloques, *_rango(bloques, desde, hasta)))
+
+
+def _recorrer(bloques: list, desde, hasta):
+    # Sobre una foto de la lista de bloques: los bloques que ve no cambian salvo al final
+    bloques = list(bloques)
+    if desde is None and hasta is None:
+        return chain.from_iterable(bloques)
+    return _tramo(bloques, *_rango(bloques, desde, hasta))
+
+
+def _ultimos(bloques: list, cantidad: int, hasta) -> list:
+    numero, fin = (len(bloques), 0) if hasta is None else _ubicar(bloques, hasta)
+    tramos = []
+    while cantidad > 0:
+        if fin == 0:
+            if numero == 0:
+                break
+            numero -= 1
+            fin = len(bloques[numero])
+        inicio = max(fin - cantidad, 0)
+        tramos.append(bloques[numero][inicio:fin])
+        cantidad -= fin - inicio
+        fin = inicio
+    return [entrada for tramo in reversed(tramos) for entrada in tramo]
+
+
 class HistoriaClinica:
+    """Turnos y recetas de un paciente, ordenados por fecha.
+
+    El orden se mantiene por el instante entero de cada entrada, en bloques
+    ordenados como los de Agenda (de a lo sumo 2 * CARGA entradas). Las
+    consultas por rango de fechas y de los últimos N usan búsqueda binaria,
+    por lo que cuestan O(log n) más el tamaño del resultado, y agregar una
+    entrada fuera de orden cuesta O(CARGA). A igual fecha se conserva el orden
+    en que se agregaron.
+    """
+
+    __slots__ = ("__paciente", "__turnos", "__recetas")
+
+    CARGA = 512
+
     def __init__(self, paciente):
         self.__paciente = paciente
-        self.__turnos = []
-        self.__recetas = []
-    
+        self.__turnos = []   # bloques de turnos, cada uno ordenado
+        self.__recetas = []  # bloques de recetas, cada uno ordenado
+
     def agregar_turno(self, turno):
-        self.__turnos.append(turno)
-      
-    
+        _insertar_ordenado(self.__turnos, turno, self.CARGA)
+
     def agregar_receta(self, receta):
-        self.__recetas.append(receta)
-        
-    
+        _insertar_ordenado(self.__recetas, receta, self.CARGA)
+
     def obtener_paciente(self):
         return self.__paciente
-    
+
     def obtener_turnos(self) -> list:
-        return self.__turnos.copy()
-    
+        return [turno for bloque in self.__turnos for turno in bloque]
+
     def obtener_recetas(self) -> list:
-        return self.__recetas.copy()
-    
-    def _str_(self) -> str:
-        turnos_str = '\n'.join(str(t) for t in self.__turnos)
-        recetas_str = '\n'.join(str(r) for r in self.__recetas)
+        return [receta for bloque in self.__recetas for receta in bloque]
+
+    def vista_turnos(self) -> VistaLista:
+        """Devuelve los turnos actuales como vista de sólo lectura, sin copiar las entradas."""
+        return VistaLista(self.__turnos)
+
+    def vista_recetas(self) -> VistaLista:
+        """Devuelve las recetas actuales como vista de sólo lectura, sin copiar las entradas."""
+        return VistaLista(self.__recetas)
+
+    def iterar_turnos(self, desde=None, hasta=None):
+        """Recorre los turnos sin copiarlos (sólo los de [desde, hasta), si se indica)."""
+        return _recorrer(self.__turnos, desde, hasta)
+
+    def iterar_recetas(self, desde=None, hasta=None):
+        """Recorre las recetas sin copiarlas (sólo las de [desde, hasta), si se indica)."""
+        return _recorrer(self.__recetas, desde, hasta)
+
+    def obtener_turnos_entre(self, desde, hasta) -> list:
+        """Devuelve los turnos con fecha en [desde, hasta), en orden cronológico."""
+        return _entre(list(self.__turnos), desde, hasta)
+
+    def obtener_recetas_entre(self, desde, hasta) -> list:
+        """Devuelve las recetas con fecha en [desde, hasta), en orden cronológico."""
+        return _entre(list(self.__recetas), desde, hasta)
+
+    def obtener_ultimos_turnos(self, cantidad: int, hasta=None) -> list:
+        """Devuelve los últimos `cantidad` turnos (anteriores a `hasta`, si se indica), en orden cronológico."""
+        return _ultimos(list(self.__turnos), cantidad, hasta)
+
+    def obtener_ultimas_recetas(self, cantidad: int, hasta=None) -> list:
+        """Devuelve las últimas `cantidad` recetas (anteriores a `hasta`, si se indica), en orden cronológico."""
+        return _ultimos(list(self.__recetas), cantidad, hasta)
+
+    def iterar_cronologia(self, desde=None, hasta=None):
+        """Genera turnos y recetas intercalados por fecha, con fecha en [desde, hasta).
+
+        Cada elemento es un par (fecha, turno o receta). A igual fecha, los turnos
+        van antes que las recetas.
+        """
+        entradas = heapq.merge(
+            _recorrer(self.__turnos, desde, hasta),
+            _recorrer(self.__recetas, desde, hasta),
+            key=_instante,
+        )
+        return ((desde_instante(entrada.obtener_instante()), entrada) for entrada in entradas)
+
+    def __str__(self) -> str:
+        turnos_str = '\n'.join(str(t) for t in self.iterar_turnos())
+        recetas_str = '\n'.join(str(r) for r in self.iterar_recetas())
         return f"Historia Clínica de {self.__paciente}:\nTurnos:\n{turnos_str}\nRecetas:\n{recetas_str}"
-    
@@ -0,0 +1,172 @@
+import csv
+import json
+import os
+
+from .clinica import Clinica
+from .paciente import Paciente
+from .medico import Medico
+from .especialidad import Especialidad
+from .reporteimportacion import ReporteImportacion
+from .excepciones import (
+    PacienteDuplicadoException,
+    MedicoDuplicadoException,
+    DatosInvalidosException
+)
+
+
+class Importador:
+    """Importa pacientes y médicos a una clínica desde archivos CSV o JSONL.
+
+    Los archivos se leen y validan de a una fila; en memoria sólo se guarda el
+    lote pendiente, que se registra en la clínica con una única escritura cada
+    `tamano_lote` filas válidas. Una fila inválida o con un DNI/matrícula
+    repetido (en el mismo lote o ya registrado en la clínica, lo que incluye
+    las filas anteriores del archivo) queda en el reporte y no detiene la
+    importación.
+
+    Formato de los médicos: en JSONL, "especialidades" es una lista de objetos
+    {"tipo", "dias"} con "duracion_minutos" opcional; en CSV es un texto como
+    "Pediatría:lunes|viernes;Cardiología:martes:45", donde el último número
+    (opcional) es la duración de los turnos en minutos.
+    """
+
+    FORMATOS = ("csv", "jsonl")
+    CAMPOS_PACIENTE = ("nombre", "dni", "fecha_nacimiento")
+    CAMPOS_MEDICO = ("nombre", "matricula", "especialidades")
+
+    def __init__(self, clinica: Clinica, tamano_lote: int = 1000):
+        if tamano_lote < 1:
+            raise DatosInvalidosException("El tamaño de lote debe ser al menos 1")
+        self.__clinica = clinica
+        self.__tamano_lote = tamano_lote
+
+    def importar_pacientes(self, ruta: str, formato: str | None = None) -> ReporteImportacion:
+        """Importa pacientes (nombre, dni, fecha_nacimiento); el formato se deduce de la extensión."""
+        return self._importar(
+            ruta, formato, self.CAMPOS_PACIENTE, self._crear_paciente, Paciente.obtener_dni,
+            self.__clinica.existe_paciente, self.__clinica.agregar_pacientes_lote,
+            self.__clinica.agregar_paciente, PacienteDuplicadoException, "DNI",
+        )
+
+    def importar_medicos(self, ruta: str, formato: str | None = None) -> ReporteImportacion:
+        """Importa médicos (nombre, matricula, especialidades); el formato se deduce de la extensión."""
+        return self._importar(
+            ruta, formato, self.CAMPOS_MEDICO, self._crear_medico, Medico.obtener_matricula,
+            self.__clinica.existe_medico, self.__clinica.agregar_medicos_lote,
+            self.__clinica.agregar_medico, MedicoDuplicadoException, "matrícula",
+        )
+
+    def _importar(self, ruta, formato, campos, crear, clave, existe, agregar_lote, agregar,
+                  duplicado, nombre_clave) -> ReporteImportacion:
+        formato = self._formato(ruta, formato)
+        reporte = ReporteImportacion(ruta)
+        lote = {}  # clave -> (línea, entidad)
+
+        for linea, fila in self._leer(ruta, formato, campos):
+            try:
+                entidad = crear(self._decodificar(fila, formato))
+                valor = clave(entidad)
+                if valor in lote:
+                    raise duplicado(f"{nombre_clave} {valor} repetido (línea {lote[valor][0]})")
+                if existe(valor):
+                    raise duplicado(f"Ya existe un registro con {nombre_clave} {valor}")
+            except (DatosInvalidosException, duplicado) as e:
+                reporte.registrar_error(linea, e)
+                continue
+
+            lote[valor] = (linea, entidad)
+            if len(lote) >= self.__tamano_lote:
+                self._confirmar(lote, agregar_lote, agregar, duplicado, reporte)
+                lote = {}
+
+        self._confirmar(lote, agregar_lote, agregar, duplicado, reporte)
+        return reporte
+
+    def _confirmar(self, lote: dict, agregar_lote, agregar, duplicado, reporte: ReporteImportacion):
+        if not lote:
+            return
+        try:
+            agregar_lote([entidad for _, entidad in lote.values()])
+            reporte.registrar_importados(len(lote))
+        except duplicado:
+            # Otro hilo registró alguna clave mientras se armaba el lote: se reintenta de a uno
+            for linea, entidad in lote.values():
+                try:
+                    agregar(entidad)
+                    reporte.registrar_importados(1)
+                except duplicado as e:
+                    reporte.registrar_error(linea, e)
+
+    def _formato(self, ruta: str, formato: str | None) -> str:
+        formato = (formato or os.path.splitext(ruta)[1].lstrip(".")).lower()
+        if formato not in self.FORMATOS:
+            raise DatosInvalidosException(f"Formato no soportado: '{formato}'. Formatos: {', '.join(self.FORMATOS)}")
+        return formato
+
+    def _leer(self, ruta: str, formato: str, campos: tuple):
+        """Genera (número de línea, fila sin decodificar) sin cargar el archivo en memoria."""
+        with open(ruta, encoding="utf-8-sig", newline="") as archivo:
+            if formato == "csv":
+                lector = csv.DictReader(archivo)
+                faltantes = [campo for campo in campos if campo not in (lector.fieldnames or ())]
+                if faltantes:
+                    raise DatosInvalidosException(f"Faltan columnas en {ruta}: {', '.join(faltantes)}")
+                for fila in lector:
+                    yield lector.line_num, fila
+            else:
+                for numero, texto in enumerate(archivo, 1):
+                    if texto.strip():
+                        yield numero, texto
+
+    def _decodificar(self, fila, formato: str) -> dict:
+        if formato == "csv":
+            return fila
+        try:
+            fila = json.loads(fila)
+        except json.JSONDecodeError as e:
+            raise DatosInvalidosException(f"JSON inválido: {e.msg}")
+        if not isinstance(fila, dict):
+            raise DatosInvalidosException("Cada línea debe ser un objeto JSON")
+        return fila
+
+    def _texto(self, fila: dict, campo: str) -> str:
+        valor = fila.get(campo)
+        if not isinstance(valor, str):
+            raise DatosInvalidosException(f"El campo '{campo}' falta o no es texto")
+        return valor
+
+    def _crear_paciente(self, fila: dict) -> Paciente:
+        return Paciente(self._texto(fila, "nombre"), self._texto(fila, "dni"),
+                        self._texto(fila, "fecha_nacimiento"))
+
+    def _crear_medico(self, fila: dict) -> Medico:
+        medico = Medico(self._texto(fila, "nombre"), self._texto(fila, "matricula").strip())
+        for tipo, dias, duracion in self._especialidades(fila.get("especialidades")):
+            medico.agregar_especialidad(Especialidad(tipo, dias, duracion))
+        return medico
+
+    def _especialidades(self, valor) -> list[tuple[str, list[str], int]]:
+        """Interpreta las especialidades de una fila CSV (texto) o JSONL (lista de objetos)."""
+        if valor is None or valor == "":
+            return []
+        if isinstance(valor, str):
+            especialidades = []
+            for parte in valor.split(";"):
+                tipo, separador, dias = parte.partition(":")
+                if not separador:
+                    raise DatosInvalidosException(f"Especialidad sin días: '{parte.strip()}'")
+                dias, separador, duracion = dias.partition(":")
+                if not separador:
+                    duracion = Especialidad.DURACION_PREDETERMINADA
+                elif duracion.strip().isdigit():
+                    duracion = int(duracion)
+                else:
+                    raise DatosInvalidosException(f"Duración de turno inválida: '{parte.strip()}'")
+                especialidades.append((tipo, dias.split("|"), duracion))
+            return especialidades
+        if isinstance(valor, list) and all(
+                isinstance(esp, dict) and isinstance(esp.get("tipo"), str) and isinstance(esp.get("dias"), list)
+                and all(isinstance(dia, str) for dia in esp["dias"]) for esp in valor):
+            return [(esp["tipo"], esp["dias"], esp.get("duracion_minutos", Especialidad.DURACION_PREDETERMINADA))
+                    for esp in valor]
+        raise DatosInvalidosException("El campo 'especialidades' no tiene un formato válido")
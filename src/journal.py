@@ -0,0 +1,139 @@
+import json
+import os
+import threading
+
+from .excepciones import DatosInvalidosException
+
+
+class Journal:
+    """Registro en disco, sólo de agregado, de las operaciones que modifican la clínica.
+
+    Cada evento es un objeto JSON en una línea. Las escrituras se vuelcan al
+    sistema operativo en cada llamada a `registrar`, pero el fsync se agrupa
+    cada `eventos_por_sincronizacion` eventos (y al cerrar).
+
+    El fsync se hace fuera del bloqueo de escritura: mientras un hilo espera
+    al disco, los demás siguen escribiendo, y el próximo fsync cubre todo lo
+    escrito hasta entonces. Un hilo cuyo evento ya quedó cubierto por el fsync
+    de otro no hace el suyo.
+    """
+
+    def __init__(self, ruta: str, eventos_por_sincronizacion: int = 100):
+        if eventos_por_sincronizacion < 1:
+            raise DatosInvalidosException("eventos_por_sincronizacion debe ser al menos 1")
+        self.__ruta = ruta
+        self.__eventos_por_sincronizacion = eventos_por_sincronizacion
+        self.__escritos = 0        # eventos escritos desde que se abrió
+        self.__sincronizados = 0   # de ellos, los que ya cubrió un fsync
+        self.__bloqueo = threading.Lock()
+        # Serializa los fsync; se toma antes que __bloqueo, nunca después
+        self.__bloqueo_sincronizacion = threading.Lock()
+        self._reparar_final(ruta)
+        self.__archivo = open(ruta, "a", encoding="utf-8")
+
+    @staticmethod
+    def _reparar_final(ruta: str, tamano_bloque: int = 64 * 1024):
+        """Deja el archivo terminado en salto de línea antes de agregarle eventos.
+
+        Si una escritura quedó cortada, la última línea no termina en salto de
+        línea y el próximo evento se pegaría a ella. Se resuelve igual que en
+        `leer`: si esa línea es un evento completo se le agrega el salto; si
+        no, se trunca el archivo hasta el último salto de línea.
+        """
+        if not os.path.exists(ruta):
+            return
+        with open(ruta, "r+b") as archivo:
+            posicion = archivo.seek(0, os.SEEK_END)
+            cola = b""
+            while posicion > 0:
+                inicio = max(0, posicion - tamano_bloque)
+                archivo.seek(inicio)
+                cola = archivo.read(posicion - inicio) + cola
+                posicion = inicio
+                if b"\n" in cola:
+                    break
+            if not cola or cola.endswith(b"\n"):
+                return
+            corte = cola.rfind(b"\n") + 1
+            linea = cola[corte:]
+            try:
+                json.loads(linea.decode("utf-8"))
+            except (UnicodeDecodeError, json.JSONDecodeError):
+                archivo.truncate(posicion + corte)
+            else:
+                archivo.write(b"\n")
+            archivo.flush()
+            os.fsync(archivo.fileno())
+
+    def obtener_ruta(self) -> str:
+        return self.__ruta
+
+    def registrar(self, *eventos: dict):
+        """Agrega uno o más eventos al final del journal con una sola escritura."""
+        lineas = "".join(
+            json.dumps(evento, ensure_ascii=False, separators=(",", ":")) + "\n" for evento in eventos
+        )
+        with self.__bloqueo:
+            self.__archivo.write(lineas)
+            self.__archivo.flush()
+            self.__escritos += len(eventos)
+            escritos = self.__escritos
+        if escritos - self.__sincronizados >= self.__eventos_por_sincronizacion:
+            self._sincronizar_hasta(escritos)
+
+    def sincronizar(self):
+        """Fuerza el fsync de los eventos pendientes."""
+        self._sincronizar_hasta(self.__escritos)
+
+    def _sincronizar_hasta(self, escritos: int):
+        """Hace fsync salvo que otro hilo ya haya cubierto los primeros `escritos` eventos."""
+        with self.__bloqueo_sincronizacion:
+            if self.__sincronizados >= escritos:
+                return
+            with self.__bloqueo:
+                if self.__archivo.closed:
+                    return
+                # Lo escrito hasta acá ya está en el sistema operativo: el fsync lo cubre
+                escritos = self.__escritos
+                descriptor = self.__archivo.fileno()
+            os.fsync(descriptor)
+            self.__sincronizados = escritos
+
+    def cerrar(self):
+        with self.__bloqueo_sincronizacion, self.__bloqueo:
+            if self.__archivo.closed:
+                return
+            self.__archivo.flush()
+            os.fsync(self.__archivo.fileno())
+            self.__sincronizados = self.__escritos
+            self.__archivo.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *excepcion):
+        self.cerrar()
+        return False
+
+    @staticmethod
+    def leer(ruta: str):
+        """Genera los eventos de un journal de a uno, sin cargar el archivo en memoria.
+
+        Una última línea incompleta (escritura interrumpida) se descarta; una
+        línea corrupta seguida de otras es un error.
+        """
+        if not os.path.exists(ruta):
+            return
+        with open(ruta, encoding="utf-8") as archivo:
+            pendiente = None
+            for numero, linea in enumerate(archivo, 1):
+                if not linea.strip():
+                    continue
+                if pendiente is not None:
+                    raise DatosInvalidosException(f"Journal corrupto en {ruta}, línea {pendiente}")
+                try:
+                    evento = json.loads(linea)
+                except json.JSONDecodeError:
+                    pendiente = numero
+                    continue
+                yield evento
@@ -3,6 +3,10 @@ from .especialidad import Especialidad
 
 
 class Medico:
+    __slots__ = (
+        "__nombre__", "__matricula__", "__especialidades__", "__especialidad_por_dia__", "__duracion_por_dia__",
+        "__observadores__",
+    )
 
     def __init__(self, nombre: str, matricula: str):
 
@@ -14,6 +18,27 @@ class Medico:
         self.__nombre__ = nombre
         self.__matricula__ = matricula
         self.__especialidades__ = []
+        # Tabla día de la semana (0 = lunes) -> especialidad que atiende ese día
+        self.__especialidad_por_dia__ = [None] * 7
+        # Duración en minutos de los turnos de esa especialidad, en paralelo a la tabla anterior
+        self.__duracion_por_dia__ = [None] * 7
+        self.__observadores__ = []
+
+    @classmethod
+    def desde_registro(cls, nombre: str, matricula: str, especialidades=()) -> "Medico":
+        """Reconstruye un médico ya validado con sus especialidades, sin volver a validarlo."""
+        medico = cls.__new__(cls)
+        medico.__nombre__ = nombre
+        medico.__matricula__ = matricula
+        medico.__especialidades__ = list(especialidades)
+        medico.__especialidad_por_dia__ = [None] * 7
+        medico.__duracion_por_dia__ = [None] * 7
+        for especialidad in reversed(medico.__especialidades__):
+            for dia in especialidad.obtener_dias_semana():
+                medico.__especialidad_por_dia__[dia] = especialidad.obtener_especialidad()
+                medico.__duracion_por_dia__[dia] = especialidad.obtener_duracion_minutos()
+        medico.__observadores__ = []
+        return medico
 
     def agregar_especialidad(self, especialidad: Especialidad):
 
@@ -30,17 +55,48 @@ class Medico:
 
         self.__especialidades__.append(especialidad)
 
+        dias_nuevos = [dia for dia in especialidad.obtener_dias_semana() if self.__especialidad_por_dia__[dia] is None]
+        for dia in dias_nuevos:
+            self.__especialidad_por_dia__[dia] = especialidad.obtener_especialidad()
+            self.__duracion_por_dia__[dia] = especialidad.obtener_duracion_minutos()
+
+        # Los observadores (la clínica) persisten e indexan el cambio con el médico ya
+        # actualizado; si alguno falla, el médico vuelve a quedar como estaba
+        try:
+            for observador in self.__observadores__:
+                observador(self, especialidad)
+        except Exception:
+            self.__especialidades__.pop()
+            for dia in dias_nuevos:
+                self.__especialidad_por_dia__[dia] = None
+                self.__duracion_por_dia__[dia] = None
+            raise
+
+    def agregar_observador(self, observador):
+        """Registra una función observador(medico, especialidad) que se llama al agregar especialidades."""
+        self.__observadores__.append(observador)
+
     def obtener_matricula(self) -> str:
         return self.__matricula__
 
     def obtener_nombre(self) -> str:
         return self.__nombre__
 
-    def obtener_especialidad_para_dia(self, dia: str) -> str | None:
-        for especialidad in self.__especialidades__:
-            if especialidad.verificar_dia(dia):
-                return especialidad.obtener_especialidad()
-        return None
+    def obtener_especialidad_para_dia(self, dia: int | str) -> str | None:
+        """Acepta el día como entero de datetime.weekday() o como nombre en español."""
+        if isinstance(dia, str):
+            dia = dia.lower().strip()
+            if dia not in Especialidad.DIAS_VALIDOS:
+                return None
+            dia = Especialidad.DIAS_VALIDOS.index(dia)
+        elif not isinstance(dia, int) or not 0 <= dia < 7:
+            return None
+        return self.__especialidad_por_dia__[dia]
+
+    def obtener_duracion_para_dia(self, dia: int) -> int | None:
+        """Devuelve la duración en minutos de los turnos que atiende el día indicado (entero de
+        datetime.weekday()), o None si ese día no atiende."""
+        return self.__duracion_por_dia__[dia]
 
     def obtener_especialidades(self) -> list[Especialidad]:
         return self.__especialidades__.copy()
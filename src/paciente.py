@@ -1,7 +1,21 @@
 from datetime import datetime
+from functools import lru_cache
 from .excepciones import DatosInvalidosException
 
+
+@lru_cache(maxsize=65536)
+def _es_fecha_valida(fecha: str) -> bool:
+    """strptime es caro y las fechas de nacimiento se repiten mucho en altas masivas."""
+    try:
+        datetime.strptime(fecha, "%d/%m/%Y")
+    except ValueError:
+        return False
+    return True
+
+
 class Paciente:
+    __slots__ = ("__nombre", "__dni", "__fecha_nacimiento")
+
     def __init__(self, nombre: str, dni: str, fecha_nacimiento: str):
         self._validar_nombre(nombre)
         self._validar_dni(dni)
@@ -11,6 +25,15 @@ class Paciente:
         self.__dni = dni.strip()
         self.__fecha_nacimiento = fecha_nacimiento
 
+    @classmethod
+    def desde_registro(cls, nombre: str, dni: str, fecha_nacimiento: str) -> "Paciente":
+        """Reconstruye un paciente ya validado (journal, snapshot o base de datos) sin volver a validarlo."""
+        paciente = cls.__new__(cls)
+        paciente.__nombre = nombre
+        paciente.__dni = dni
+        paciente.__fecha_nacimiento = fecha_nacimiento
+        return paciente
+
     def _validar_nombre(self, nombre: str):
         """Valida que el nombre no esté vacío y solo contenga letras, espacios y puntos."""
         if not nombre or not nombre.strip():
@@ -39,9 +62,7 @@ class Paciente:
         if not fecha or not fecha.strip():
             raise DatosInvalidosException("La fecha de nacimiento no puede estar vacía")
         
-        try:
-            datetime.strptime(fecha, "%d/%m/%Y")
-        except ValueError:
+        if not _es_fecha_valida(fecha):
             raise DatosInvalidosException("La fecha debe tener formato dd/mm/aaaa y ser válida")
 
     def obtener_dni(self) -> str:
@@ -0,0 +1,21 @@
+class Pagina:
+    """Una página de un listado y el cursor para pedir la siguiente (None si es la última)."""
+
+    def __init__(self, elementos: list, siguiente=None):
+        self.__elementos = elementos
+        self.__siguiente = siguiente
+
+    def obtener_elementos(self) -> list:
+        return self.__elementos.copy()
+
+    def obtener_siguiente(self):
+        return self.__siguiente
+
+    def hay_siguiente(self) -> bool:
+        return self.__siguiente is not None
+
+    def __iter__(self):
+        return iter(self.__elementos)
+
+    def __len__(self) -> int:
+        return len(self.__elementos)
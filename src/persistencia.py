@@ -0,0 +1,170 @@
+import marshal
+import os
+import pickle
+import re
+import threading
+
+from .journal import Journal
+from .excepciones import DatosInvalidosException
+
+
+class Persistencia:
+    """Directorio con snapshots de la clínica y el journal partido en segmentos.
+
+    El snapshot N contiene el estado completo previo al segmento N, así que al
+    iniciar alcanza con cargar el último snapshot y reproducir los segmentos
+    desde N. Tras guardar un snapshot, los segmentos y snapshots anteriores se
+    eliminan (compactación).
+    """
+
+    # Versión 2: pickle con un protocolo fijo, legible desde cualquier versión de
+    # Python posterior. La versión 1 usaba marshal, cuyo formato puede cambiar
+    # entre versiones de Python: sólo se sigue leyendo para no perder snapshots ya escritos.
+    VERSION_SNAPSHOT = 2
+    PROTOCOLO_PICKLE = 5
+    PATRON_SEGMENTO = re.compile(r"^journal-(\d{6})\.log$")
+    PATRON_SNAPSHOT = re.compile(r"^snapshot-(\d{6})\.bin$")
+
+    def __init__(self, directorio: str, eventos_por_sincronizacion: int = 100,
+                 eventos_por_snapshot: int | None = None):
+        os.makedirs(directorio, exist_ok=True)
+        self.__directorio = directorio
+        self.__eventos_por_sincronizacion = eventos_por_sincronizacion
+        self.__eventos_por_snapshot = eventos_por_snapshot
+        self.__eventos_desde_snapshot = 0
+        # Protege el contador: registrar se llama desde varios hilos en modo concurrente
+        self.__bloqueo_contador = threading.Lock()
+        # Serializa la escritura de snapshots y la compactación
+        self.__bloqueo_snapshot = threading.Lock()
+        self.__ultimo_snapshot = 0
+        self.__journal = None
+        self.__segmento = None
+
+    def obtener_directorio(self) -> str:
+        return self.__directorio
+
+    def obtener_segmento_actual(self) -> int | None:
+        return self.__segmento
+
+    def _numeros(self, patron) -> list[int]:
+        numeros = []
+        for nombre in os.listdir(self.__directorio):
+            coincidencia = patron.match(nombre)
+            if coincidencia:
+                numeros.append(int(coincidencia.group(1)))
+        return sorted(numeros)
+
+    def _ruta_segmento(self, numero: int) -> str:
+        return os.path.join(self.__directorio, f"journal-{numero:06d}.log")
+
+    def _ruta_snapshot(self, numero: int) -> str:
+        return os.path.join(self.__directorio, f"snapshot-{numero:06d}.bin")
+
+    # LECTURA AL INICIAR
+
+    def cargar_ultimo_snapshot(self) -> tuple[int, dict] | None:
+        """Devuelve (número, estado) del snapshot más reciente, o None si no hay."""
+        numeros = self._numeros(self.PATRON_SNAPSHOT)
+        if not numeros:
+            return None
+        with open(self._ruta_snapshot(numeros[-1]), "rb") as archivo:
+            # Todo pickle de protocolo 2 o mayor empieza con el opcode PROTO (0x80)
+            es_pickle = archivo.read(1) == b"\x80"
+            archivo.seek(0)
+            version, estado = pickle.load(archivo) if es_pickle else marshal.load(archivo)
+        if version not in (1, self.VERSION_SNAPSHOT):
+            raise DatosInvalidosException(f"Versión de snapshot no soportada: {version}")
+        return numeros[-1], estado
+
+    def leer_eventos_desde(self, numero: int):
+        """Genera en orden los eventos de los segmentos con número mayor o igual a `numero`."""
+        for segmento in self._numeros(self.PATRON_SEGMENTO):
+            if segmento >= numero:
+                yield from Journal.leer(self._ruta_segmento(segmento))
+
+    # ESCRITURA
+
+    def abrir(self):
+        """Abre para escritura el último segmento (o el siguiente al último snapshot)."""
+        segmentos = self._numeros(self.PATRON_SEGMENTO)
+        snapshots = self._numeros(self.PATRON_SNAPSHOT)
+        ultimo = max(segmentos[-1:] + snapshots[-1:] + [1])
+        self._abrir_segmento(ultimo)
+
+    def _abrir_segmento(self, numero: int):
+        if self.__journal is not None:
+            self.__journal.cerrar()
+        self.__journal = Journal(self._ruta_segmento(numero), self.__eventos_por_sincronizacion)
+        self.__segmento = numero
+
+    def registrar(self, *eventos: dict):
+        if self.__journal is None:
+            raise DatosInvalidosException("La persistencia no está abierta para escritura")
+        self.__journal.registrar(*eventos)
+        with self.__bloqueo_contador:
+            self.__eventos_desde_snapshot += len(eventos)
+
+    def requiere_snapshot(self) -> bool:
+        with self.__bloqueo_contador:
+            return self._requiere_snapshot()
+
+    def _requiere_snapshot(self) -> bool:
+        return (self.__eventos_por_snapshot is not None
+                and self.__eventos_desde_snapshot >= self.__eventos_por_snapshot)
+
+    def reservar_snapshot(self) -> bool:
+        """Si corresponde un snapshot, reinicia el contador y devuelve True.
+
+        Consultar y reiniciar es una sola operación bajo el bloqueo: de varios
+        hilos que cruzan el umbral a la vez, sólo uno recibe True y toma el
+        snapshot.
+        """
+        with self.__bloqueo_contador:
+            if not self._requiere_snapshot():
+                return False
+            self.__eventos_desde_snapshot = 0
+            return True
+
+    def rotar(self) -> int:
+        """Cierra el segmento actual y abre uno nuevo; devuelve su número.
+
+        El contador de eventos pasa a contar los del segmento nuevo, que son
+        los que el próximo snapshot no cubre.
+        """
+        with self.__bloqueo_contador:
+            self._abrir_segmento(self.__segmento + 1)
+            self.__eventos_desde_snapshot = 0
+        return self.__segmento
+
+    def guardar_snapshot(self, numero: int, estado: dict):
+        """Guarda el estado previo al segmento `numero` y compacta lo anterior.
+
+        Si mientras tanto otro hilo ya guardó un snapshot más nuevo, este no
+        se escribe: quedaría cubierto por aquel.
+        """
+        with self.__bloqueo_snapshot:
+            if numero <= self.__ultimo_snapshot:
+                return
+            ruta = self._ruta_snapshot(numero)
+            temporal = ruta + ".tmp"
+            with open(temporal, "wb") as archivo:
+                pickle.dump((self.VERSION_SNAPSHOT, estado), archivo, protocol=self.PROTOCOLO_PICKLE)
+                archivo.flush()
+                os.fsync(archivo.fileno())
+            os.replace(temporal, ruta)
+            self.__ultimo_snapshot = numero
+            self.compactar(numero)
+
+    def compactar(self, numero: int):
+        """Elimina los segmentos y snapshots cubiertos por el snapshot `numero`."""
+        for segmento in self._numeros(self.PATRON_SEGMENTO):
+            if segmento < numero:
+                os.remove(self._ruta_segmento(segmento))
+        for snapshot in self._numeros(self.PATRON_SNAPSHOT):
+            if snapshot < numero:
+                os.remove(self._ruta_snapshot(snapshot))
+
+    def cerrar(self):
+        if self.__journal is not None:
+            self.__journal.cerrar()
+            self.__journal = None
@@ -1,15 +1,34 @@
 from datetime import datetime
 from .excepciones import DatosInvalidosException, RecetaInvalidaException
+from .reloj import RELOJ_SISTEMA, Reloj, a_instante, desde_instante
+
+
+def _limpiar(medicamento: str) -> str:
+    # Colapsa los espacios repetidos; si no hay nada que cambiar conserva el mismo texto
+    limpio = " ".join(medicamento.split())
+    return medicamento if limpio == medicamento else limpio
 
 
 class Receta:
-    def _init_(self, paciente, medico, medicamentos: list[str]):
+    __slots__ = ("__paciente", "__medico", "__medicamentos", "__instante")
+
+    def __init__(self, paciente, medico, medicamentos: list[str], reloj: Reloj = RELOJ_SISTEMA):
         self._validar_parametros(paciente, medico, medicamentos)
         
         self.__paciente = paciente
         self.__medico = medico
-        self.__medicamentos = [med.strip() for med in medicamentos if med.strip()]
-        self.__fecha = datetime.now()
+        self.__medicamentos = tuple(_limpiar(med) for med in medicamentos if med.strip())
+        self.__instante = reloj.instante()
+
+    @classmethod
+    def desde_registro(cls, paciente, medico, medicamentos: list[str], fecha: datetime | int) -> "Receta":
+        """Reconstruye una receta ya validada conservando su fecha de emisión (datetime o instante entero)."""
+        receta = cls.__new__(cls)
+        receta.__paciente = paciente
+        receta.__medico = medico
+        receta.__medicamentos = tuple(medicamentos)
+        receta.__instante = fecha if isinstance(fecha, int) else a_instante(fecha)
+        return receta
 
     def _validar_parametros(self, paciente, medico, medicamentos):
         """Valida que todos los parámetros sean válidos."""
@@ -33,12 +52,17 @@ class Receta:
         return self.__medico
 
     def obtener_medicamentos(self) -> list[str]:
-        return self.__medicamentos.copy()
+        """Devuelve los medicamentos tal como se escribieron en esta receta."""
+        return list(self.__medicamentos)
 
     def obtener_fecha(self) -> datetime:
-        return self.__fecha
+        return desde_instante(self.__instante)
+
+    def obtener_instante(self) -> int:
+        """Devuelve la fecha de emisión en microsegundos desde 1970."""
+        return self.__instante
 
-    def _str_(self) -> str:
-        medicamentos_str = ', '.join(self.__medicamentos)
-        fecha_str = self.__fecha.strftime("%d/%m/%Y %H:%M")
-        return f"Receta: {self._paciente.obtener_nombre()}, Dr. {self._medico.obtener_nombre()}, Medicamentos: {medicamentos_str}, Fecha: {fecha_str}"
+    def __str__(self) -> str:
+        medicamentos_str = ', '.join(self.obtener_medicamentos())
+        fecha_str = desde_instante(self.__instante).strftime("%d/%m/%Y %H:%M")
+        return f"Receta: {self.__paciente.obtener_nombre()}, Dr. {self.__medico.obtener_nombre()}, Medicamentos: {medicamentos_str}, Fecha: {fecha_str}"
@@ -0,0 +1,52 @@
+from datetime import datetime, timedelta
+
+EPOCA = datetime(1970, 1, 1)
+MICROSEGUNDO = timedelta(microseconds=1)
+MICROSEGUNDOS_POR_MINUTO = 60_000_000
+
+
+def a_instante(fecha: datetime) -> int:
+    """Convierte una fecha (sin zona horaria) a microsegundos desde 1970."""
+    return (fecha - EPOCA) // MICROSEGUNDO
+
+
+def desde_instante(instante: int) -> datetime:
+    """Convierte microsegundos desde 1970 a datetime."""
+    return EPOCA + timedelta(microseconds=instante)
+
+
+class Reloj:
+    """Fuente de la hora actual de la clínica (por defecto, la del sistema).
+
+    Se inyecta en Clinica, Turno y Receta para poder fijar la hora en pruebas
+    y para que todo un lote use la misma hora (ver congelar).
+    """
+
+    def ahora(self) -> datetime:
+        return datetime.now()
+
+    def instante(self) -> int:
+        """Devuelve la hora actual en microsegundos desde 1970."""
+        return a_instante(self.ahora())
+
+    def congelar(self) -> "RelojFijo":
+        """Devuelve un reloj detenido en la hora actual, para usar durante un lote."""
+        return RelojFijo(self.ahora())
+
+
+class RelojFijo(Reloj):
+    """Reloj que siempre devuelve la misma hora."""
+
+    def __init__(self, fecha: datetime):
+        self.__fecha = fecha
+        self.__instante = a_instante(fecha)
+
+    def ahora(self) -> datetime:
+        return self.__fecha
+
+    def instante(self) -> int:
+        return self.__instante
+
+
+# Reloj por defecto de todo el proceso
+RELOJ_SISTEMA = Reloj()
@@ -0,0 +1,32 @@
+class ReporteImportacion:
+    """Resultado de una importación: cantidad de registros importados y errores por línea."""
+
+    def __init__(self, ruta: str):
+        self.__ruta = ruta
+        self.__importados = 0
+        self.__errores = {}
+
+    def registrar_importados(self, cantidad: int):
+        self.__importados += cantidad
+
+    def registrar_error(self, linea: int, error: Exception):
+        self.__errores[linea] = error
+
+    def obtener_ruta(self) -> str:
+        return self.__ruta
+
+    def obtener_importados(self) -> int:
+        return self.__importados
+
+    def obtener_errores(self) -> dict:
+        """Devuelve las excepciones de las filas rechazadas, indexadas por número de línea."""
+        return self.__errores.copy()
+
+    def es_exitoso(self) -> bool:
+        return not self.__errores
+
+    def __str__(self) -> str:
+        lineas = [f"{self.__ruta}: importados {self.__importados}, rechazados {len(self.__errores)}"]
+        for linea in sorted(self.__errores):
+            lineas.append(f"- Línea {linea}: {self.__errores[linea]}")
+        return "\n".join(lineas)
@@ -0,0 +1,174 @@
+from datetime import date, datetime, time, timedelta
+
+from .excepciones import DatosInvalidosException, DependenciaNoDisponibleException
+from .reloj import MICROSEGUNDOS_POR_MINUTO, a_instante
+
+try:
+    import numpy as np
+except ImportError:  # NumPy es opcional: sólo lo usan los reportes
+    np = None
+
+_MINUTOS_POR_DIA = 24 * 60
+
+
+def _minutos(hora: time) -> int:
+    return hora.hour * 60 + hora.minute
+
+
+def _dividir(numerador, denominador):
+    """Divide elemento a elemento; donde el denominador es 0 el resultado es NaN."""
+    resultado = np.full(np.shape(numerador), np.nan)
+    np.divide(numerador, denominador, out=resultado, where=denominador > 0)
+    return resultado
+
+
+class ReporteOcupacion:
+    """Ocupación y capacidad de la clínica en matrices médico × día × bloque horario.
+
+    El eje 0 son los médicos en orden de alta (obtener_matriculas), el eje 1
+    los días de [desde, hasta) y el eje 2 los bloques de `minutos_bloque` del
+    horario de atención de la clínica. Cada celda guarda minutos: `ocupacion`
+    los cubiertos por turnos vigentes y `capacidad` los que el médico atiende
+    (el bloque entero, los días de la semana en que tiene especialidad).
+
+    Los inicios y las duraciones de los turnos se leen de las agendas como
+    enteros, sin armar ni recorrer objetos Turno, y todas las cuentas se hacen
+    con operaciones de NumPy sobre arrays. Cada turno ocupa la duración que
+    tiene guardada, aunque la de su especialidad haya cambiado después. Un
+    turno que cruza el final de un bloque suma a cada bloque los minutos que
+    le tocan; lo que cae fuera del horario de atención no se cuenta.
+
+    Necesita NumPy; sin él, crear el reporte lanza DependenciaNoDisponibleException.
+    """
+
+    def __init__(self, clinica, desde: date, hasta: date, minutos_bloque: int = 30):
+        if np is None:
+            raise DependenciaNoDisponibleException("Los reportes de ocupación necesitan NumPy (pip install numpy)")
+        if isinstance(desde, datetime) or isinstance(hasta, datetime) \
+                or not isinstance(desde, date) or not isinstance(hasta, date):
+            raise DatosInvalidosException("Las fechas desde y hasta deben ser objetos date")
+        if hasta <= desde:
+            raise DatosInvalidosException("La fecha hasta debe ser posterior a desde")
+        inicio_jornada = _minutos(clinica.HORA_INICIO_ATENCION)
+        jornada = _minutos(clinica.HORA_FIN_ATENCION) - inicio_jornada
+        if not isinstance(minutos_bloque, int) or isinstance(minutos_bloque, bool) \
+                or not 0 < minutos_bloque <= jornada:
+            raise DatosInvalidosException(f"El bloque debe durar entre 1 y {jornada} minutos")
+
+        medicos = clinica.obtener_medicos()
+        cantidad_dias = (hasta - desde).days
+        cantidad_bloques = jornada // minutos_bloque
+        self.__matriculas = [medico.obtener_matricula() for medico in medicos]
+        self.__desde = desde
+        self.__minutos_bloque = minutos_bloque
+        self.__inicio_jornada = inicio_jornada
+
+        # Médico × día de la semana -> si ese día atiende alguna especialidad
+        atiende = np.array(
+            [[medico.obtener_especialidad_para_dia(dia) is not None for dia in range(7)] for medico in medicos],
+            dtype=bool,
+        ).reshape(len(medicos), 7)
+        self.__dia_semana = (np.arange(cantidad_dias) + desde.weekday()) % 7
+
+        forma = (len(medicos), cantidad_dias, cantidad_bloques)
+        capacidad = np.zeros(forma, dtype=np.uint16)
+        capacidad[atiende[:, self.__dia_semana]] = minutos_bloque
+        self.__capacidad = capacidad
+
+        ocupacion = self._calcular_ocupacion(clinica, forma)
+        self.__ocupacion = ocupacion.astype(np.uint16).reshape(forma)
+        # Se entregan sin copiar: que nadie los modifique por error
+        self.__capacidad.flags.writeable = False
+        self.__ocupacion.flags.writeable = False
+
+    def _calcular_ocupacion(self, clinica, forma: tuple):
+        """Devuelve los minutos ocupados de cada celda, aplanados en el orden de `forma`."""
+        cantidad_medicos, cantidad_dias, cantidad_bloques = forma
+        minutos_bloque = self.__minutos_bloque
+        origen = datetime.combine(self.__desde, time())
+        fin = origen + timedelta(days=cantidad_dias)
+
+        por_medico = [clinica.obtener_intervalos_turnos_medico(matricula, origen, fin)
+                      for matricula in self.__matriculas]
+        medico = np.repeat(np.arange(cantidad_medicos), [len(instantes) for instantes, _ in por_medico])
+        vacio = [np.empty(0, dtype=np.int64)]
+        instantes = np.concatenate(vacio + [np.array(instantes, dtype=np.int64) for instantes, _ in por_medico])
+        duraciones = np.concatenate(vacio + [np.array(duraciones, dtype=np.int64) for _, duraciones in por_medico])
+
+        minutos = (instantes - a_instante(origen)) // MICROSEGUNDOS_POR_MINUTO
+        dia, minuto_del_dia = np.divmod(minutos, _MINUTOS_POR_DIA)
+        inicio = minuto_del_dia - self.__inicio_jornada
+        final = inicio + duraciones
+        # Sólo la parte de cada turno dentro de los bloques del día
+        limite = cantidad_bloques * minutos_bloque
+        inicio = np.clip(inicio, 0, limite)
+        final = np.clip(final, 0, limite)
+        validos = final > inicio
+        medico, dia, inicio, final = medico[validos], dia[validos], inicio[validos], final[validos]
+
+        primero = inicio // minutos_bloque
+        ultimo = (final - 1) // minutos_bloque
+        celda_dia = (medico * cantidad_dias + dia) * cantidad_bloques
+        ocupacion = np.zeros(cantidad_medicos * cantidad_dias * cantidad_bloques)
+        # Una pasada por cada bloque que puede abarcar un turno (1 o 2 en general), no por turno
+        for desplazamiento in range(int((ultimo - primero).max(initial=-1)) + 1):
+            bloque = primero + desplazamiento
+            abarca = bloque <= ultimo
+            bloque = bloque[abarca]
+            cubiertos = (np.minimum(final[abarca], (bloque + 1) * minutos_bloque)
+                         - np.maximum(inicio[abarca], bloque * minutos_bloque))
+            ocupacion += np.bincount(celda_dia[abarca] + bloque, weights=cubiertos, minlength=ocupacion.size)
+        return ocupacion
+
+    def obtener_matriculas(self) -> list[str]:
+        return self.__matriculas.copy()
+
+    def obtener_dias(self) -> list[date]:
+        return [self.__desde + timedelta(days=i) for i in range(len(self.__dia_semana))]
+
+    def obtener_bloques(self) -> list[time]:
+        """Devuelve la hora de inicio de cada bloque."""
+        return [time(*divmod(self.__inicio_jornada + i * self.__minutos_bloque, 60))
+                for i in range(self.__capacidad.shape[2])]
+
+    def obtener_ocupacion(self):
+        """Devuelve los minutos ocupados por celda (médico × día × bloque), de sólo lectura."""
+        return self.__ocupacion
+
+    def obtener_capacidad(self):
+        """Devuelve los minutos de atención por celda (médico × día × bloque), de sólo lectura."""
+        return self.__capacidad
+
+    def obtener_capacidad_ociosa(self):
+        """Devuelve los minutos de atención sin turno por celda."""
+        return np.maximum(self.__capacidad.astype(np.int32) - self.__ocupacion, 0)
+
+    def utilizacion(self) -> float:
+        """Fracción de la capacidad total ocupada por turnos (NaN si no hay capacidad)."""
+        return float(_dividir(self.__ocupacion.sum(dtype=np.int64), self.__capacidad.sum(dtype=np.int64)))
+
+    def utilizacion_por_medico(self):
+        """Fracción ocupada de la capacidad de cada médico, en el orden de obtener_matriculas."""
+        return _dividir(self.__ocupacion.sum(axis=(1, 2), dtype=np.int64),
+                        self.__capacidad.sum(axis=(1, 2), dtype=np.int64))
+
+    def utilizacion_por_dia_y_bloque(self):
+        """Matriz día × bloque con la fracción ocupada de toda la clínica (mapa de calor)."""
+        return _dividir(self.__ocupacion.sum(axis=0, dtype=np.int64), self.__capacidad.sum(axis=0, dtype=np.int64))
+
+    def utilizacion_por_dia_semana_y_bloque(self):
+        """Matriz 7 × bloque (0 = lunes) con la fracción ocupada, sumando todas las semanas."""
+        ocupacion = np.zeros((7, self.__capacidad.shape[2]), dtype=np.int64)
+        capacidad = np.zeros_like(ocupacion)
+        np.add.at(ocupacion, self.__dia_semana, self.__ocupacion.sum(axis=0, dtype=np.int64))
+        np.add.at(capacidad, self.__dia_semana, self.__capacidad.sum(axis=0, dtype=np.int64))
+        return _dividir(ocupacion, capacidad)
+
+    def horas_pico(self, cantidad: int = 3) -> list[tuple[time, float]]:
+        """Devuelve los `cantidad` bloques del día con mayor utilización, de mayor a menor."""
+        por_bloque = _dividir(self.__ocupacion.sum(axis=(0, 1), dtype=np.int64),
+                              self.__capacidad.sum(axis=(0, 1), dtype=np.int64))
+        # argsort estable sobre los valores negados: a igual utilización, el bloque más temprano
+        orden = np.argsort(-np.nan_to_num(por_bloque, nan=-1.0), kind="stable")[:cantidad]
+        bloques = self.obtener_bloques()
+        return [(bloques[i], float(por_bloque[i])) for i in orden if not np.isnan(por_bloque[i])]
@@ -0,0 +1,33 @@
+from contextlib import contextmanager
+
+
+class Repositorio:
+    """Almacenamiento de los datos de la clínica.
+
+    Clinica le pasa a `transaccion` los mismos eventos que registra en el journal
+    (altas de pacientes, médicos y especialidades, turnos y recetas) antes de
+    aplicarlos, y al crearse se carga con los eventos de `leer_eventos`.
+
+    Esta implementación base es la que se usa por defecto: no guarda nada y
+    los datos viven sólo en la memoria del proceso.
+    """
+
+    def leer_eventos(self):
+        """Genera los eventos que reconstruyen el estado guardado."""
+        return iter(())
+
+    def guardar(self, *eventos: dict):
+        """Guarda uno o más eventos; si alguno es rechazado no se guarda ninguno."""
+        with self.transaccion(*eventos):
+            pass
+
+    @contextmanager
+    def transaccion(self, *eventos: dict):
+        """Guarda los eventos y confirma al salir del bloque; si el bloque falla no se guarda ninguno.
+
+        Los rechazos del repositorio se lanzan al entrar, antes de ejecutar el bloque.
+        """
+        yield
+
+    def cerrar(self):
+        """Libera los recursos del repositorio."""
@@ -0,0 +1,249 @@
+import json
+import queue
+import sqlite3
+from contextlib import contextmanager
+from itertools import groupby
+
+from .repositorio import Repositorio
+from .excepciones import (
+    PacienteDuplicadoException,
+    MedicoDuplicadoException,
+    EspecialidadDuplicadaException,
+    TurnoOcupadoException,
+    DatosInvalidosException
+)
+
+ESQUEMA = """
+CREATE TABLE IF NOT EXISTS pacientes (
+    dni TEXT PRIMARY KEY,
+    nombre TEXT NOT NULL,
+    fecha_nacimiento TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS medicos (
+    matricula TEXT PRIMARY KEY,
+    nombre TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS especialidades (
+    id INTEGER PRIMARY KEY,
+    matricula TEXT NOT NULL REFERENCES medicos (matricula),
+    tipo TEXT NOT NULL,
+    dias TEXT NOT NULL,
+    duracion_minutos INTEGER NOT NULL DEFAULT 30,
+    UNIQUE (matricula, tipo)
+);
+CREATE TABLE IF NOT EXISTS turnos (
+    id INTEGER PRIMARY KEY,
+    dni TEXT NOT NULL REFERENCES pacientes (dni),
+    matricula TEXT NOT NULL REFERENCES medicos (matricula),
+    especialidad TEXT NOT NULL,
+    fecha_hora TEXT NOT NULL,
+    duracion_minutos INTEGER NOT NULL DEFAULT 30,
+    UNIQUE (matricula, fecha_hora)
+);
+CREATE INDEX IF NOT EXISTS turnos_dni ON turnos (dni);
+CREATE TABLE IF NOT EXISTS turnos_cancelados (
+    id INTEGER PRIMARY KEY,
+    dni TEXT NOT NULL REFERENCES pacientes (dni),
+    matricula TEXT NOT NULL REFERENCES medicos (matricula),
+    especialidad TEXT NOT NULL,
+    fecha_hora TEXT NOT NULL,
+    duracion_minutos INTEGER NOT NULL DEFAULT 30
+);
+CREATE TABLE IF NOT EXISTS recetas (
+    id INTEGER PRIMARY KEY,
+    dni TEXT NOT NULL REFERENCES pacientes (dni),
+    matricula TEXT NOT NULL REFERENCES medicos (matricula),
+    medicamentos TEXT NOT NULL,
+    fecha TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS recetas_dni ON recetas (dni);
+"""
+
+INSERTAR_PACIENTE = "INSERT INTO pacientes (dni, nombre, fecha_nacimiento) VALUES (?, ?, ?)"
+INSERTAR_MEDICO = "INSERT INTO medicos (matricula, nombre) VALUES (?, ?)"
+INSERTAR_ESPECIALIDAD = "INSERT INTO especialidades (matricula, tipo, dias, duracion_minutos) VALUES (?, ?, ?, ?)"
+INSERTAR_TURNO = """INSERT INTO turnos (dni, matricula, especialidad, fecha_hora, duracion_minutos)
+VALUES (?, ?, ?, ?, ?)"""
+INSERTAR_RECETA = "INSERT INTO recetas (dni, matricula, medicamentos, fecha) VALUES (?, ?, ?, ?)"
+# Cancelar mueve la fila a turnos_cancelados: el horario queda libre para la restricción UNIQUE
+ARCHIVAR_TURNO = """INSERT INTO turnos_cancelados (dni, matricula, especialidad, fecha_hora, duracion_minutos)
+SELECT dni, matricula, especialidad, fecha_hora, duracion_minutos FROM turnos WHERE matricula = ? AND fecha_hora = ?"""
+
+# Columnas agregadas después de crear el esquema: tabla -> [(columna, definición)]
+_COLUMNAS_NUEVAS = {
+    "especialidades": [("duracion_minutos", "INTEGER NOT NULL DEFAULT 30")],
+    "turnos": [("duracion_minutos", "INTEGER NOT NULL DEFAULT 30")],
+    "turnos_cancelados": [("duracion_minutos", "INTEGER NOT NULL DEFAULT 30")],
+}
+BORRAR_TURNO = "DELETE FROM turnos WHERE matricula = ? AND fecha_hora = ?"
+
+# Tabla de la restricción violada -> excepción de la clínica equivalente
+_ERRORES_UNICIDAD = {
+    "pacientes": PacienteDuplicadoException,
+    "medicos": MedicoDuplicadoException,
+    "especialidades": EspecialidadDuplicadaException,
+    "turnos": TurnoOcupadoException,
+}
+
+
+class RepositorioSQLite(Repositorio):
+    """Guarda la clínica en una base SQLite local.
+
+    Las conexiones se reparten desde un pool de tamaño fijo, así varios hilos
+    de una clínica concurrente pueden leer y escribir a la vez (la base usa
+    WAL). Las sentencias son siempre las mismas con parámetros, de modo que
+    sqlite3 las prepara una vez por conexión. Cada llamada a `transaccion` (o
+    a `guardar`) es una transacción de la base, y los eventos consecutivos del mismo tipo se insertan con
+    un único executemany.
+    """
+
+    def __init__(self, ruta: str, tamano_pool: int = 4, espera_bloqueo: float = 30.0):
+        if tamano_pool < 1:
+            raise DatosInvalidosException("El pool debe tener al menos una conexión")
+        # Cada conexión a ":memory:" abriría una base distinta
+        if ruta == ":memory:":
+            tamano_pool = 1
+
+        self.__ruta = ruta
+        self.__espera_bloqueo = espera_bloqueo
+        self.__conexiones = queue.LifoQueue()
+        self.__todas = [self._conectar() for _ in range(tamano_pool)]
+        for conexion in self.__todas:
+            self.__conexiones.put(conexion)
+        self.__cerrado = False
+
+        with self._conexion() as conexion:
+            conexion.executescript(ESQUEMA)
+            self._migrar(conexion)
+
+    def _migrar(self, conexion: sqlite3.Connection):
+        """Agrega a una base creada con un esquema anterior las columnas que le faltan."""
+        for tabla, columnas in _COLUMNAS_NUEVAS.items():
+            existentes = {fila[1] for fila in conexion.execute(f"PRAGMA table_info({tabla})")}
+            for columna, definicion in columnas:
+                if columna not in existentes:
+                    conexion.execute(f"ALTER TABLE {tabla} ADD COLUMN {columna} {definicion}")
+
+    def obtener_ruta(self) -> str:
+        return self.__ruta
+
+    def _conectar(self) -> sqlite3.Connection:
+        # isolation_level=None: las transacciones se abren explícitamente en guardar
+        conexion = sqlite3.connect(self.__ruta, timeout=self.__espera_bloqueo,
+                                   isolation_level=None, check_same_thread=False)
+        conexion.execute("PRAGMA journal_mode = WAL")
+        conexion.execute("PRAGMA synchronous = NORMAL")
+        conexion.execute("PRAGMA foreign_keys = ON")
+        return conexion
+
+    @contextmanager
+    def _conexion(self):
+        """Presta una conexión del pool, esperando si están todas en uso."""
+        if self.__cerrado:
+            raise DatosInvalidosException("El repositorio está cerrado")
+        conexion = self.__conexiones.get()
+        try:
+            yield conexion
+        finally:
+            self.__conexiones.put(conexion)
+
+    @contextmanager
+    def transaccion(self, *eventos: dict):
+        with self._conexion() as conexion:
+            conexion.execute("BEGIN IMMEDIATE")
+            try:
+                for operacion, grupo in groupby(eventos, key=lambda evento: evento.get("op")):
+                    self._insertar(conexion, operacion, list(grupo))
+                yield
+            except BaseException as e:
+                conexion.execute("ROLLBACK")
+                if isinstance(e, sqlite3.IntegrityError):
+                    raise self._traducir_error(e) from e
+                raise
+            conexion.execute("COMMIT")
+
+    def _insertar(self, conexion: sqlite3.Connection, operacion: str, eventos: list[dict]):
+        if operacion == "turno":
+            conexion.executemany(INSERTAR_TURNO, [
+                (e["dni"], e["matricula"], e["especialidad"], e["fecha_hora"], e["duracion_minutos"]) for e in eventos
+            ])
+        elif operacion == "cancelacion":
+            horarios = [(e["matricula"], e["fecha_hora"]) for e in eventos]
+            conexion.executemany(ARCHIVAR_TURNO, horarios)
+            conexion.executemany(BORRAR_TURNO, horarios)
+        elif operacion == "receta":
+            conexion.executemany(INSERTAR_RECETA, [
+                (e["dni"], e["matricula"], json.dumps(e["medicamentos"], ensure_ascii=False), e["fecha"])
+                for e in eventos
+            ])
+        elif operacion == "paciente":
+            conexion.executemany(INSERTAR_PACIENTE, [
+                (e["dni"], e["nombre"], e["fecha_nacimiento"]) for e in eventos
+            ])
+        elif operacion == "medico":
+            conexion.executemany(INSERTAR_MEDICO, [(e["matricula"], e["nombre"]) for e in eventos])
+            conexion.executemany(INSERTAR_ESPECIALIDAD, [
+                (e["matricula"], esp["tipo"], json.dumps(esp["dias"], ensure_ascii=False), esp["duracion_minutos"])
+                for e in eventos for esp in e["especialidades"]
+            ])
+        elif operacion == "especialidad":
+            conexion.executemany(INSERTAR_ESPECIALIDAD, [
+                (e["matricula"], e["tipo"], json.dumps(e["dias"], ensure_ascii=False), e["duracion_minutos"])
+                for e in eventos
+            ])
+        else:
+            raise DatosInvalidosException(f"Evento desconocido: {operacion}")
+
+    def _traducir_error(self, error: sqlite3.IntegrityError) -> Exception:
+        """Convierte una violación de restricción en la excepción de dominio correspondiente.
+
+        Protege contra escrituras de otro proceso sobre la misma base, que la
+        clínica en memoria no puede haber validado.
+        """
+        mensaje = str(error)
+        if mensaje.startswith("UNIQUE constraint failed: "):
+            tabla = mensaje.removeprefix("UNIQUE constraint failed: ").split(".")[0]
+            if tabla in _ERRORES_UNICIDAD:
+                return _ERRORES_UNICIDAD[tabla](f"Registro duplicado en la base de datos: {mensaje}")
+        return DatosInvalidosException(f"La base de datos rechazó los datos: {mensaje}")
+
+    def leer_eventos(self):
+        """Genera médicos, pacientes, turnos y recetas en el orden en que se guardaron.
+
+        Los turnos cancelados van antes que los vigentes, cada uno seguido de su
+        cancelación, así un horario liberado y vuelto a ocupar se reconstruye bien.
+        """
+        with self._conexion() as conexion:
+            especialidades = {}
+            for matricula, tipo, dias, duracion in conexion.execute(
+                    "SELECT matricula, tipo, dias, duracion_minutos FROM especialidades ORDER BY id"):
+                especialidades.setdefault(matricula, []).append(
+                    {"tipo": tipo, "dias": json.loads(dias), "duracion_minutos": duracion}
+                )
+
+            for matricula, nombre in conexion.execute("SELECT matricula, nombre FROM medicos ORDER BY rowid"):
+                yield {"op": "medico", "nombre": nombre, "matricula": matricula,
+                       "especialidades": especialidades.get(matricula, [])}
+            for dni, nombre, fecha_nacimiento in conexion.execute(
+                    "SELECT dni, nombre, fecha_nacimiento FROM pacientes ORDER BY rowid"):
+                yield {"op": "paciente", "nombre": nombre, "dni": dni, "fecha_nacimiento": fecha_nacimiento}
+            for dni, matricula, especialidad, fecha_hora, duracion in conexion.execute(
+                    "SELECT dni, matricula, especialidad, fecha_hora, duracion_minutos FROM turnos_cancelados ORDER BY id"):
+                yield {"op": "turno", "dni": dni, "matricula": matricula, "especialidad": especialidad,
+                       "fecha_hora": fecha_hora, "duracion_minutos": duracion}
+                yield {"op": "cancelacion", "matricula": matricula, "fecha_hora": fecha_hora}
+            for dni, matricula, especialidad, fecha_hora, duracion in conexion.execute(
+                    "SELECT dni, matricula, especialidad, fecha_hora, duracion_minutos FROM turnos ORDER BY id"):
+                yield {"op": "turno", "dni": dni, "matricula": matricula, "especialidad": especialidad,
+                       "fecha_hora": fecha_hora, "duracion_minutos": duracion}
+            for dni, matricula, medicamentos, fecha in conexion.execute(
+                    "SELECT dni, matricula, medicamentos, fecha FROM recetas ORDER BY id"):
+                yield {"op": "receta", "dni": dni, "matricula": matricula,
+                       "medicamentos": json.loads(medicamentos), "fecha": fecha}
+
+    def cerrar(self):
+        if self.__cerrado:
+            return
+        self.__cerrado = True
+        for conexion in self.__todas:
+            conexion.close()
@@ -0,0 +1,29 @@
+class ResultadoLote:
+    """Resultado de una operación por lote: turnos agendados y errores por fila."""
+
+    def __init__(self):
+        self.__turnos = {}
+        self.__errores = {}
+
+    def registrar_turno(self, indice: int, turno):
+        self.__turnos[indice] = turno
+
+    def registrar_error(self, indice: int, error: Exception):
+        self.__errores[indice] = error
+
+    def obtener_turnos(self) -> dict:
+        """Devuelve los turnos agendados, indexados por posición en el lote."""
+        return self.__turnos.copy()
+
+    def obtener_errores(self) -> dict:
+        """Devuelve las excepciones de las filas rechazadas, indexadas por posición."""
+        return self.__errores.copy()
+
+    def es_exitoso(self) -> bool:
+        return not self.__errores
+
+    def __str__(self) -> str:
+        lineas = [f"Turnos agendados: {len(self.__turnos)}, rechazados: {len(self.__errores)}"]
+        for indice in sorted(self.__errores):
+            lineas.append(f"- Fila {indice}: {self.__errores[indice]}")
+        return "\n".join(lineas)
@@ -1,17 +1,43 @@
 from datetime import datetime
+from .especialidad import Especialidad
 from .excepciones import DatosInvalidosException
+from .reloj import RELOJ_SISTEMA, Reloj, MICROSEGUNDOS_POR_MINUTO, a_instante, desde_instante
 
 
 class Turno:
-    def _init_(self, paciente, medico, fecha_hora: datetime, especialidad: str):
-        self._validar_parametros(paciente, medico, fecha_hora, especialidad)
+    # El horario se guarda como instante entero (microsegundos desde 1970):
+    # ocupa menos que un datetime y se compara y ordena más rápido
+    __slots__ = ("__paciente", "__medico", "__instante", "__especialidad", "__duracion_minutos", "__cancelado")
+
+    def __init__(self, paciente, medico, fecha_hora: datetime, especialidad: str, reloj: Reloj = RELOJ_SISTEMA,
+                 duracion_minutos: int = Especialidad.DURACION_PREDETERMINADA):
+        self._validar_parametros(paciente, medico, fecha_hora, especialidad, reloj)
+        Especialidad.validar_duracion(duracion_minutos)
         
         self.__paciente = paciente
         self.__medico = medico
-        self.__fecha_hora = fecha_hora
+        self.__instante = a_instante(fecha_hora)
         self.__especialidad = especialidad.strip()
+        self.__duracion_minutos = duracion_minutos
+        self.__cancelado = False
+
+    @classmethod
+    def desde_registro(cls, paciente, medico, fecha_hora: datetime | int, especialidad: str,
+                       duracion_minutos: int = Especialidad.DURACION_PREDETERMINADA) -> "Turno":
+        """Reconstruye un turno ya validado (journal, snapshot o base de datos), aunque sea pasado.
+        
+        El horario puede venir como datetime o como instante entero.
+        """
+        turno = cls.__new__(cls)
+        turno.__paciente = paciente
+        turno.__medico = medico
+        turno.__instante = fecha_hora if isinstance(fecha_hora, int) else a_instante(fecha_hora)
+        turno.__especialidad = especialidad
+        turno.__duracion_minutos = duracion_minutos
+        turno.__cancelado = False
+        return turno
 
-    def _validar_parametros(self, paciente, medico, fecha_hora, especialidad):
+    def _validar_parametros(self, paciente, medico, fecha_hora, especialidad, reloj):
         """Valida que todos los parámetros sean válidos."""
         if paciente is None:
             raise DatosInvalidosException("El paciente no puede ser None")
@@ -22,7 +48,7 @@ class Turno:
         if not isinstance(fecha_hora, datetime):
             raise DatosInvalidosException("La fecha_hora debe ser un objeto datetime")
         
-        if fecha_hora < datetime.now():
+        if fecha_hora < reloj.ahora():
             raise DatosInvalidosException("No se pueden agendar turnos en el pasado")
         
         if not especialidad or not especialidad.strip():
@@ -35,11 +61,33 @@ class Turno:
         return self.__medico
 
     def obtener_fecha_hora(self) -> datetime:
-        return self.__fecha_hora
+        return desde_instante(self.__instante)
+
+    def obtener_instante(self) -> int:
+        """Devuelve el horario en microsegundos desde 1970."""
+        return self.__instante
+
+    def obtener_instante_fin(self) -> int:
+        """Devuelve el final del turno en microsegundos desde 1970 (excluido del turno)."""
+        return self.__instante + self.__duracion_minutos * MICROSEGUNDOS_POR_MINUTO
+
+    def obtener_fecha_hora_fin(self) -> datetime:
+        return desde_instante(self.obtener_instante_fin())
+
+    def obtener_duracion_minutos(self) -> int:
+        return self.__duracion_minutos
 
     def obtener_especialidad(self) -> str:
         return self.__especialidad
 
-    def _str_(self) -> str:
-        fecha_str = self.__fecha_hora.strftime("%d/%m/%Y %H:%M")
-        return f"Turno: {self._paciente.obtener_nombre()}, Dr. {self.medico.obtener_nombre()}, {self._especialidad}, {fecha_str}"
+    def cancelar(self):
+        """Marca el turno como cancelado; sigue en la historia clínica del paciente."""
+        self.__cancelado = True
+
+    def esta_cancelado(self) -> bool:
+        return self.__cancelado
+
+    def __str__(self) -> str:
+        fecha_str = desde_instante(self.__instante).strftime("%d/%m/%Y %H:%M")
+        estado = " (cancelado)" if self.__cancelado else ""
+        return f"Turno: {self.__paciente.obtener_nombre()}, Dr. {self.__medico.obtener_nombre()}, {self.__especialidad}, {fecha_str}{estado}"
@@ -0,0 +1,52 @@
+from bisect import bisect_right
+from collections.abc import Sequence
+from itertools import chain, islice
+
+
+class VistaLista(Sequence):
+    """Vista de sólo lectura de una lista guardada en bloques, tal como estaba al crearse.
+
+    No copia los elementos: guarda una copia de la lista de bloques (uno cada
+    varios cientos de elementos) y el largo total en ese momento. Quien la crea
+    no modifica esos bloques salvo agregando al final del último, y cualquier
+    otro cambio lo hace sobre un bloque nuevo, así que la vista se comporta como
+    una copia tomada en ese momento (lo que se agregue después no aparece) pero
+    cuesta O(cantidad de bloques) crearla.
+    """
+
+    __slots__ = ("__bloques", "__inicios", "__largo")
+
+    def __init__(self, bloques: list):
+        self.__bloques = list(bloques)
+        self.__inicios = []
+        largo = 0
+        for bloque in self.__bloques:
+            self.__inicios.append(largo)
+            largo += len(bloque)
+        self.__largo = largo
+
+    def __len__(self) -> int:
+        return self.__largo
+
+    def __getitem__(self, indice):
+        if isinstance(indice, slice):
+            return [self[i] for i in range(*indice.indices(self.__largo))]
+        if indice < 0:
+            indice += self.__largo
+        if not 0 <= indice < self.__largo:
+            raise IndexError("índice fuera de rango")
+        bloque = bisect_right(self.__inicios, indice) - 1
+        return self.__bloques[bloque][indice - self.__inicios[bloque]]
+
+    def __iter__(self):
+        return islice(chain.from_iterable(self.__bloques), self.__largo)
+
+    def __eq__(self, otro) -> bool:
+        if isinstance(otro, (VistaLista, list, tuple)):
+            return len(self) == len(otro) and all(a == b for a, b in zip(self, otro))
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return f"VistaLista({list(self)!r})"
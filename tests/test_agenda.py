@@ -0,0 +1,99 @@
+import random
+import unittest
+from bisect import bisect_left, bisect_right
+from datetime import datetime
+
+from src.agenda import Agenda
+
+
+class TestAgenda(unittest.TestCase):
+
+    def setUp(self):
+        self.agenda = Agenda()
+        self.agenda.agregar(datetime(2030, 6, 3, 11, 0), "b")
+        self.agenda.agregar(datetime(2030, 6, 3, 9, 0), "a")
+        self.agenda.agregar(datetime(2030, 6, 5, 10, 0), "c")
+
+    def test_elementos_ordenados(self):
+        self.assertEqual(self.agenda.obtener_elementos(), ["a", "b", "c"])
+        self.assertEqual(len(self.agenda), 3)
+
+    def test_obtener_entre(self):
+        elementos = self.agenda.obtener_entre(datetime(2030, 6, 3), datetime(2030, 6, 4))
+        self.assertEqual(elementos, ["a", "b"])
+
+    def test_obtener_entre_excluye_hasta(self):
+        elementos = self.agenda.obtener_entre(datetime(2030, 6, 3, 9, 0), datetime(2030, 6, 3, 11, 0))
+        self.assertEqual(elementos, ["a"])
+
+    def test_obtener_claves_entre(self):
+        claves = self.agenda.obtener_claves_entre(datetime(2030, 6, 3, 9, 0), datetime(2030, 6, 5, 10, 0))
+        self.assertEqual(claves, [datetime(2030, 6, 3, 9, 0), datetime(2030, 6, 3, 11, 0)])
+
+    def test_obtener_siguientes(self):
+        self.assertEqual(self.agenda.obtener_siguientes(datetime(2030, 6, 3, 9, 0), 2), ["a", "b"])
+        self.assertEqual(self.agenda.obtener_siguientes(datetime(2030, 6, 3, 9, 0), 5, incluir_desde=False), ["b", "c"])
+        self.assertEqual(self.agenda.obtener_siguientes(datetime(2030, 6, 6), 5), [])
+
+    def test_quitar(self):
+        self.agenda.agregar(datetime(2030, 6, 3, 11, 0), "b2")
+        self.assertTrue(self.agenda.quitar(datetime(2030, 6, 3, 11, 0), "b2"))
+        self.assertFalse(self.agenda.quitar(datetime(2030, 6, 3, 9, 0), "c"))
+        self.assertEqual(self.agenda.obtener_elementos(), ["a", "b", "c"])
+
+    def test_obtener_anterior(self):
+        self.assertEqual(self.agenda.obtener_anterior(datetime(2030, 6, 3, 11, 0)), "a")
+        self.assertEqual(self.agenda.obtener_anterior(datetime(2030, 6, 3, 11, 1)), "b")
+        self.assertIsNone(self.agenda.obtener_anterior(datetime(2030, 6, 3, 9, 0)))
+
+    def test_obtener_vecinos(self):
+        self.assertEqual(self.agenda.obtener_vecinos(datetime(2030, 6, 3, 11, 0)), ("a", "b"))
+        self.assertEqual(self.agenda.obtener_vecinos(datetime(2030, 6, 3, 11, 0), saltear="b"), ("a", "c"))
+        self.assertEqual(self.agenda.obtener_vecinos(datetime(2030, 6, 3, 12, 0), saltear="b"), ("a", "c"))
+        self.assertEqual(self.agenda.obtener_vecinos(datetime(2030, 6, 6)), ("c", None))
+        self.assertEqual(self.agenda.obtener_vecinos(datetime(2030, 6, 1)), (None, "a"))
+
+    def test_obtener_proximo(self):
+        self.assertEqual(self.agenda.obtener_proximo(datetime(2030, 6, 3, 9, 30)), "b")
+        self.assertEqual(self.agenda.obtener_proximo(datetime(2030, 6, 3, 11, 0)), "b")
+        self.assertIsNone(self.agenda.obtener_proximo(datetime(2030, 6, 6)))
+
+    def test_bloques_contra_lista_ordenada(self):
+        """Con bloques chicos, agregar y quitar dividen y vacían bloques sin perder el orden."""
+        agenda = Agenda()
+        agenda.CARGA = 2
+        modelo = []
+        azar = random.Random(7)
+        for i in range(400):
+            clave = azar.randrange(60)
+            if modelo and azar.random() < 0.4:
+                quitada, elemento = modelo.pop(azar.randrange(len(modelo)))
+                self.assertTrue(agenda.quitar(quitada, elemento))
+            else:
+                modelo.insert(bisect_right([c for c, _ in modelo], clave), (clave, i))
+                agenda.agregar(clave, i, -i)
+            claves = [c for c, _ in modelo]
+            elementos = [e for _, e in modelo]
+            desde, hasta = sorted((azar.randrange(62), azar.randrange(62)))
+            inicio, fin = bisect_left(claves, desde), bisect_left(claves, hasta)
+            self.assertEqual(agenda.obtener_entre(desde, hasta), elementos[inicio:fin])
+            self.assertEqual(agenda.obtener_claves_entre(desde, hasta), claves[inicio:fin])
+            self.assertEqual(agenda.obtener_datos_entre(desde, hasta), [-e for e in elementos[inicio:fin]])
+            self.assertEqual(agenda.hay_entre(desde, hasta), inicio < fin)
+            self.assertEqual(agenda.obtener_anterior(desde), elementos[inicio - 1] if inicio else None)
+            self.assertEqual(agenda.obtener_siguientes(desde, 3, incluir_desde=False),
+                             elementos[bisect_right(claves, desde):][:3])
+            self.assertEqual(agenda.obtener_vecinos(desde),
+                             (elementos[inicio - 1] if inicio else None,
+                              elementos[inicio] if inicio < len(elementos) else None))
+            if 0 < inicio < len(elementos) - 1:
+                self.assertEqual(agenda.obtener_vecinos(desde, saltear=elementos[inicio]),
+                                 (elementos[inicio - 1], elementos[inicio + 1]))
+        self.assertEqual(agenda.obtener_elementos(), [e for _, e in modelo])
+        self.assertEqual(agenda.obtener_primeros(5), [e for _, e in modelo][:5])
+        self.assertEqual(len(agenda), len(modelo))
+        self.assertFalse(agenda.quitar(0, "ausente"))
+
+
+if __name__ == "__main__":
+    unittest.main()
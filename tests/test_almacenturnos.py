@@ -0,0 +1,84 @@
+import unittest
+from datetime import datetime
+
+from src.almacenturnos import AlmacenTurnos
+from src.paciente import Paciente
+from src.medico import Medico
+from src.turno import Turno
+from src.excepciones import DatosInvalidosException
+
+
+class TestAlmacenTurnos(unittest.TestCase):
+
+    def setUp(self):
+        self.paciente = Paciente("Juan Pérez", "12345678", "12/12/1990")
+        self.medico1 = Medico("Dr. Carlos Gómez", "1234")
+        self.medico2 = Medico("Dra. María García", "5678")
+        self.almacen = AlmacenTurnos()
+        self.almacen.agregar(self.paciente, self.medico1, "Pediatría", datetime(2030, 6, 3, 10, 0))
+        self.almacen.agregar(self.paciente, self.medico2, "Cardiología", datetime(2030, 6, 4, 10, 0))
+        self.almacen.agregar(self.paciente, self.medico1, "Pediatría", datetime(2030, 6, 3, 10, 30))
+
+    def test_materializar_turnos(self):
+        turno = self.almacen[1]
+
+        self.assertEqual(len(self.almacen), 3)
+        self.assertIs(turno.obtener_paciente(), self.paciente)
+        self.assertIs(turno.obtener_medico(), self.medico2)
+        self.assertEqual(turno.obtener_especialidad(), "Cardiología")
+        self.assertEqual(turno.obtener_fecha_hora(), datetime(2030, 6, 4, 10, 0))
+        self.assertEqual(self.almacen[-1].obtener_fecha_hora(), datetime(2030, 6, 3, 10, 30))
+        self.assertEqual([t.obtener_medico().obtener_matricula() for t in self.almacen], ["1234", "5678", "1234"])
+
+    def test_indices_medico_entre(self):
+        self.assertEqual(self.almacen.indices_medico_entre("1234", datetime(2030, 6, 3), datetime(2030, 6, 4)), [0, 2])
+        self.assertEqual(
+            self.almacen.indices_medico_entre("1234", datetime(2030, 6, 3, 10, 0, 30), datetime(2030, 6, 4)), [2]
+        )
+        self.assertEqual(self.almacen.indices_medico_entre("9999", datetime(2030, 1, 1), datetime(2031, 1, 1)), [])
+
+    def test_indices_medico_entre_fuera_de_orden(self):
+        for hora in (9, 12, 11, 9, 8):
+            self.almacen.agregar(self.paciente, self.medico1, "Pediatría", datetime(2030, 6, 3, hora, 0))
+
+        self.assertEqual(
+            self.almacen.indices_medico_entre("1234", datetime(2030, 6, 3), datetime(2030, 6, 4)), [7, 3, 6, 0, 2, 5, 4]
+        )
+        self.assertEqual(
+            self.almacen.indices_medico_entre("1234", datetime(2030, 6, 3, 9, 0), datetime(2030, 6, 3, 11, 0)), [3, 6, 0, 2]
+        )
+
+    def test_desde_turnos(self):
+        turnos = [Turno(self.paciente, self.medico1, datetime(2030, 6, 3, 11, 0), "Pediatría")]
+        almacen = AlmacenTurnos.desde_turnos(turnos)
+
+        self.assertEqual(almacen[0].obtener_fecha_hora(), datetime(2030, 6, 3, 11, 0))
+        self.assertEqual(almacen.obtener_minutos(0), (datetime(2030, 6, 3, 11, 0) - datetime(1970, 1, 1)).total_seconds() // 60)
+        self.assertEqual(almacen.obtener_bytes_por_turno(), 19)
+
+    def test_conserva_duracion(self):
+        turno = Turno(self.paciente, self.medico1, datetime(2030, 6, 3, 11, 0), "Pediatría", duracion_minutos=20)
+        self.almacen.agregar_turno(turno)
+
+        self.assertEqual(self.almacen[-1].obtener_duracion_minutos(), 20)
+        self.assertEqual([t.obtener_duracion_minutos() for t in self.almacen], [30, 30, 30, 20])
+
+    def test_conserva_cancelacion(self):
+        cancelado = Turno(self.paciente, self.medico1, datetime(2030, 6, 3, 11, 0), "Pediatría")
+        cancelado.cancelar()
+        almacen = AlmacenTurnos.desde_turnos(
+            [cancelado, Turno(self.paciente, self.medico1, datetime(2030, 6, 3, 11, 0), "Pediatría")]
+        )
+
+        self.assertTrue(almacen[0].esta_cancelado())
+        self.assertEqual([t.esta_cancelado() for t in almacen], [True, False])
+        self.assertEqual(almacen.obtener_bytes_por_turno(), 19)
+
+    def test_horario_con_segundos(self):
+        with self.assertRaises(DatosInvalidosException):
+            self.almacen.agregar(self.paciente, self.medico1, "Pediatría", datetime(2030, 6, 3, 10, 0, 30))
+        self.assertEqual(len(self.almacen), 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,101 @@
+import asyncio
+import unittest
+from datetime import datetime
+
+from src.asyncclinica import AsyncClinica
+from src.clinica import Clinica
+from src.paciente import Paciente
+from src.medico import Medico
+from src.especialidad import Especialidad
+from src.excepciones import (
+    DatosInvalidosException,
+    MedicoNoEncontradoException,
+    PacienteNoEncontradoException,
+    TurnoOcupadoException,
+)
+
+
+class ClinicaContadora(Clinica):
+    """Clínica que cuenta cuántos lotes recibe."""
+
+    def __init__(self):
+        super().__init__(concurrente=True)
+        self.lotes = []
+
+    def agendar_turnos_lote(self, solicitudes, todo_o_nada=True):
+        self.lotes.append(len(solicitudes))
+        return super().agendar_turnos_lote(solicitudes, todo_o_nada)
+
+
+class TestAsyncClinica(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        self.clinica = ClinicaContadora()
+        self.clinica.agregar_paciente(Paciente("Juan Pérez", "12345678", "12/12/1990"))
+        for matricula in ("1234", "5678"):
+            medico = Medico("Dr. Carlos Gómez", matricula)
+            medico.agregar_especialidad(Especialidad("Pediatría", ["lunes"]))
+            self.clinica.agregar_medico(medico)
+        self.async_clinica = AsyncClinica(self.clinica)
+
+    def test_rechaza_clinica_no_concurrente(self):
+        with self.assertRaises(DatosInvalidosException):
+            AsyncClinica(Clinica())
+        self.assertTrue(AsyncClinica().obtener_clinica().es_concurrente())
+
+    async def test_agendar_turno(self):
+        turno = await self.async_clinica.agendar_turno("12345678", "1234", "Pediatría", datetime(2030, 6, 3, 10, 0))
+
+        self.assertEqual(turno.obtener_fecha_hora(), datetime(2030, 6, 3, 10, 0))
+        self.assertEqual(len(self.clinica.obtener_turnos()), 1)
+
+    async def test_agrupa_solicitudes_del_mismo_medico(self):
+        resultados = await asyncio.gather(
+            self.async_clinica.agendar_turno("12345678", "1234", "Pediatría", datetime(2030, 6, 3, 10, 0)),
+            self.async_clinica.agendar_turno("12345678", "1234", "Pediatría", datetime(2030, 6, 3, 10, 0)),
+            self.async_clinica.agendar_turno("12345678", "1234", "Pediatría", datetime(2030, 6, 3, 11, 0)),
+            self.async_clinica.agendar_turno("12345678", "5678", "Pediatría", datetime(2030, 6, 3, 10, 0)),
+            return_exceptions=True,
+        )
+
+        self.assertEqual(sorted(self.clinica.lotes), [1, 3])
+        self.assertEqual(resultados[0].obtener_fecha_hora(), datetime(2030, 6, 3, 10, 0))
+        self.assertIsInstance(resultados[1], TurnoOcupadoException)
+        self.assertEqual(resultados[2].obtener_fecha_hora(), datetime(2030, 6, 3, 11, 0))
+        self.assertEqual(resultados[3].obtener_medico().obtener_matricula(), "5678")
+
+    async def test_solicitudes_durante_un_lote_en_curso(self):
+        primero = asyncio.ensure_future(
+            self.async_clinica.agendar_turno("12345678", "1234", "Pediatría", datetime(2030, 6, 3, 9, 0))
+        )
+        # Dejar que el primer lote se despache antes de la segunda solicitud
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+
+        with self.assertRaises(TurnoOcupadoException):
+            await self.async_clinica.agendar_turno("12345678", "1234", "Pediatría", datetime(2030, 6, 3, 9, 0))
+        await primero
+
+        self.assertEqual(self.clinica.lotes, [1, 1])
+        self.assertEqual(len(self.clinica.obtener_turnos()), 1)
+
+    async def test_error_medico_no_encontrado(self):
+        with self.assertRaises(MedicoNoEncontradoException):
+            await self.async_clinica.agendar_turno("12345678", "9999", "Pediatría", datetime(2030, 6, 3, 10, 0))
+
+    async def test_emitir_receta_y_obtener_historia(self):
+        await self.async_clinica.emitir_receta("12345678", "1234", ["Paracetamol"])
+
+        historia = await self.async_clinica.obtener_historia_clinica("12345678")
+        self.assertEqual(len(historia.obtener_recetas()), 1)
+
+        with self.assertRaises(PacienteNoEncontradoException):
+            await self.async_clinica.obtener_historia_clinica("99999999")
+
+    async def test_ejecutar_en_segundo_plano(self):
+        resultado = await self.async_clinica.ejecutar_en_segundo_plano(sum, [1, 2, 3])
+        self.assertEqual(resultado, 6)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,45 @@
+import unittest
+
+from src.catalogomedicamentos import CatalogoMedicamentos
+
+
+class TestCatalogoMedicamentos(unittest.TestCase):
+
+    def setUp(self):
+        self.catalogo = CatalogoMedicamentos()
+
+    def test_normalizacion(self):
+        id_medicamento = self.catalogo.obtener_id("  Ibuprofeno   400mg ")
+
+        self.assertEqual(self.catalogo.obtener_id("ibuprofeno 400MG"), id_medicamento)
+        self.assertEqual(self.catalogo.obtener_nombre(id_medicamento), "Ibuprofeno 400mg")
+        self.assertEqual(len(self.catalogo), 1)
+
+    def test_variantes_de_escritura_no_agrandan_el_catalogo(self):
+        for nombre in ("Paracetamol", "PARACETAMOL", "paracetamol", "  Paracetamol "):
+            self.assertEqual(self.catalogo.obtener_id(nombre), 0)
+        self.assertEqual(len(self.catalogo), 1)
+        self.assertEqual(self.catalogo.obtener_nombre(0), "Paracetamol")
+
+    def test_internar(self):
+        primero = self.catalogo.internar("Ibuprofeno  400mg")
+        # Misma escritura: el mismo texto del catálogo
+        self.assertIs(self.catalogo.internar("".join(["Ibuprofeno", " 400mg"])), primero)
+        # Otra escritura: se conserva, sin registrar otro medicamento
+        self.assertEqual(self.catalogo.internar("IBUPROFENO 400MG"), "IBUPROFENO 400MG")
+        self.assertEqual(len(self.catalogo), 1)
+        self.assertEqual(self.catalogo.internar("  "), "  ")
+
+    def test_ids_distintos(self):
+        self.assertEqual(self.catalogo.obtener_id("Paracetamol"), 0)
+        self.assertEqual(self.catalogo.obtener_id("Amoxicilina"), 1)
+
+    def test_buscar_id_no_registra(self):
+        self.assertIsNone(self.catalogo.buscar_id("Paracetamol"))
+        self.assertEqual(len(self.catalogo), 0)
+        self.catalogo.obtener_id("Paracetamol")
+        self.assertEqual(self.catalogo.buscar_id("PARACETAMOL"), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,14 +1,23 @@
+import gc
+import os
+import sys
+import tempfile
+import threading
 import unittest
-from datetime import datetime, timedelta
+from unittest import mock
+from datetime import date, datetime, timedelta
 from src.clinica import Clinica
+from src.repositoriosqlite import RepositorioSQLite
 from src.paciente import Paciente
 from src.medico import Medico
 from src.especialidad import Especialidad
+from src.reloj import RelojFijo
 from src.excepciones import (
     PacienteNoEncontradoException,
     MedicoNoEncontradoException,
     MedicoNoDisponibleException,
     TurnoOcupadoException,
+    TurnoNoEncontradoException,
     RecetaInvalidaException,
     PacienteDuplicadoException,
     MedicoDuplicadoException,
@@ -20,7 +29,7 @@ class TestClinica(unittest.TestCase):
     
     def setUp(self):
         """Configuración inicial para cada prueba."""
-        self.clinica = Clinica()
+        self.clinica = self.crear_clinica()
         
         # Pacientes de prueba
         self.paciente1 = Paciente("Juan Pérez", "12345678", "12/12/1990")
@@ -33,6 +42,10 @@ class TestClinica(unittest.TestCase):
         self.medico2 = Medico("Dra. María García", "5678")
         self.medico2.agregar_especialidad(Especialidad("Cardiología", ["martes", "jueves"]))
 
+    def crear_clinica(self, concurrente: bool = False, reloj=None) -> Clinica:
+        """Crea la clínica bajo prueba (en memoria)."""
+        return Clinica(concurrente=concurrente, reloj=reloj)
+
     # PRUEBAS DE PACIENTES Y MÉDICOS
     
     def test_registro_exitoso_paciente(self):
@@ -75,6 +88,23 @@ class TestClinica(unittest.TestCase):
         with self.assertRaises(DatosInvalidosException):
             self.clinica.agregar_medico("no es un médico")
 
+    def test_agregar_pacientes_y_medicos_lote(self):
+        """Prueba el alta por lote y que un duplicado rechaza el lote completo."""
+        self.clinica.agregar_pacientes_lote([self.paciente1, self.paciente2])
+        self.clinica.agregar_medicos_lote([self.medico1, self.medico2])
+        self.assertTrue(self.clinica.existe_paciente("87654321"))
+        self.assertTrue(self.clinica.existe_medico("5678"))
+        self.assertEqual(len(self.clinica.obtener_medicos()), 2)
+
+        nuevo = Paciente("Pedro Ruiz", "34567890", "05/05/1970")
+        with self.assertRaises(PacienteDuplicadoException):
+            self.clinica.agregar_pacientes_lote([nuevo, Paciente("Juan Martínez", "12345678", "15/03/1992")])
+        with self.assertRaises(PacienteDuplicadoException):
+            self.clinica.agregar_pacientes_lote([nuevo, nuevo])
+        self.assertFalse(self.clinica.existe_paciente("34567890"))
+        with self.assertRaises(MedicoDuplicadoException):
+            self.clinica.agregar_medicos_lote([Medico("Dr. Pedro Rodríguez", "1234")])
+
     # PRUEBAS DE ESPECIALIDADES
 
     def test_agregar_especialidad_medico_registrado(self):
@@ -88,6 +118,41 @@ class TestClinica(unittest.TestCase):
         especialidades = medico.obtener_especialidades()
         self.assertEqual(len(especialidades), 2)
 
+    def test_medicos_para_especialidad_y_dia(self):
+        """Prueba la consulta de médicos que atienden una especialidad un día."""
+        self.clinica.agregar_medico(self.medico1)
+        self.clinica.agregar_medico(self.medico2)
+        
+        medicos = self.clinica.medicos_para("pediatría", "Lunes")
+        self.assertEqual([m.obtener_matricula() for m in medicos], ["1234"])
+        self.assertEqual(self.clinica.medicos_para("Cardiología", 1), [self.medico2])
+        self.assertEqual(self.clinica.medicos_para("Cardiología", 0), [])
+        self.assertEqual(self.clinica.medicos_para("Neurología", "sábado"), [])
+        self.assertEqual(self.clinica.medicos_para("Pediatría", "feriado"), [])
+
+    def test_medicos_para_especialidad_agregada_despues(self):
+        """Prueba que el índice se actualiza al agregar especialidades a un médico registrado."""
+        self.clinica.agregar_medico(self.medico1)
+        
+        self.medico1.agregar_especialidad(Especialidad("Neurología", ["sábado", "lunes"]))
+        
+        self.assertEqual(self.clinica.medicos_para("Neurología", "sábado"), [self.medico1])
+        # Los lunes el médico sigue atendiendo Pediatría
+        self.assertEqual(self.clinica.medicos_para("Neurología", "lunes"), [])
+
+    def test_especialidad_no_persistida_no_queda_en_el_medico(self):
+        """Prueba que si falla el registro de una especialidad agregada, el médico no la conserva."""
+        self.clinica.agregar_medico(self.medico1)
+        
+        with mock.patch.object(self.clinica, "_registrar_evento", side_effect=OSError("disco lleno")):
+            with self.assertRaises(OSError):
+                self.medico1.agregar_especialidad(Especialidad("Neurología", ["sábado"]))
+        
+        self.assertEqual(len(self.medico1.obtener_especialidades()), 1)
+        self.assertEqual(self.clinica.medicos_para("Neurología", "sábado"), [])
+        self.medico1.agregar_especialidad(Especialidad("Neurología", ["sábado"]))
+        self.assertEqual(self.clinica.medicos_para("Neurología", "sábado"), [self.medico1])
+
     def test_error_medico_no_registrado(self):
         """Prueba error si se intenta obtener un médico no registrado."""
         with self.assertRaises(MedicoNoEncontradoException):
@@ -101,7 +166,7 @@ class TestClinica(unittest.TestCase):
         self.clinica.agregar_medico(self.medico1)
         
         # Usar fecha futura fija que es lunes
-        fecha_turno = datetime(2026, 6, 1, 10, 0)  # 1 de junio de 2026 es lunes
+        fecha_turno = datetime(2030, 6, 3, 10, 0)  # 3 de junio de 2030 es lunes
         
         self.clinica.agendar_turno("12345678", "1234", "Pediatría", fecha_turno)
         turnos = self.clinica.obtener_turnos()
@@ -113,7 +178,7 @@ class TestClinica(unittest.TestCase):
         self.clinica.agregar_paciente(self.paciente2)
         self.clinica.agregar_medico(self.medico1)
         
-        fecha_turno = datetime(2026, 6, 1, 10, 0)  # 1 de junio de 2026 es lunes
+        fecha_turno = datetime(2030, 6, 3, 10, 0)  # 3 de junio de 2030 es lunes
         
         # Primer turno
         self.clinica.agendar_turno("12345678", "1234", "Pediatría", fecha_turno)
@@ -122,10 +187,29 @@ class TestClinica(unittest.TestCase):
         with self.assertRaises(TurnoOcupadoException):
             self.clinica.agendar_turno("87654321", "1234", "Pediatría", fecha_turno)
 
+    def test_mismo_horario_distinto_medico(self):
+        """Prueba que el mismo horario con otro médico no se considera duplicado."""
+        self.clinica.agregar_paciente(self.paciente1)
+        self.clinica.agregar_paciente(self.paciente2)
+        self.clinica.agregar_medico(self.medico1)
+        
+        medico3 = Medico("Dr. Luis Díaz", "4321")
+        medico3.agregar_especialidad(Especialidad("Pediatría", ["lunes"]))
+        self.clinica.agregar_medico(medico3)
+        
+        fecha_turno = datetime(2030, 6, 3, 10, 0)  # 3 de junio de 2030 es lunes
+        
+        self.clinica.agendar_turno("12345678", "1234", "Pediatría", fecha_turno)
+        self.clinica.agendar_turno("87654321", "4321", "Pediatría", fecha_turno)
+        
+        self.assertEqual(len(self.clinica.obtener_turnos()), 2)
+        with self.assertRaises(TurnoOcupadoException):
+            self.clinica.validar_turno_no_duplicado("4321", fecha_turno)
+
     def test_error_paciente_no_existe_turno(self):
         """Prueba error si el paciente no existe al agendar turno."""
         self.clinica.agregar_medico(self.medico1)
-        fecha_turno = datetime(2026, 6, 1, 10, 0)  # 1 de junio de 2026 es lunes
+        fecha_turno = datetime(2030, 6, 3, 10, 0)  # 3 de junio de 2030 es lunes
         
         with self.assertRaises(PacienteNoEncontradoException):
             self.clinica.agendar_turno("99999999", "1234", "Pediatría", fecha_turno)
@@ -133,7 +217,7 @@ class TestClinica(unittest.TestCase):
     def test_error_medico_no_existe_turno(self):
         """Prueba error si el médico no existe al agendar turno."""
         self.clinica.agregar_paciente(self.paciente1)
-        fecha_turno = datetime(2026, 6, 1, 10, 0)  # 1 de junio de 2026 es lunes
+        fecha_turno = datetime(2030, 6, 3, 10, 0)  # 3 de junio de 2030 es lunes
         
         with self.assertRaises(MedicoNoEncontradoException):
             self.clinica.agendar_turno("12345678", "9999", "Pediatría", fecha_turno)
@@ -143,7 +227,7 @@ class TestClinica(unittest.TestCase):
         self.clinica.agregar_paciente(self.paciente1)
         self.clinica.agregar_medico(self.medico1)
         
-        fecha_turno = datetime(2026, 6, 1, 10, 0)  # 1 de junio de 2026 es lunes
+        fecha_turno = datetime(2030, 6, 3, 10, 0)  # 3 de junio de 2030 es lunes
         
         with self.assertRaises(MedicoNoDisponibleException):
             self.clinica.agendar_turno("12345678", "1234", "Cardiología", fecha_turno)
@@ -153,12 +237,341 @@ class TestClinica(unittest.TestCase):
         self.clinica.agregar_paciente(self.paciente1)
         self.clinica.agregar_medico(self.medico1)
         
-        # Martes (médico no trabaja martes) - 2 de junio de 2026 es martes
-        fecha_turno = datetime(2026, 6, 2, 10, 0)
+        # Martes (médico no trabaja martes) - 4 de junio de 2030 es martes
+        fecha_turno = datetime(2030, 6, 4, 10, 0)
         
         with self.assertRaises(MedicoNoDisponibleException):
             self.clinica.agendar_turno("12345678", "1234", "Pediatría", fecha_turno)
 
+    def test_turnos_medico_entre_fechas(self):
+        """Prueba la consulta de la agenda de un médico por rango de fechas."""
+        self.clinica.agregar_paciente(self.paciente1)
+        self.clinica.agregar_medico(self.medico1)
+        
+        self.clinica.agendar_turno("12345678", "1234", "Pediatría", datetime(2030, 6, 5, 9, 0))
+        self.clinica.agendar_turno("12345678", "1234", "Pediatría", datetime(2030, 6, 3, 10, 0))
+        self.clinica.agendar_turno("12345678", "1234", "Pediatría", datetime(2030, 6, 7, 8, 0))
+        
+        turnos = self.clinica.obtener_turnos_medico_entre("1234", datetime(2030, 6, 3), datetime(2030, 6, 6))
+        fechas = [turno.obtener_fecha_hora() for turno in turnos]
+        self.assertEqual(fechas, [datetime(2030, 6, 3, 10, 0), datetime(2030, 6, 5, 9, 0)])
+        
+        proximo = self.clinica.obtener_proximo_turno_medico("1234", datetime(2030, 6, 5, 9, 30))
+        self.assertEqual(proximo.obtener_fecha_hora(), datetime(2030, 6, 7, 8, 0))
+        self.assertIsNone(self.clinica.obtener_proximo_turno_medico("1234", datetime(2030, 6, 8)))
+
+    def test_agenda_medico_no_registrado(self):
+        """Prueba error al consultar la agenda de un médico no registrado."""
+        with self.assertRaises(MedicoNoEncontradoException):
+            self.clinica.obtener_proximo_turno_medico("9999", datetime(2030, 6, 3))
+
+    def test_fechas_que_no_son_datetime(self):
+        """Prueba que un date o un str en lugar de datetime se rechaza con DatosInvalidosException."""
+        self.clinica.agregar_paciente(self.paciente1)
+        self.clinica.agregar_medico(self.medico1)
+        self.clinica.agendar_turno("12345678", "1234", "Pediatría", datetime(2030, 6, 3, 10, 0))
+        
+        for fecha in (date(2030, 6, 3), "2030-06-03 10:00"):
+            consultas = (
+                lambda: self.clinica.agendar_turno("12345678", "1234", "Pediatría", fecha),
+                lambda: self.clinica.validar_turno_no_duplicado("1234", fecha),
+                lambda: self.clinica.obtener_turnos_medico_entre("1234", fecha, datetime(2030, 6, 4)),
+                lambda: self.clinica.obtener_intervalos_turnos_medico("1234", datetime(2030, 6, 1), fecha),
+                lambda: self.clinica.obtener_proximo_turno_medico("1234", fecha),
+                lambda: self.clinica.obtener_pagina_turnos((fecha, "1234")),
+                lambda: self.clinica.cancelar_turno("1234", fecha),
+                lambda: self.clinica.reprogramar_turno("1234", datetime(2030, 6, 3, 10, 0), fecha),
+            )
+            for consulta in consultas:
+                with self.assertRaises(DatosInvalidosException):
+                    consulta()
+        self.assertEqual(len(self.clinica.obtener_turnos()), 1)
+
+    def test_agendar_turnos_lote_exitoso(self):
+        """Prueba agendar varios turnos en un solo lote."""
+        self.clinica.agregar_paciente(self.paciente1)
+        self.clinica.agregar_paciente(self.paciente2)
+        self.clinica.agregar_medico(self.medico1)
+        
+        resultado = self.clinica.agendar_turnos_lote([
+            ("12345678", "1234", "Pediatría", datetime(2030, 6, 3, 10, 0)),
+            ("87654321", "1234", "Pediatría", datetime(2030, 6, 3, 10, 30)),
+        ])
+        
+        self.assertTrue(resultado.es_exitoso())
+        self.assertEqual(sorted(resultado.obtener_turnos()), [0, 1])
+        self.assertEqual(len(self.clinica.obtener_turnos()), 2)
+
+    def test_agendar_turnos_lote_todo_o_nada(self):
+        """Prueba que un lote con errores no agenda ningún turno."""
+        self.clinica.agregar_paciente(self.paciente1)
+        self.clinica.agregar_medico(self.medico1)
+        self.clinica.agendar_turno("12345678", "1234", "Pediatría", datetime(2030, 6, 3, 9, 0))
+        
+        resultado = self.clinica.agendar_turnos_lote([
+            ("12345678", "1234", "Pediatría", datetime(2030, 6, 3, 10, 0)),
+            ("12345678", "1234", "Pediatría", datetime(2030, 6, 3, 10, 0)),
+            ("12345678", "1234", "Pediatría", datetime(2030, 6, 3, 9, 0)),
+            ("99999999", "1234", "Pediatría", datetime(2030, 6, 3, 11, 0)),
+            ("12345678", "1234", "Pediatría", datetime(2030, 6, 4, 11, 0)),
+            ("12345678", "1234"),
+        ])
+        
+        errores = resultado.obtener_errores()
+        self.assertFalse(resultado.es_exitoso())
+        self.assertEqual(resultado.obtener_turnos(), {})
+        self.assertIsInstance(errores[1], TurnoOcupadoException)
+        self.assertIsInstance(errores[2], TurnoOcupadoException)
+        self.assertIsInstance(errores[3], PacienteNoEncontradoException)
+        self.assertIsInstance(errores[4], MedicoNoDisponibleException)
+        self.assertIsInstance(errores[5], DatosInvalidosException)
+        self.assertNotIn(0, errores)
+        self.assertEqual(len(self.clinica.obtener_turnos()), 1)
+
+    def test_agendar_turnos_lote_resuelve_cada_clave_una_vez(self):
+        """Prueba que el lote valida cada paciente, médico y cobertura una sola vez."""
+        self.clinica.agregar_paciente(self.paciente1)
+        self.clinica.agregar_medico(self.medico1)
+        solicitudes = [("12345678", "1234", "Pediatría", datetime(2030, 6, 3, 8, 0) + timedelta(hours=h))
+                       for h in range(6)]
+        solicitudes += [("99999999", "1234", "Pediatría", datetime(2030, 6, 3, 15, 0)),
+                        ("99999999", "1234", "Pediatría", datetime(2030, 6, 3, 16, 0)),
+                        ("12345678", "1234", "Pediatría", datetime(2030, 6, 4, 9, 0)),
+                        ("12345678", "1234", "Pediatría", datetime(2030, 6, 4, 10, 0))]
+        
+        with mock.patch.object(self.clinica, "validar_existencia_paciente",
+                               wraps=self.clinica.validar_existencia_paciente) as pacientes, \
+                mock.patch.object(self.clinica, "validar_existencia_medico",
+                                  wraps=self.clinica.validar_existencia_medico) as medicos, \
+                mock.patch.object(self.clinica, "validar_especialidad_en_dia",
+                                  wraps=self.clinica.validar_especialidad_en_dia) as cobertura:
+            resultado = self.clinica.agendar_turnos_lote(solicitudes, todo_o_nada=False)
+        
+        self.assertEqual(pacientes.call_count, 2)
+        self.assertEqual(medicos.call_count, 1)
+        self.assertEqual(cobertura.call_count, 2)
+        self.assertEqual(sorted(resultado.obtener_turnos()), list(range(6)))
+        errores = resultado.obtener_errores()
+        self.assertIsInstance(errores[6], PacienteNoEncontradoException)
+        self.assertIsInstance(errores[7], PacienteNoEncontradoException)
+        self.assertIsInstance(errores[8], MedicoNoDisponibleException)
+        self.assertIsInstance(errores[9], MedicoNoDisponibleException)
+
+    def test_agendar_turnos_lote_mejor_esfuerzo(self):
+        """Prueba que sin todo_o_nada se agendan las filas válidas."""
+        self.clinica.agregar_paciente(self.paciente1)
+        self.clinica.agregar_medico(self.medico1)
+        
+        resultado = self.clinica.agendar_turnos_lote([
+            ("12345678", "1234", "Pediatría", datetime(2030, 6, 3, 10, 0)),
+            ("12345678", "1234", "Cardiología", datetime(2030, 6, 3, 11, 0)),
+        ], todo_o_nada=False)
+        
+        self.assertEqual(list(resultado.obtener_turnos()), [0])
+        self.assertEqual(list(resultado.obtener_errores()), [1])
+        self.assertEqual(len(self.clinica.obtener_historia_clinica("12345678").obtener_turnos()), 1)
+
+    def test_agendar_serie_semanal(self):
+        """Prueba agendar una serie de turnos semanales."""
+        self.clinica.agregar_paciente(self.paciente1)
+        self.clinica.agregar_medico(self.medico1)
+        
+        resultado = self.clinica.agendar_serie("12345678", "1234", "Pediatría", datetime(2030, 6, 3, 10, 0),
+                                               hasta=datetime(2030, 7, 1))
+        
+        self.assertTrue(resultado.es_exitoso())
+        fechas = [turno.obtener_fecha_hora() for turno in self.clinica.obtener_historia_clinica("12345678").obtener_turnos()]
+        self.assertEqual(fechas, [datetime(2030, 6, 3 + 7 * i, 10, 0) for i in range(4)])
+
+    def test_agendar_serie_informa_ocurrencias_en_conflicto(self):
+        """Prueba que una serie con choques no agenda nada e indica qué ocurrencias chocan."""
+        self.clinica.agregar_paciente(self.paciente1)
+        self.clinica.agregar_paciente(self.paciente2)
+        self.clinica.agregar_medico(self.medico1)
+        self.clinica.agendar_turno("87654321", "1234", "Pediatría", datetime(2030, 6, 10, 10, 0))
+        
+        resultado = self.clinica.agendar_serie("12345678", "1234", "Pediatría", datetime(2030, 6, 3, 10, 0),
+                                               intervalo=timedelta(days=7), cantidad=3)
+        self.assertEqual(list(resultado.obtener_errores()), [1])
+        self.assertIsInstance(resultado.obtener_errores()[1], TurnoOcupadoException)
+        self.assertEqual(self.clinica.obtener_historia_clinica("12345678").obtener_turnos(), [])
+        
+        # Cada 4 días: la tercera ocurrencia cae martes 11/06, día que no atiende
+        resultado = self.clinica.agendar_serie("12345678", "1234", "Pediatría", datetime(2030, 6, 3, 10, 0),
+                                               intervalo=timedelta(days=4), cantidad=3, todo_o_nada=False)
+        self.assertEqual(sorted(resultado.obtener_turnos()), [0, 1])
+        self.assertIsInstance(resultado.obtener_errores()[2], MedicoNoDisponibleException)
+
+    def test_agendar_serie_parametros_invalidos(self):
+        """Prueba los errores al definir la serie."""
+        inicio = datetime(2030, 6, 3, 10, 0)
+        with self.assertRaises(DatosInvalidosException):
+            self.clinica.agendar_serie("12345678", "1234", "Pediatría", inicio)
+        with self.assertRaises(DatosInvalidosException):
+            self.clinica.agendar_serie("12345678", "1234", "Pediatría", inicio, intervalo=timedelta(0), cantidad=2)
+        with self.assertRaises(DatosInvalidosException):
+            self.clinica.agendar_serie("12345678", "1234", "Pediatría", inicio, intervalo=timedelta(minutes=1),
+                                       hasta=inicio + timedelta(days=30))
+        for hasta in (inicio, inicio - timedelta(weeks=1)):
+            with self.assertRaises(DatosInvalidosException):
+                self.clinica.agendar_serie("12345678", "1234", "Pediatría", inicio, hasta=hasta)
+            with self.assertRaises(DatosInvalidosException):
+                Clinica.expandir_serie(inicio, cantidad=3, hasta=hasta)
+
+    def test_cancelar_turno_libera_horario(self):
+        """Prueba que cancelar libera el horario y deja el turno marcado en la historia."""
+        self.clinica.agregar_paciente(self.paciente1)
+        self.clinica.agregar_paciente(self.paciente2)
+        self.clinica.agregar_medico(self.medico1)
+        fecha_hora = datetime(2030, 6, 3, 10, 0)
+        self.clinica.agendar_turno("12345678", "1234", "Pediatría", fecha_hora)
+        
+        cancelado = self.clinica.cancelar_turno("1234", fecha_hora)
+        
+        self.assertTrue(cancelado.esta_cancelado())
+        self.assertIn("(cancelado)", str(cancelado))
+        self.assertEqual(self.clinica.obtener_turnos(), [])
+        self.assertEqual(self.clinica.obtener_turnos_medico_entre("1234", fecha_hora, datetime(2030, 6, 4)), [])
+        self.assertEqual(self.clinica.obtener_historia_clinica("12345678").obtener_turnos(), [cancelado])
+        with self.assertRaises(TurnoNoEncontradoException):
+            self.clinica.cancelar_turno("1234", fecha_hora)
+        
+        self.clinica.agendar_turno("87654321", "1234", "Pediatría", fecha_hora)
+        self.assertEqual(len(self.clinica.obtener_turnos()), 1)
+
+    def test_reprogramar_turno(self):
+        """Prueba mover un turno a otro día y el rechazo de un destino inválido."""
+        self.clinica.agregar_paciente(self.paciente1)
+        self.clinica.agregar_medico(self.medico1)
+        original = datetime(2030, 6, 3, 10, 0)
+        self.clinica.agendar_turno("12345678", "1234", "Pediatría", original)
+        
+        # El martes no atiende: el turno original no cambia
+        with self.assertRaises(MedicoNoDisponibleException):
+            self.clinica.reprogramar_turno("1234", original, datetime(2030, 6, 4, 10, 0))
+        self.assertFalse(self.clinica.obtener_turnos()[0].esta_cancelado())
+        
+        nuevo = self.clinica.reprogramar_turno("1234", original, datetime(2030, 6, 5, 10, 0))
+        
+        self.assertEqual(self.clinica.obtener_turnos(), [nuevo])
+        historia = self.clinica.obtener_historia_clinica("12345678").obtener_turnos()
+        self.assertEqual([(t.obtener_fecha_hora(), t.esta_cancelado()) for t in historia],
+                         [(original, True), (datetime(2030, 6, 5, 10, 0), False)])
+        libres = self.clinica.buscar_turnos_libres("Pediatría", original, original + timedelta(minutes=30))
+        self.assertEqual([fecha_hora for fecha_hora, _ in libres], [original])
+
+    def test_turnos_superpuestos(self):
+        """Prueba que se rechazan turnos que se superponen según la duración de la especialidad."""
+        self.clinica.agregar_paciente(self.paciente1)
+        medico = Medico("Dr. Luis Díaz", "4321")
+        medico.agregar_especialidad(Especialidad("Psiquiatría", ["lunes"], duracion_minutos=40))
+        self.clinica.agregar_medico(medico)
+        self.clinica.agendar_turno("12345678", "4321", "Psiquiatría", datetime(2030, 6, 3, 10, 0))
+        
+        for superpuesto in (datetime(2030, 6, 3, 10, 5), datetime(2030, 6, 3, 9, 30), datetime(2030, 6, 3, 10, 39)):
+            with self.assertRaises(TurnoOcupadoException):
+                self.clinica.agendar_turno("12345678", "4321", "Psiquiatría", superpuesto)
+        
+        # Los turnos contiguos no se superponen
+        self.clinica.agendar_turno("12345678", "4321", "Psiquiatría", datetime(2030, 6, 3, 9, 20))
+        self.clinica.agendar_turno("12345678", "4321", "Psiquiatría", datetime(2030, 6, 3, 10, 40))
+        self.assertEqual([t.obtener_duracion_minutos() for t in self.clinica.obtener_turnos()], [40, 40, 40])
+        
+        # Mover un turno unos minutos se superpone sólo consigo mismo
+        movido = self.clinica.reprogramar_turno("4321", datetime(2030, 6, 3, 10, 40), datetime(2030, 6, 3, 10, 50))
+        self.assertEqual(movido.obtener_fecha_hora_fin(), datetime(2030, 6, 3, 11, 30))
+        with self.assertRaises(TurnoOcupadoException):
+            self.clinica.reprogramar_turno("4321", datetime(2030, 6, 3, 10, 50), datetime(2030, 6, 3, 10, 30))
+
+    def test_lote_y_serie_detectan_superposiciones(self):
+        """Prueba la detección de superposiciones dentro de un lote y de una serie."""
+        self.clinica.agregar_paciente(self.paciente1)
+        self.clinica.agregar_medico(self.medico1)
+        
+        resultado = self.clinica.agendar_turnos_lote([
+            ("12345678", "1234", "Pediatría", datetime(2030, 6, 3, 10, 0)),
+            ("12345678", "1234", "Pediatría", datetime(2030, 6, 3, 10, 15)),
+            ("12345678", "1234", "Pediatría", datetime(2030, 6, 3, 10, 30)),
+        ], todo_o_nada=False)
+        self.assertEqual(list(resultado.obtener_errores()), [1])
+        self.assertIsInstance(resultado.obtener_errores()[1], TurnoOcupadoException)
+        
+        # Cada 20 minutos, con turnos de 30: se superpone una ocurrencia de cada dos
+        resultado = self.clinica.agendar_serie("12345678", "1234", "Pediatría", datetime(2030, 6, 5, 9, 0),
+                                               intervalo=timedelta(minutes=20), cantidad=4, todo_o_nada=False)
+        self.assertEqual(list(resultado.obtener_errores()), [1, 3])
+        self.assertEqual(len(self.clinica.obtener_turnos()), 4)
+
+    def test_buscar_turnos_libres_con_duracion_de_la_especialidad(self):
+        """Prueba que los bloques libres usan la duración de los turnos de cada médico."""
+        self.clinica.agregar_paciente(self.paciente1)
+        medico = Medico("Dr. Luis Díaz", "4321")
+        medico.agregar_especialidad(Especialidad("Pediatría", ["lunes"], duracion_minutos=45))
+        self.clinica.agregar_medico(medico)
+        self.clinica.agendar_turno("12345678", "4321", "Pediatría", datetime(2030, 6, 3, 8, 30))
+        
+        libres = self.clinica.buscar_turnos_libres(
+            "Pediatría", datetime(2030, 6, 3), datetime(2030, 6, 4), limite=2
+        )
+        self.assertEqual([fecha_hora for fecha_hora, _ in libres],
+                         [datetime(2030, 6, 3, 9, 30), datetime(2030, 6, 3, 10, 15)])
+
+    def test_buscar_turnos_libres(self):
+        """Prueba la búsqueda de horarios libres entre varios médicos."""
+        self.clinica.agregar_paciente(self.paciente1)
+        self.clinica.agregar_medico(self.medico1)
+        medico3 = Medico("Dr. Luis Díaz", "4321")
+        medico3.agregar_especialidad(Especialidad("Pediatría", ["martes"]))
+        self.clinica.agregar_medico(medico3)
+        self.clinica.agregar_medico(self.medico2)
+        
+        self.clinica.agendar_turno("12345678", "1234", "Pediatría", datetime(2030, 6, 3, 8, 0))
+        
+        libres = list(self.clinica.buscar_turnos_libres(
+            "Pediatría", datetime(2030, 6, 3, 19, 0), datetime(2030, 6, 5, 9, 0),
+            duracion=timedelta(minutes=30)
+        ))
+        
+        horarios = [(fecha_hora, medico.obtener_matricula()) for fecha_hora, medico in libres]
+        self.assertEqual(horarios[:3], [
+            (datetime(2030, 6, 3, 19, 0), "1234"),
+            (datetime(2030, 6, 3, 19, 30), "1234"),
+            (datetime(2030, 6, 4, 8, 0), "4321"),
+        ])
+        self.assertEqual(horarios[-2:], [
+            (datetime(2030, 6, 5, 8, 0), "1234"),
+            (datetime(2030, 6, 5, 8, 30), "1234"),
+        ])
+        self.assertEqual(len(horarios), 2 + 24 + 2)
+
+    def test_buscar_turnos_libres_omite_ocupados_y_limita(self):
+        """Prueba que la búsqueda saltea turnos ocupados y respeta el límite."""
+        self.clinica.agregar_paciente(self.paciente1)
+        self.clinica.agregar_medico(self.medico1)
+        self.clinica.agendar_turno("12345678", "1234", "Pediatría", datetime(2030, 6, 3, 8, 0))
+        self.clinica.agendar_turno("12345678", "1234", "Pediatría", datetime(2030, 6, 3, 8, 45))
+        
+        libres = self.clinica.buscar_turnos_libres(
+            "pediatría", datetime(2030, 6, 3), datetime(2030, 7, 1), limite=2
+        )
+        
+        # El turno de las 8:45 dura hasta las 9:15 y también ocupa el bloque de las 9:00
+        self.assertEqual([fecha_hora for fecha_hora, _ in libres],
+                         [datetime(2030, 6, 3, 9, 30), datetime(2030, 6, 3, 10, 0)])
+
+    def test_buscar_turnos_libres_duracion_invalida(self):
+        """Prueba error si la duración no es positiva."""
+        with self.assertRaises(DatosInvalidosException):
+            self.clinica.buscar_turnos_libres("Pediatría", datetime(2030, 6, 3), datetime(2030, 6, 4),
+                                              duracion=timedelta(0))
+
+    def test_buscar_turnos_libres_limite_invalido(self):
+        """Prueba error si el límite no es un entero positivo."""
+        for limite in (-1, 0, 2.5, "3"):
+            with self.assertRaises(DatosInvalidosException):
+                self.clinica.buscar_turnos_libres("Pediatría", datetime(2030, 6, 3), datetime(2030, 6, 4),
+                                                  limite=limite)
+
     # PRUEBAS DE RECETAS
 
     def test_emitir_receta_exitosa(self):
@@ -202,7 +615,7 @@ class TestClinica(unittest.TestCase):
         self.clinica.agregar_medico(self.medico1)
         
         # Agendar turno
-        fecha_turno = datetime(2026, 6, 1, 10, 0)  # 1 de junio de 2026 es lunes
+        fecha_turno = datetime(2030, 6, 3, 10, 0)  # 3 de junio de 2030 es lunes
         self.clinica.agendar_turno("12345678", "1234", "Pediatría", fecha_turno)
         
         # Emitir receta
@@ -215,11 +628,427 @@ class TestClinica(unittest.TestCase):
         self.assertEqual(len(turnos), 1)
         self.assertEqual(len(recetas), 1)
 
+    def test_recetas_con_medicamento(self):
+        """Prueba el índice de recetas por medicamento."""
+        self.clinica.agregar_paciente(self.paciente1)
+        self.clinica.agregar_paciente(self.paciente2)
+        self.clinica.agregar_medico(self.medico1)
+        self.clinica.emitir_receta("12345678", "1234", ["Ibuprofeno 400mg", "Paracetamol"])
+        self.clinica.emitir_receta("87654321", "1234", ["ibuprofeno  400MG"])
+        
+        recetas = self.clinica.obtener_recetas_con_medicamento("IBUPROFENO 400mg")
+        
+        self.assertEqual([r.obtener_paciente().obtener_dni() for r in recetas], ["12345678", "87654321"])
+        self.assertLessEqual(recetas[0].obtener_fecha(), recetas[1].obtener_fecha())
+        self.assertEqual(len(self.clinica.obtener_recetas_con_medicamento("Paracetamol")), 1)
+        self.assertEqual(self.clinica.obtener_recetas_con_medicamento("Medicamento inexistente"), [])
+
+    def test_recetas_conservan_su_escritura_y_catalogo_por_clinica(self):
+        """Cada receta guarda su escritura y cada clínica su propio catálogo."""
+        self.clinica.agregar_paciente(self.paciente1)
+        self.clinica.agregar_medico(self.medico1)
+        self.clinica.emitir_receta("12345678", "1234", ["Ibuprofeno 400mg"])
+        self.clinica.emitir_receta("12345678", "1234", ["IBUPROFENO  400MG"])
+        otra = Clinica()
+        otra.agregar_paciente(Paciente("Juan Pérez", "12345678", "12/12/1990"))
+        otra.agregar_medico(Medico("Dr. Carlos Gómez", "1234"))
+        otra.emitir_receta("12345678", "1234", ["Clonazepam 0,5mg"])
+
+        recetas = self.clinica.obtener_recetas_con_medicamento("ibuprofeno 400mg")
+        self.assertEqual([r.obtener_medicamentos() for r in recetas], [["Ibuprofeno 400mg"], ["IBUPROFENO 400MG"]])
+        self.assertEqual(otra.obtener_recetas_con_medicamento("Ibuprofeno 400mg"), [])
+        self.assertEqual(self.clinica.obtener_recetas_con_medicamento("Clonazepam 0,5mg"), [])
+
     def test_error_historia_paciente_no_registrado(self):
         """Prueba error al obtener historia clínica de paciente no registrado."""
         with self.assertRaises(PacienteNoEncontradoException):
             self.clinica.obtener_historia_clinica("99999999")
 
+    # PRUEBAS DE RELOJ
+
+    def test_reloj_fijo_valida_turnos_y_fecha_recetas(self):
+        """Prueba que la clínica usa el reloj inyectado para validar turnos y fechar recetas."""
+        ahora = datetime(2020, 1, 1, 12, 0)
+        clinica = self.crear_clinica(reloj=RelojFijo(ahora))
+        clinica.agregar_paciente(self.paciente1)
+        clinica.agregar_medico(self.medico1)
+
+        # 2020-01-06 es lunes: en el pasado real, pero futuro para el reloj de la clínica
+        clinica.agendar_turno("12345678", "1234", "Pediatría", datetime(2020, 1, 6, 10, 0))
+        with self.assertRaises(DatosInvalidosException):
+            clinica.agendar_turno("12345678", "1234", "Pediatría", datetime(2019, 12, 30, 10, 0))
+        resultado = clinica.agendar_turnos_lote([
+            ("12345678", "1234", "Pediatría", datetime(2020, 1, 8, 10, 0)),
+            ("12345678", "1234", "Pediatría", datetime(2019, 12, 30, 10, 0)),
+        ], todo_o_nada=False)
+        self.assertEqual(list(resultado.obtener_turnos()), [0])
+
+        clinica.emitir_receta("12345678", "1234", ["Paracetamol"])
+        receta = clinica.obtener_historia_clinica("12345678").obtener_recetas()[0]
+        self.assertEqual(receta.obtener_fecha(), ahora)
+
+    # PRUEBAS DE LISTADOS PAGINADOS
+
+    def test_paginas_de_pacientes(self):
+        """Prueba paginar pacientes con altas entre una página y la siguiente."""
+        for i in range(5):
+            self.clinica.agregar_paciente(Paciente("Juan Pérez", str(10_000_000 + i), "12/12/1990"))
+
+        primera = self.clinica.obtener_pagina_pacientes(limite=2)
+        self.clinica.agregar_paciente(Paciente("Ana López", "87654321", "01/01/1985"))
+        segunda = self.clinica.obtener_pagina_pacientes(primera.obtener_siguiente(), limite=2)
+        ultima = self.clinica.obtener_pagina_pacientes(4, limite=2)
+
+        self.assertEqual([p.obtener_dni() for p in primera], ["10000000", "10000001"])
+        self.assertEqual([p.obtener_dni() for p in segunda], ["10000002", "10000003"])
+        self.assertEqual([p.obtener_dni() for p in ultima], ["10000004", "87654321"])
+        self.assertFalse(ultima.hay_siguiente())
+        self.assertEqual(len(list(self.clinica.iterar_pacientes())), 6)
+        with self.assertRaises(DatosInvalidosException):
+            self.clinica.obtener_pagina_pacientes(limite=0)
+
+    def test_paginas_de_medicos(self):
+        """Prueba paginar e iterar médicos."""
+        self.clinica.agregar_medico(self.medico1)
+        self.clinica.agregar_medico(self.medico2)
+
+        pagina = self.clinica.obtener_pagina_medicos(limite=5)
+
+        self.assertEqual(pagina.obtener_elementos(), [self.medico1, self.medico2])
+        self.assertIsNone(pagina.obtener_siguiente())
+        self.assertEqual(list(self.clinica.iterar_medicos()), [self.medico1, self.medico2])
+
+    def test_paginas_de_turnos_cronologicas(self):
+        """Prueba el cursor (fecha_hora, matricula) con turnos de varios médicos al mismo horario."""
+        self.clinica.agregar_paciente(self.paciente1)
+        self.clinica.agregar_medico(self.medico1)
+        otro = Medico("Dr. Pedro Rodríguez", "0001")
+        otro.agregar_especialidad(Especialidad("Pediatría", ["lunes"]))
+        self.clinica.agregar_medico(otro)
+        for hora in (12, 10, 11):
+            self.clinica.agendar_turno("12345678", "1234", "Pediatría", datetime(2030, 6, 3, hora, 0))
+            self.clinica.agendar_turno("12345678", "0001", "Pediatría", datetime(2030, 6, 3, hora, 0))
+
+        primera = self.clinica.obtener_pagina_turnos(limite=3)
+        # Un turno anterior al cursor no corre la página siguiente
+        self.clinica.agendar_turno("12345678", "1234", "Pediatría", datetime(2030, 6, 3, 9, 0))
+        segunda = self.clinica.obtener_pagina_turnos(primera.obtener_siguiente(), limite=3)
+
+        def claves(pagina):
+            return [(t.obtener_fecha_hora().hour, t.obtener_medico().obtener_matricula()) for t in pagina]
+
+        self.assertEqual(claves(primera), [(10, "0001"), (10, "1234"), (11, "0001")])
+        self.assertEqual(primera.obtener_siguiente(), (datetime(2030, 6, 3, 11, 0), "0001"))
+        self.assertEqual(claves(segunda), [(11, "1234"), (12, "0001"), (12, "1234")])
+        self.assertFalse(segunda.hay_siguiente())
+        self.assertEqual(len(list(self.clinica.iterar_turnos())), 7)
+
+    # PRUEBAS DE JOURNAL
+
+    def test_reconstruir_desde_journal(self):
+        """Prueba que un reinicio recupera pacientes, médicos, turnos y recetas."""
+        with tempfile.TemporaryDirectory() as directorio:
+            ruta = os.path.join(directorio, "clinica.journal")
+            
+            clinica = Clinica.desde_journal(ruta)
+            clinica.agregar_paciente(self.paciente1)
+            clinica.agregar_medico(self.medico1)
+            clinica.obtener_medico_por_matricula("1234").agregar_especialidad(
+                Especialidad("Cardiología", ["martes"])
+            )
+            clinica.agendar_turno("12345678", "1234", "Pediatría", datetime(2030, 6, 3, 10, 0))
+            clinica.agendar_turnos_lote([("12345678", "1234", "Cardiología", datetime(2030, 6, 4, 10, 0))])
+            clinica.emitir_receta("12345678", "1234", ["Paracetamol", "Ibuprofeno"])
+            with self.assertRaises(TurnoOcupadoException):
+                clinica.agendar_turno("12345678", "1234", "Pediatría", datetime(2030, 6, 3, 10, 0))
+            clinica.cerrar()
+            
+            restaurada = Clinica.desde_journal(ruta)
+            historia = restaurada.obtener_historia_clinica("12345678")
+            recetas = historia.obtener_recetas()
+            
+            self.assertEqual(len(restaurada.obtener_turnos()), 2)
+            self.assertEqual(len(historia.obtener_turnos()), 2)
+            self.assertEqual(recetas[0].obtener_medicamentos(), ["Paracetamol", "Ibuprofeno"])
+            self.assertEqual(restaurada.medicos_para("Cardiología", "martes")[0].obtener_matricula(), "1234")
+            with self.assertRaises(TurnoOcupadoException):
+                restaurada.agendar_turno("12345678", "1234", "Pediatría", datetime(2030, 6, 3, 10, 0))
+            restaurada.cerrar()
+
+    def test_cargar_no_apaga_el_recolector(self):
+        """Prueba que la carga no desactiva el recolector de ciclos, que es de todo el proceso."""
+        estados = []
+        aplicar = Clinica._aplicar_evento
+        
+        def aplicar_y_observar(clinica, evento):
+            estados.append(gc.isenabled())
+            return aplicar(clinica, evento)
+        
+        with mock.patch.object(Clinica, "_aplicar_evento", aplicar_y_observar):
+            Clinica()._cargar_eventos([{"op": "paciente", "nombre": "Juan Pérez", "dni": "12345678",
+                                        "fecha_nacimiento": "12/12/1990"}])
+        
+        self.assertEqual(estados, [True])
+        self.assertTrue(gc.isenabled())
+
+    def test_journal_con_escritura_cortada(self):
+        """Prueba que tras una escritura cortada los eventos siguientes no se pegan a ella."""
+        with tempfile.TemporaryDirectory() as directorio:
+            ruta = os.path.join(directorio, "clinica.journal")
+            clinica = Clinica.desde_journal(ruta)
+            clinica.agregar_paciente(self.paciente1)
+            clinica.agregar_medico(self.medico1)
+            clinica.cerrar()
+            with open(ruta, "a", encoding="utf-8") as archivo:
+                archivo.write('{"op":"turno","dni":"1234')
+
+            clinica = Clinica.desde_journal(ruta)
+            clinica.agendar_turno("12345678", "1234", "Pediatría", datetime(2030, 6, 3, 10, 0))
+            clinica.agendar_turno("12345678", "1234", "Pediatría", datetime(2030, 6, 3, 11, 0))
+            clinica.cerrar()
+
+            restaurada = Clinica.desde_journal(ruta)
+            self.assertEqual([t.obtener_fecha_hora().hour for t in restaurada.obtener_turnos()], [10, 11])
+            restaurada.cerrar()
+
+    def test_cancelaciones_tras_reinicio(self):
+        """Prueba que cancelaciones y reprogramaciones se recuperan del snapshot y del journal."""
+        with tempfile.TemporaryDirectory() as directorio:
+            clinica = Clinica.desde_directorio(directorio)
+            clinica.agregar_paciente(self.paciente1)
+            clinica.agregar_medico(self.medico1)
+            clinica.agendar_turno("12345678", "1234", "Pediatría", datetime(2030, 6, 3, 10, 0))
+            clinica.cancelar_turno("1234", datetime(2030, 6, 3, 10, 0))
+            clinica.agendar_turno("12345678", "1234", "Pediatría", datetime(2030, 6, 3, 10, 0))
+            clinica.tomar_snapshot()
+            clinica.reprogramar_turno("1234", datetime(2030, 6, 3, 10, 0), datetime(2030, 6, 5, 10, 0))
+            clinica.cerrar()
+            
+            restaurada = Clinica.desde_directorio(directorio)
+            historia = restaurada.obtener_historia_clinica("12345678").obtener_turnos()
+            self.assertEqual([t.esta_cancelado() for t in historia], [True, True, False])
+            self.assertEqual([t.obtener_fecha_hora() for t in restaurada.obtener_turnos()],
+                             [datetime(2030, 6, 5, 10, 0)])
+            restaurada.agendar_turno("12345678", "1234", "Pediatría", datetime(2030, 6, 3, 10, 0))
+            restaurada.cerrar()
+
+    def test_duraciones_tras_reinicio(self):
+        """Prueba que las duraciones de especialidades y turnos se recuperan del snapshot y del journal."""
+        with tempfile.TemporaryDirectory() as directorio:
+            clinica = Clinica.desde_directorio(directorio)
+            clinica.agregar_paciente(self.paciente1)
+            medico = Medico("Dr. Luis Díaz", "4321")
+            medico.agregar_especialidad(Especialidad("Psiquiatría", ["lunes"], duracion_minutos=50))
+            clinica.agregar_medico(medico)
+            clinica.agendar_turno("12345678", "4321", "Psiquiatría", datetime(2030, 6, 3, 10, 0))
+            clinica.tomar_snapshot()
+            medico.agregar_especialidad(Especialidad("Clínica", ["martes"], duracion_minutos=15))
+            clinica.agendar_turno("12345678", "4321", "Clínica", datetime(2030, 6, 4, 10, 0))
+            clinica.cerrar()
+            
+            restaurada = Clinica.desde_directorio(directorio)
+            medico = restaurada.obtener_medico_por_matricula("4321")
+            self.assertEqual([medico.obtener_duracion_para_dia(dia) for dia in (0, 1)], [50, 15])
+            self.assertEqual([t.obtener_duracion_minutos() for t in restaurada.obtener_turnos()], [50, 15])
+            with self.assertRaises(TurnoOcupadoException):
+                restaurada.agendar_turno("12345678", "4321", "Psiquiatría", datetime(2030, 6, 3, 10, 45))
+            restaurada.agendar_turno("12345678", "4321", "Clínica", datetime(2030, 6, 4, 10, 15))
+            restaurada.cerrar()
+
+    def test_reproducir_journal_con_journal_activo(self):
+        """Prueba error al reproducir un journal sobre una clínica que ya registra en uno."""
+        with tempfile.TemporaryDirectory() as directorio:
+            clinica = Clinica.desde_journal(os.path.join(directorio, "clinica.journal"))
+            with self.assertRaises(DatosInvalidosException):
+                clinica.reproducir_journal(os.path.join(directorio, "otro.journal"))
+            clinica.cerrar()
+
+    def test_snapshot_y_cola_del_journal(self):
+        """Prueba reiniciar desde un snapshot más los eventos posteriores."""
+        with tempfile.TemporaryDirectory() as directorio:
+            clinica = Clinica.desde_directorio(directorio)
+            clinica.agregar_paciente(self.paciente1)
+            clinica.agregar_medico(self.medico1)
+            clinica.agendar_turno("12345678", "1234", "Pediatría", datetime(2030, 6, 3, 10, 0))
+            clinica.emitir_receta("12345678", "1234", ["Paracetamol"])
+            clinica.tomar_snapshot()
+            
+            clinica.agregar_paciente(self.paciente2)
+            clinica.obtener_medico_por_matricula("1234").agregar_especialidad(
+                Especialidad("Cardiología", ["martes"])
+            )
+            clinica.agendar_turno("87654321", "1234", "Cardiología", datetime(2030, 6, 4, 10, 0))
+            clinica.cerrar()
+            
+            self.assertEqual(sorted(os.listdir(directorio)), ["journal-000002.log", "snapshot-000002.bin"])
+            
+            restaurada = Clinica.desde_directorio(directorio)
+            turnos = restaurada.obtener_turnos()
+            historia = restaurada.obtener_historia_clinica("12345678")
+            
+            self.assertEqual(len(restaurada.obtener_pacientes()), 2)
+            self.assertEqual([t.obtener_fecha_hora() for t in turnos],
+                             [datetime(2030, 6, 3, 10, 0), datetime(2030, 6, 4, 10, 0)])
+            self.assertEqual(historia.obtener_recetas()[0].obtener_medicamentos(), ["Paracetamol"])
+            self.assertEqual(historia.obtener_recetas()[0].obtener_fecha(),
+                             clinica.obtener_historia_clinica("12345678").obtener_recetas()[0].obtener_fecha())
+            self.assertEqual(restaurada.medicos_para("Cardiología", 1)[0].obtener_matricula(), "1234")
+            self.assertEqual(len(restaurada.obtener_recetas_con_medicamento("paracetamol")), 1)
+            with self.assertRaises(TurnoOcupadoException):
+                restaurada.agendar_turno("12345678", "1234", "Pediatría", datetime(2030, 6, 3, 10, 0))
+            restaurada.cerrar()
+
+    def test_snapshot_periodico(self):
+        """Prueba que se toma un snapshot automáticamente cada N eventos."""
+        with tempfile.TemporaryDirectory() as directorio:
+            clinica = Clinica.desde_directorio(directorio, eventos_por_snapshot=3)
+            clinica.agregar_paciente(self.paciente1)
+            clinica.agregar_medico(self.medico1)
+            self.assertEqual(os.listdir(directorio), ["journal-000001.log"])
+            
+            clinica.agendar_turno("12345678", "1234", "Pediatría", datetime(2030, 6, 3, 10, 0))
+            clinica.cerrar()
+            
+            self.assertIn("snapshot-000002.bin", os.listdir(directorio))
+            restaurada = Clinica.desde_directorio(directorio)
+            self.assertEqual(len(restaurada.obtener_turnos()), 1)
+            restaurada.cerrar()
+
+    def test_snapshot_periodico_concurrente(self):
+        """Prueba que los hilos que cruzan juntos el umbral no toman cada uno su snapshot."""
+        with tempfile.TemporaryDirectory() as directorio:
+            clinica = Clinica.desde_directorio(directorio, concurrente=True, eventos_por_snapshot=50)
+            clinica.agregar_paciente(self.paciente1)
+            matriculas = [f"M{i}" for i in range(8)]
+            for matricula in matriculas:
+                medico = Medico("Dr. Carlos Gómez", matricula)
+                medico.agregar_especialidad(Especialidad("Pediatría", ["lunes"], duracion_minutos=1))
+                clinica.agregar_medico(medico)
+            snapshots = []
+            tomar_snapshot = clinica.tomar_snapshot
+            
+            def contar_snapshot():
+                snapshots.append(None)
+                tomar_snapshot()
+            
+            clinica.tomar_snapshot = contar_snapshot
+            barrera = threading.Barrier(len(matriculas))
+            
+            def agendar(matricula):
+                barrera.wait()
+                for minuto in range(100):
+                    clinica.agendar_turno("12345678", matricula, "Pediatría",
+                                          datetime(2030, 6, 3, 8, 0) + timedelta(minutes=minuto))
+            
+            intervalo = sys.getswitchinterval()
+            sys.setswitchinterval(1e-6)
+            try:
+                hilos = [threading.Thread(target=agendar, args=(matricula,)) for matricula in matriculas]
+                for hilo in hilos:
+                    hilo.start()
+                for hilo in hilos:
+                    hilo.join()
+            finally:
+                sys.setswitchinterval(intervalo)
+            clinica.cerrar()
+            
+            # 809 eventos: a lo sumo un snapshot cada 50
+            self.assertLessEqual(len(snapshots), 809 // 50)
+            restaurada = Clinica.desde_directorio(directorio)
+            self.assertEqual(len(restaurada.obtener_turnos()), 800)
+            restaurada.cerrar()
+
+    def test_tomar_snapshot_sin_directorio(self):
+        """Prueba error al pedir un snapshot sin persistencia en directorio."""
+        with self.assertRaises(DatosInvalidosException):
+            self.clinica.tomar_snapshot()
+
+    # PRUEBAS DE CONCURRENCIA
+
+    def test_concurrencia_turnos_sin_duplicados(self):
+        """Prueba que muchos hilos compitiendo por los mismos horarios no generan duplicados."""
+        clinica = self.crear_clinica(concurrente=True)
+        clinica.agregar_paciente(self.paciente1)
+        matriculas = [f"M{i}" for i in range(4)]
+        for matricula in matriculas:
+            medico = Medico("Dr. Carlos Gómez", matricula)
+            medico.agregar_especialidad(Especialidad("Pediatría", ["lunes"], duracion_minutos=1))
+            clinica.agregar_medico(medico)
+        
+        horarios = [datetime(2030, 6, 3, 8, 0) + timedelta(minutes=i) for i in range(300)]
+        exitos = []
+        ocupados = []
+        barrera = threading.Barrier(16)
+        
+        def agendar():
+            barrera.wait()
+            for fecha_hora in horarios:
+                for matricula in matriculas:
+                    try:
+                        clinica.agendar_turno("12345678", matricula, "Pediatría", fecha_hora)
+                        exitos.append((matricula, fecha_hora))
+                    except TurnoOcupadoException:
+                        ocupados.append((matricula, fecha_hora))
+        
+        # Cambios de hilo muy frecuentes para forzar intercalados
+        intervalo = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+        try:
+            hilos = [threading.Thread(target=agendar) for _ in range(16)]
+            for hilo in hilos:
+                hilo.start()
+            for hilo in hilos:
+                hilo.join()
+        finally:
+            sys.setswitchinterval(intervalo)
+        
+        self.assertEqual(len(exitos), len(horarios) * len(matriculas))
+        self.assertEqual(len(set(exitos)), len(exitos))
+        self.assertEqual(len(ocupados), 15 * len(exitos))
+        self.assertEqual(len(clinica.obtener_turnos()), len(exitos))
+        self.assertEqual(len(clinica.obtener_historia_clinica("12345678").obtener_turnos()), len(exitos))
+        for matricula in matriculas:
+            agenda = clinica.obtener_turnos_medico_entre(matricula, datetime(2030, 6, 3), datetime(2030, 6, 4))
+            self.assertEqual([t.obtener_fecha_hora() for t in agenda], horarios)
+
+    def test_buscar_turnos_libres_toma_el_bloqueo_del_medico(self):
+        """Prueba que la búsqueda de horarios libres lee la agenda con el bloqueo del médico."""
+        clinica = self.crear_clinica(concurrente=True)
+        clinica.agregar_medico(self.medico1)
+        libres = clinica.buscar_turnos_libres("Pediatría", datetime(2030, 6, 3), datetime(2030, 6, 4))
+        primeros = []
+        
+        with clinica._bloqueo_medico("1234"):
+            hilo = threading.Thread(target=lambda: primeros.append(next(libres)))
+            hilo.start()
+            hilo.join(0.2)
+            # Mientras otro tiene el bloqueo del médico, la búsqueda espera
+            self.assertTrue(hilo.is_alive())
+        hilo.join()
+        
+        self.assertEqual(primeros[0][0], datetime(2030, 6, 3, 8, 0))
+
+    def test_concurrencia_registro_pacientes(self):
+        """Prueba que el alta concurrente de pacientes no acepta DNIs repetidos."""
+        clinica = self.crear_clinica(concurrente=True)
+        duplicados = []
+        
+        def registrar():
+            for i in range(200):
+                try:
+                    clinica.agregar_paciente(Paciente("Juan Pérez", str(10_000_000 + i), "12/12/1990"))
+                except PacienteDuplicadoException:
+                    duplicados.append(i)
+        
+        hilos = [threading.Thread(target=registrar) for _ in range(8)]
+        for hilo in hilos:
+            hilo.start()
+        for hilo in hilos:
+            hilo.join()
+        
+        self.assertEqual(len(clinica.obtener_pacientes()), 200)
+        self.assertEqual(len(duplicados), 7 * 200)
+
     # MÉTODOS AUXILIARES
 
     def _obtener_proximo_lunes(self):
@@ -249,5 +1078,25 @@ class TestClinica(unittest.TestCase):
         return datetime(2024, 11, 5, 10, 0)
 
 
-if __name__ == "_main_":
+class TestClinicaSQLite(TestClinica):
+    """Repite todas las pruebas de TestClinica con la clínica guardada en SQLite."""
+    
+    def setUp(self):
+        self.directorio = tempfile.TemporaryDirectory()
+        self.repositorios = []
+        super().setUp()
+    
+    def tearDown(self):
+        for repositorio in self.repositorios:
+            repositorio.cerrar()
+        self.directorio.cleanup()
+    
+    def crear_clinica(self, concurrente: bool = False, reloj=None) -> Clinica:
+        ruta = os.path.join(self.directorio.name, f"clinica{len(self.repositorios)}.db")
+        repositorio = RepositorioSQLite(ruta)
+        self.repositorios.append(repositorio)
+        return Clinica(concurrente=concurrente, repositorio=repositorio, reloj=reloj)
+
+
+if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
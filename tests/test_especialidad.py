@@ -1,5 +1,6 @@
 import unittest
 from src.especialidad import Especialidad
+from src.excepciones import DatosInvalidosException
 
 class TestEspecialidad(unittest.TestCase):
     def setUp(self):
@@ -13,10 +14,20 @@ class TestEspecialidad(unittest.TestCase):
         self.assertTrue(self.especialidad.verificar_dia("Miércoles"))
         self.assertFalse(self.especialidad.verificar_dia("domingo"))
 
+    def test_obtener_dias_semana(self):
+        self.assertEqual(self.especialidad.obtener_dias_semana(), [0, 2, 4])
+
+    def test_duracion_minutos(self):
+        self.assertEqual(self.especialidad.obtener_duracion_minutos(), Especialidad.DURACION_PREDETERMINADA)
+        self.assertEqual(Especialidad("Psiquiatría", ["martes"], 45).obtener_duracion_minutos(), 45)
+        for invalida in (0, -10, 24 * 60, 30.5, True, "30"):
+            with self.assertRaises(DatosInvalidosException):
+                Especialidad("Psiquiatría", ["martes"], invalida)
+
     def test_str(self):
         self.assertIn("Pediatría", str(self.especialidad))
         self.assertIn("lunes", str(self.especialidad))
 
-if __name__ == "_main_":
+if __name__ == "__main__":
    unittest.main()
 
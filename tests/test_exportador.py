@@ -0,0 +1,71 @@
+import csv
+import io
+import json
+import os
+import tempfile
+import unittest
+from datetime import datetime
+
+from src.clinica import Clinica
+from src.exportador import Exportador
+from src.paciente import Paciente
+from src.medico import Medico
+from src.especialidad import Especialidad
+from src.excepciones import PacienteNoEncontradoException, DatosInvalidosException
+
+
+class TestExportador(unittest.TestCase):
+
+    def setUp(self):
+        self.clinica = Clinica()
+        self.clinica.agregar_paciente(Paciente("Juan Pérez", "12345678", "12/12/1990"))
+        self.clinica.agregar_paciente(Paciente("Ana López", "87654321", "01/01/1985"))
+        medico = Medico("Dr. Carlos Gómez", "1234")
+        medico.agregar_especialidad(Especialidad("Pediatría", ["lunes"]))
+        self.clinica.agregar_medico(medico)
+        self.clinica.agendar_turno("12345678", "1234", "Pediatría", datetime(2030, 6, 3, 10, 0))
+        self.clinica.agendar_turno("87654321", "1234", "Pediatría", datetime(2030, 6, 10, 10, 0))
+        self.clinica.emitir_receta("12345678", "1234", ["Paracetamol", "Ibuprofeno"])
+        self.exportador = Exportador(self.clinica)
+
+    def test_exportar_jsonl_a_archivo_abierto(self):
+        salida = io.StringIO()
+
+        cantidad = self.exportador.exportar(salida)
+
+        registros = [json.loads(linea) for linea in salida.getvalue().splitlines()]
+        self.assertEqual(cantidad, 3)
+        self.assertEqual([(r["tipo"], r["dni"]) for r in registros],
+                         [("turno", "12345678"), ("receta", "12345678"), ("turno", "87654321")])
+        self.assertEqual(registros[0]["fecha"], "2030-06-03T10:00:00")
+        self.assertEqual(registros[1]["medicamentos"], ["Paracetamol", "Ibuprofeno"])
+
+    def test_exportar_csv_a_ruta(self):
+        with tempfile.TemporaryDirectory() as directorio:
+            ruta = os.path.join(directorio, "historias.csv")
+            self.exportador.exportar(ruta, formato="csv")
+            with open(ruta, encoding="utf-8", newline="") as archivo:
+                filas = list(csv.DictReader(archivo))
+
+        self.assertEqual(len(filas), 3)
+        self.assertEqual(filas[1]["medicamentos"], "Paracetamol|Ibuprofeno")
+        self.assertEqual(filas[2]["paciente"], "Ana López")
+
+    def test_filtros(self):
+        por_dni = list(self.exportador.registros(dnis=["87654321"]))
+        por_fecha = list(self.exportador.registros(desde=datetime(2030, 6, 1), hasta=datetime(2030, 6, 10)))
+
+        self.assertEqual([r["dni"] for r in por_dni], ["87654321"])
+        self.assertEqual([r["fecha"] for r in por_fecha], ["2030-06-03T10:00:00"])
+        self.assertEqual([r["fecha"] for r in self.exportador.registros(desde=datetime(2030, 6, 3, 10, 1))],
+                         ["2030-06-10T10:00:00"])
+
+    def test_errores(self):
+        with self.assertRaises(PacienteNoEncontradoException):
+            list(self.exportador.registros(dnis=["99999999"]))
+        with self.assertRaises(DatosInvalidosException):
+            self.exportador.exportar(io.StringIO(), formato="xml")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,10 +1,21 @@
+import random
 import unittest
+from datetime import datetime, timedelta
+from unittest import mock
 from src.historiaclinica import HistoriaClinica
+from src.reloj import a_instante
 
 class Dummy:
-    def _init_(self, nombre):
+    def __init__(self, nombre, fecha=datetime(2030, 6, 3, 9, 0)):
         self.nombre = nombre
-    def _str_(self):
+        self.fecha = fecha
+    def obtener_fecha_hora(self):
+        return self.fecha
+    def obtener_fecha(self):
+        return self.fecha
+    def obtener_instante(self):
+        return a_instante(self.fecha)
+    def __str__(self):
         return self.nombre
 
 class TestHistoriaClinica(unittest.TestCase):
@@ -22,11 +33,105 @@ class TestHistoriaClinica(unittest.TestCase):
         self.historia.agregar_receta(self.receta)
         self.assertIn(self.receta, self.historia.obtener_recetas())
 
+    def test_iterar_sin_copiar(self):
+        self.historia.agregar_turno(self.turno)
+        self.historia.agregar_receta(self.receta)
+        self.assertEqual(list(self.historia.iterar_turnos()), [self.turno])
+        self.assertEqual(list(self.historia.iterar_recetas()), [self.receta])
+
+    def test_vistas_de_solo_lectura(self):
+        self.historia.agregar_turno(self.turno)
+        self.historia.agregar_receta(self.receta)
+        turnos = self.historia.vista_turnos()
+        recetas = self.historia.vista_recetas()
+        self.assertEqual(turnos, [self.turno])
+        self.assertEqual(recetas, [self.receta])
+        self.assertIs(turnos[-1], self.turno)
+        self.assertIn(self.receta, recetas)
+        with self.assertRaises(IndexError):
+            turnos[1]
+        with self.assertRaises(TypeError):
+            turnos[0] = self.receta
+        self.assertFalse(hasattr(turnos, "append"))
+
+    def test_vista_conserva_el_momento_en_que_se_tomo(self):
+        self.historia.agregar_turno(self.turno)
+        vista = self.historia.vista_turnos()
+        otro = Dummy("Otro Turno")
+        self.historia.agregar_turno(otro)
+        self.assertEqual(list(vista), [self.turno])
+        self.assertEqual(vista[:], [self.turno])
+        self.assertEqual(self.historia.vista_turnos(), [self.turno, otro])
+
+    def test_orden_por_fecha(self):
+        tarde = Dummy("Tarde", datetime(2030, 6, 5, 9, 0))
+        temprano = Dummy("Temprano", datetime(2030, 6, 1, 9, 0))
+        mismo_horario = Dummy("Mismo horario")
+        for turno in (self.turno, tarde, temprano, mismo_horario):
+            self.historia.agregar_turno(turno)
+        self.assertEqual(self.historia.obtener_turnos(), [temprano, self.turno, mismo_horario, tarde])
+
+    def test_insertar_en_el_medio_no_altera_vistas_previas(self):
+        self.historia.agregar_turno(self.turno)
+        vista = self.historia.vista_turnos()
+        self.historia.agregar_turno(Dummy("Antes", datetime(2030, 6, 1, 9, 0)))
+        self.assertEqual(list(vista), [self.turno])
+
+    def test_consultas_por_fecha(self):
+        recetas = [Dummy(f"Receta {dia}", datetime(2030, 6, dia, 10, 0)) for dia in (4, 1, 3, 2, 5)]
+        for receta in recetas:
+            self.historia.agregar_receta(receta)
+        ordenadas = sorted(recetas, key=lambda r: r.fecha)
+        self.assertEqual(self.historia.obtener_recetas_entre(datetime(2030, 6, 2), datetime(2030, 6, 4)), ordenadas[1:3])
+        self.assertEqual(self.historia.obtener_ultimas_recetas(2), ordenadas[3:])
+        self.assertEqual(self.historia.obtener_ultimas_recetas(2, hasta=datetime(2030, 6, 3)), ordenadas[:2])
+        self.assertEqual(self.historia.obtener_ultimas_recetas(10), ordenadas)
+        self.assertEqual(self.historia.obtener_ultimos_turnos(3), [])
+        self.assertEqual(list(self.historia.iterar_recetas(datetime(2030, 6, 4))), ordenadas[3:])
+        self.assertEqual(list(self.historia.iterar_recetas(hasta=datetime(2030, 6, 2))), ordenadas[:1])
+
+    def test_cronologia_intercalada(self):
+        receta_antes = Dummy("Receta antes", datetime(2030, 6, 2, 10, 0))
+        receta_despues = Dummy("Receta después", datetime(2030, 6, 4, 10, 0))
+        self.historia.agregar_receta(receta_despues)
+        self.historia.agregar_receta(receta_antes)
+        self.historia.agregar_turno(self.turno)
+        cronologia = [elemento for _, elemento in self.historia.iterar_cronologia()]
+        self.assertEqual(cronologia, [receta_antes, self.turno, receta_despues])
+        tramo = list(self.historia.iterar_cronologia(datetime(2030, 6, 3), datetime(2030, 6, 4, 10, 0)))
+        self.assertEqual(tramo, [(self.turno.fecha, self.turno)])
+
+    def test_bloques_contra_lista_ordenada(self):
+        """Con bloques chicos, las inserciones fuera de orden dividen bloques sin alterar vistas previas."""
+        azar = random.Random(3)
+        modelo, vistas = [], []
+        with mock.patch.object(HistoriaClinica, "CARGA", 2):
+            for i in range(300):
+                turno = Dummy(f"Turno {i}", datetime(2030, 6, 1) + timedelta(hours=azar.randrange(40)))
+                self.historia.agregar_turno(turno)
+                modelo.append(turno)
+                modelo.sort(key=lambda t: t.fecha)
+                if azar.random() < 0.2:
+                    vistas.append((self.historia.vista_turnos(), list(modelo)))
+                desde, hasta = sorted(datetime(2030, 6, 1) + timedelta(hours=azar.randrange(42)) for _ in range(2))
+                en_rango = [t for t in modelo if desde <= t.fecha < hasta]
+                self.assertEqual(self.historia.obtener_turnos_entre(desde, hasta), en_rango)
+                self.assertEqual(list(self.historia.iterar_turnos(desde, hasta)), en_rango)
+                self.assertEqual(list(self.historia.iterar_turnos(hasta, desde)), [])
+                anteriores = [t for t in modelo if t.fecha < hasta]
+                self.assertEqual(self.historia.obtener_ultimos_turnos(5, hasta=hasta), anteriores[-5:])
+        self.assertEqual(self.historia.obtener_turnos(), modelo)
+        self.assertEqual(self.historia.obtener_ultimos_turnos(7), modelo[-7:])
+        for vista, foto in vistas:
+            self.assertEqual(vista, foto)
+            self.assertEqual(vista[:], foto)
+            self.assertIs(vista[-1], foto[-1])
+
     def test_str(self):
         self.historia.agregar_turno(self.turno)
         self.historia.agregar_receta(self.receta)
         self.assertIn("Turno Test", str(self.historia))
         self.assertIn("Receta Test", str(self.historia))
 
-if _name_ == "_main_":
+if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
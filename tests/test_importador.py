@@ -0,0 +1,113 @@
+import json
+import os
+import tempfile
+import unittest
+
+from src.clinica import Clinica
+from src.importador import Importador
+from src.paciente import Paciente
+from src.excepciones import PacienteDuplicadoException, MedicoDuplicadoException, DatosInvalidosException
+
+
+class TestImportador(unittest.TestCase):
+
+    def setUp(self):
+        self.directorio = tempfile.TemporaryDirectory()
+        self.clinica = Clinica()
+        self.importador = Importador(self.clinica, tamano_lote=2)
+
+    def tearDown(self):
+        self.directorio.cleanup()
+
+    def escribir(self, nombre: str, contenido: str) -> str:
+        ruta = os.path.join(self.directorio.name, nombre)
+        with open(ruta, "w", encoding="utf-8") as archivo:
+            archivo.write(contenido)
+        return ruta
+
+    def test_importar_pacientes_csv(self):
+        self.clinica.agregar_paciente(Paciente("Ana López", "87654321", "01/01/1985"))
+        ruta = self.escribir("pacientes.csv", (
+            "nombre,dni,fecha_nacimiento\n"
+            "Juan Pérez,12345678,12/12/1990\n"
+            "María Gómez,23456789,31/02/1990\n"
+            "Pedro Ruiz,34567890,05/05/1970\n"
+            "Juan Repetido,12345678,12/12/1990\n"
+            "Ana Repetida,87654321,01/01/1985\n"
+            "Luis Díaz,45678901,\n"
+            "Carla Sosa,5678901,07/07/2000\n"
+        ))
+
+        reporte = self.importador.importar_pacientes(ruta)
+
+        self.assertEqual(reporte.obtener_importados(), 3)
+        self.assertEqual(sorted(reporte.obtener_errores()), [3, 5, 6, 7])
+        self.assertIsInstance(reporte.obtener_errores()[3], DatosInvalidosException)
+        self.assertIsInstance(reporte.obtener_errores()[5], PacienteDuplicadoException)
+        self.assertIsInstance(reporte.obtener_errores()[6], PacienteDuplicadoException)
+        self.assertEqual(len(self.clinica.obtener_pacientes()), 4)
+        self.assertIn("Línea 3", str(reporte))
+
+    def test_duplicado_dentro_del_lote(self):
+        ruta = self.escribir("pacientes.jsonl", "\n".join(json.dumps(fila) for fila in [
+            {"nombre": "Juan Pérez", "dni": "12345678", "fecha_nacimiento": "12/12/1990"},
+            {"nombre": "Juan Pérez", "dni": "12345678", "fecha_nacimiento": "12/12/1990"},
+        ]))
+
+        reporte = Importador(self.clinica, tamano_lote=10).importar_pacientes(ruta)
+
+        self.assertEqual(reporte.obtener_importados(), 1)
+        self.assertIn("línea 1", str(reporte.obtener_errores()[2]))
+
+    def test_importar_pacientes_jsonl_con_lineas_invalidas(self):
+        ruta = self.escribir("pacientes.jsonl", (
+            '{"nombre": "Juan Pérez", "dni": "12345678", "fecha_nacimiento": "12/12/1990"}\n'
+            '{"nombre": "Ana López", "dni": 87654321, "fecha_nacimiento": "01/01/1985"}\n'
+            '\n'
+            '{"nombre": "roto"\n'
+            '["no", "es", "objeto"]\n'
+        ))
+
+        reporte = self.importador.importar_pacientes(ruta)
+
+        self.assertEqual(reporte.obtener_importados(), 1)
+        self.assertEqual(sorted(reporte.obtener_errores()), [2, 4, 5])
+
+    def test_importar_medicos(self):
+        ruta_csv = self.escribir("medicos.csv", (
+            "nombre,matricula,especialidades\n"
+            "Dr. Carlos Gómez,1234,Pediatría:lunes|miércoles;Cardiología:martes:45\n"
+            "Dra. María García,5678,\n"
+            "Dr. Sin Días,9999,Pediatría\n"
+            "Dr. Duración Inválida,8888,Pediatría:lunes:media hora\n"
+        ))
+        ruta_jsonl = self.escribir("medicos.jsonl", (
+            '{"nombre": "Dr. Pablo Ruiz", "matricula": "4321",'
+            ' "especialidades": [{"tipo": "Traumatología", "dias": ["viernes"], "duracion_minutos": 15}]}\n'
+            '{"nombre": "Dr. Otro", "matricula": "1234", "especialidades": []}\n'
+        ))
+
+        reporte_csv = self.importador.importar_medicos(ruta_csv)
+        reporte_jsonl = self.importador.importar_medicos(ruta_jsonl)
+
+        self.assertEqual(reporte_csv.obtener_importados(), 2)
+        self.assertEqual(list(reporte_csv.obtener_errores()), [4, 5])
+        self.assertEqual(reporte_jsonl.obtener_importados(), 1)
+        self.assertIsInstance(reporte_jsonl.obtener_errores()[2], MedicoDuplicadoException)
+        self.assertEqual(self.clinica.medicos_para("Cardiología", "martes")[0].obtener_matricula(), "1234")
+        self.assertEqual(self.clinica.medicos_para("Traumatología", 4)[0].obtener_matricula(), "4321")
+        medico = self.clinica.obtener_medico_por_matricula("1234")
+        self.assertEqual([medico.obtener_duracion_para_dia(dia) for dia in range(3)], [30, 45, 30])
+        self.assertEqual(self.clinica.obtener_medico_por_matricula("4321").obtener_duracion_para_dia(4), 15)
+
+    def test_errores_de_archivo(self):
+        with self.assertRaises(DatosInvalidosException):
+            self.importador.importar_pacientes(self.escribir("pacientes.txt", ""))
+        with self.assertRaises(DatosInvalidosException):
+            self.importador.importar_pacientes(self.escribir("pacientes.csv", "nombre,dni\nJuan Pérez,12345678\n"))
+        with self.assertRaises(DatosInvalidosException):
+            Importador(self.clinica, tamano_lote=0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,106 @@
+import os
+import tempfile
+import threading
+import time
+import unittest
+from unittest import mock
+
+from src.journal import Journal
+from src.excepciones import DatosInvalidosException
+
+
+class TestJournal(unittest.TestCase):
+
+    def setUp(self):
+        self.directorio = tempfile.TemporaryDirectory()
+        self.ruta = os.path.join(self.directorio.name, "clinica.journal")
+
+    def tearDown(self):
+        self.directorio.cleanup()
+
+    def test_registrar_y_leer(self):
+        with Journal(self.ruta, eventos_por_sincronizacion=2) as journal:
+            journal.registrar({"op": "paciente", "dni": "12345678"})
+            journal.registrar({"op": "turno", "dni": "12345678"}, {"op": "turno", "dni": "87654321"})
+
+        eventos = list(Journal.leer(self.ruta))
+        self.assertEqual([e["op"] for e in eventos], ["paciente", "turno", "turno"])
+        self.assertEqual(eventos[2]["dni"], "87654321")
+
+    def test_agrega_al_final(self):
+        with Journal(self.ruta) as journal:
+            journal.registrar({"op": "a"})
+        with Journal(self.ruta) as journal:
+            journal.registrar({"op": "b"})
+
+        self.assertEqual([e["op"] for e in Journal.leer(self.ruta)], ["a", "b"])
+
+    def test_leer_journal_inexistente(self):
+        self.assertEqual(list(Journal.leer(self.ruta)), [])
+
+    def test_descarta_ultima_linea_incompleta(self):
+        with open(self.ruta, "w", encoding="utf-8") as archivo:
+            archivo.write('{"op": "a"}\n{"op": "b"}\n{"op": "tu')
+
+        self.assertEqual([e["op"] for e in Journal.leer(self.ruta)], ["a", "b"])
+
+    def test_agrega_despues_de_linea_incompleta(self):
+        with open(self.ruta, "w", encoding="utf-8") as archivo:
+            archivo.write('{"op": "a"}\n{"op": "tu')
+        with Journal(self.ruta) as journal:
+            journal.registrar({"op": "b"})
+        with Journal(self.ruta) as journal:
+            journal.registrar({"op": "c"})
+
+        self.assertEqual([e["op"] for e in Journal.leer(self.ruta)], ["a", "b", "c"])
+
+    def test_completa_ultimo_evento_sin_salto(self):
+        with open(self.ruta, "w", encoding="utf-8") as archivo:
+            archivo.write('{"op": "a"}\n{"op": "b"}')
+        with Journal(self.ruta) as journal:
+            journal.registrar({"op": "c"})
+
+        self.assertEqual([e["op"] for e in Journal.leer(self.ruta)], ["a", "b", "c"])
+
+    def test_linea_corrupta_intermedia(self):
+        with open(self.ruta, "w", encoding="utf-8") as archivo:
+            archivo.write('{"op": "a"}\n{"op"\n{"op": "b"}\n')
+
+        with self.assertRaises(DatosInvalidosException):
+            list(Journal.leer(self.ruta))
+
+    def test_hilos_comparten_fsync(self):
+        """Con fsync en cada evento, los hilos que escriben mientras otro espera al disco comparten el siguiente."""
+        fsync = os.fsync
+        llamadas = []
+
+        def fsync_lento(descriptor):
+            llamadas.append(descriptor)
+            time.sleep(0.002)
+            fsync(descriptor)
+
+        barrera = threading.Barrier(8)
+        with Journal(self.ruta, eventos_por_sincronizacion=1) as journal:
+            def escribir(hilo):
+                barrera.wait()
+                for i in range(20):
+                    journal.registrar({"op": "paciente", "dni": f"{hilo}-{i}"})
+
+            with mock.patch("src.journal.os.fsync", fsync_lento):
+                hilos = [threading.Thread(target=escribir, args=(n,)) for n in range(8)]
+                for hilo in hilos:
+                    hilo.start()
+                for hilo in hilos:
+                    hilo.join()
+
+        self.assertEqual(sorted(e["dni"] for e in Journal.leer(self.ruta)),
+                         sorted(f"{h}-{i}" for h in range(8) for i in range(20)))
+        self.assertLess(len(llamadas), 8 * 20)
+
+    def test_sincronizacion_invalida(self):
+        with self.assertRaises(DatosInvalidosException):
+            Journal(self.ruta, eventos_por_sincronizacion=0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -51,6 +51,44 @@ class TestMedico(unittest.TestCase):
         self.assertIsNone(medico.obtener_especialidad_para_dia("martes"))
         self.assertIsNone(medico.obtener_especialidad_para_dia("domingo"))
 
+    def test_obtener_especialidad_dia_entero(self):
+        medico = Medico("Dr. Juan Pérez", "M12345")
+        medico.agregar_especialidad(Especialidad("Pediatría", ["lunes", "miércoles"]))
+        medico.agregar_especialidad(Especialidad("Cardiología", ["miércoles", "sábado"]))
+
+        self.assertEqual(medico.obtener_especialidad_para_dia(0), "Pediatría")
+        self.assertEqual(medico.obtener_especialidad_para_dia(2), "Pediatría")
+        self.assertEqual(medico.obtener_especialidad_para_dia(5), "Cardiología")
+        self.assertEqual(medico.obtener_especialidad_para_dia("Sábado"), "Cardiología")
+        self.assertIsNone(medico.obtener_especialidad_para_dia(6))
+        self.assertIsNone(medico.obtener_especialidad_para_dia(7))
+        self.assertIsNone(medico.obtener_especialidad_para_dia("feriado"))
+
+    def test_observador_especialidad(self):
+        medico = Medico("Dr. Juan Pérez", "M12345")
+        avisos = []
+        medico.agregar_observador(lambda m, e: avisos.append((m, e.obtener_especialidad())))
+
+        medico.agregar_especialidad(Especialidad("Pediatría", ["lunes"]))
+
+        self.assertEqual(avisos, [(medico, "Pediatría")])
+
+    def test_observador_que_falla_deshace_especialidad(self):
+        medico = Medico("Dr. Juan Pérez", "M12345")
+        medico.agregar_especialidad(Especialidad("Pediatría", ["lunes"]))
+
+        def fallar(medico, especialidad):
+            raise OSError("disco lleno")
+
+        medico.agregar_observador(fallar)
+        with self.assertRaises(OSError):
+            medico.agregar_especialidad(Especialidad("Cardiología", ["lunes", "martes"], duracion_minutos=45))
+
+        self.assertEqual([e.obtener_especialidad() for e in medico.obtener_especialidades()], ["Pediatría"])
+        self.assertEqual(medico.obtener_especialidad_para_dia(0), "Pediatría")
+        self.assertIsNone(medico.obtener_especialidad_para_dia(1))
+        self.assertIsNone(medico.obtener_duracion_para_dia(1))
+
     def test_agregar_especialidad_duplicada(self):
         medico = Medico("Dr. Juan Pérez", "M12345")
         especialidad1 = Especialidad("Pediatría", ["lunes"])
@@ -115,6 +153,30 @@ class TestMedico(unittest.TestCase):
         self.assertIn("Pediatría", representacion)
         self.assertNotIn("Sin especialidades asignadas", representacion)
 
+    def test_desde_registro(self):
+        pediatria = Especialidad.desde_registro("Pediatría", ["lunes", "miércoles"])
+        clinica = Especialidad.desde_registro("Clínica", ["lunes", "viernes"])
+        medico = Medico.desde_registro("Dr. Juan Pérez", "M12345", [pediatria, clinica])
+
+        self.assertEqual(medico.obtener_matricula(), "M12345")
+        self.assertEqual(medico.obtener_especialidades(), [pediatria, clinica])
+        self.assertEqual(medico.obtener_especialidad_para_dia("lunes"), "Pediatría")
+        self.assertEqual(medico.obtener_especialidad_para_dia(4), "Clínica")
+        self.assertIsNone(medico.obtener_especialidad_para_dia("martes"))
+        self.assertEqual(pediatria.obtener_dias_semana(), [0, 2])
+
+    def test_duracion_para_dia(self):
+        medico = Medico("Dr. Juan Pérez", "M12345")
+        medico.agregar_especialidad(Especialidad("Pediatría", ["lunes"], 20))
+        medico.agregar_especialidad(Especialidad("Psiquiatría", ["lunes", "martes"], 50))
+
+        # El lunes sigue atendiendo la primera especialidad agregada
+        self.assertEqual(medico.obtener_duracion_para_dia(0), 20)
+        self.assertEqual(medico.obtener_duracion_para_dia(1), 50)
+        self.assertIsNone(medico.obtener_duracion_para_dia(2))
+        registrado = Medico.desde_registro("Dr. Juan Pérez", "M12345", medico.obtener_especialidades())
+        self.assertEqual([registrado.obtener_duracion_para_dia(dia) for dia in range(3)], [20, 50, None])
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -69,6 +69,11 @@ class TestPaciente(unittest.TestCase):
         paciente2 = Paciente("Ana López", "87654321", "01/01/1990")
         self.assertNotEqual(paciente1.obtener_dni(), paciente2.obtener_dni())
 
+    def test_desde_registro(self):
+        """Prueba reconstruir un paciente ya validado sin volver a validarlo."""
+        paciente = Paciente.desde_registro("Juan Pérez", "12345678", "12/12/2000")
+        self.assertEqual(str(paciente), "Juan Pérez, 12345678, 12/12/2000")
+
 
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,92 @@
+import marshal
+import os
+import pickle
+import tempfile
+import threading
+import unittest
+
+from src.persistencia import Persistencia
+from src.excepciones import DatosInvalidosException
+
+
+class TestPersistencia(unittest.TestCase):
+
+    def setUp(self):
+        self.directorio = tempfile.TemporaryDirectory()
+        self.persistencia = Persistencia(self.directorio.name, eventos_por_snapshot=3)
+
+    def tearDown(self):
+        self.persistencia.cerrar()
+        self.directorio.cleanup()
+
+    def test_sin_snapshot(self):
+        self.assertIsNone(self.persistencia.cargar_ultimo_snapshot())
+        self.assertEqual(list(self.persistencia.leer_eventos_desde(0)), [])
+
+    def test_registrar_sin_abrir(self):
+        with self.assertRaises(DatosInvalidosException):
+            self.persistencia.registrar({"op": "a"})
+
+    def test_rotar_snapshot_y_compactar(self):
+        self.persistencia.abrir()
+        self.persistencia.registrar({"op": "a"}, {"op": "b"})
+        self.assertFalse(self.persistencia.requiere_snapshot())
+        self.persistencia.registrar({"op": "c"})
+        self.assertTrue(self.persistencia.requiere_snapshot())
+
+        numero = self.persistencia.rotar()
+        self.persistencia.registrar({"op": "d"})
+        self.persistencia.guardar_snapshot(numero, {"estado": [1, 2, 3]})
+
+        self.assertFalse(self.persistencia.requiere_snapshot())
+        self.assertEqual(self.persistencia.cargar_ultimo_snapshot(), (numero, {"estado": [1, 2, 3]}))
+        self.assertEqual([e["op"] for e in self.persistencia.leer_eventos_desde(numero)], ["d"])
+        self.assertEqual(sorted(os.listdir(self.directorio.name)),
+                         ["journal-000002.log", "snapshot-000002.bin"])
+
+    def test_snapshot_con_pickle_y_protocolo_fijo(self):
+        self.persistencia.guardar_snapshot(2, {"turnos": {"fecha_hora": b"\x01\x02"}, "dias": ("lunes",)})
+
+        with open(os.path.join(self.directorio.name, "snapshot-000002.bin"), "rb") as archivo:
+            contenido = archivo.read()
+        self.assertEqual(contenido[:2], bytes([0x80, Persistencia.PROTOCOLO_PICKLE]))
+        self.assertEqual(pickle.loads(contenido)[0], Persistencia.VERSION_SNAPSHOT)
+        self.assertEqual(self.persistencia.cargar_ultimo_snapshot(),
+                         (2, {"turnos": {"fecha_hora": b"\x01\x02"}, "dias": ("lunes",)}))
+
+    def test_lee_snapshot_anterior_con_marshal(self):
+        with open(os.path.join(self.directorio.name, "snapshot-000003.bin"), "wb") as archivo:
+            marshal.dump((1, {"estado": [1, 2, 3]}), archivo)
+
+        self.assertEqual(self.persistencia.cargar_ultimo_snapshot(), (3, {"estado": [1, 2, 3]}))
+
+    def test_reservar_snapshot_una_sola_vez(self):
+        self.persistencia.abrir()
+        self.persistencia.registrar({"op": "a"}, {"op": "b"}, {"op": "c"})
+        barrera = threading.Barrier(8)
+        reservas = []
+
+        def reservar():
+            barrera.wait()
+            reservas.append(self.persistencia.reservar_snapshot())
+
+        hilos = [threading.Thread(target=reservar) for _ in range(8)]
+        for hilo in hilos:
+            hilo.start()
+        for hilo in hilos:
+            hilo.join()
+
+        self.assertEqual(sorted(reservas), [False] * 7 + [True])
+        self.assertFalse(self.persistencia.requiere_snapshot())
+
+    def test_abrir_continua_el_ultimo_segmento(self):
+        self.persistencia.abrir()
+        self.persistencia.rotar()
+        self.persistencia.cerrar()
+
+        self.persistencia.abrir()
+        self.assertEqual(self.persistencia.obtener_segmento_actual(), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
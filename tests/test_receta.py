@@ -4,6 +4,8 @@ from src.turno import Turno
 from src.paciente import Paciente
 from src.medico import Medico
 from src.especialidad import Especialidad
+from src.receta import Receta
+from src.excepciones import DatosInvalidosException, RecetaInvalidaException
 
 
 class TestTurno(unittest.TestCase):
@@ -12,7 +14,7 @@ class TestTurno(unittest.TestCase):
         self.medico = Medico("Dr. Carlos Gómez", "1234")
         self.medico.agregar_especialidad(Especialidad("Pediatría", ["lunes"]))
         
-        self.fecha_hora = datetime(2026, 6, 1, 10, 0)
+        self.fecha_hora = datetime(2030, 6, 3, 10, 0)
         self.especialidad = "Pediatría"
         self.turno = Turno(self.paciente, self.medico, self.fecha_hora, self.especialidad)
 
@@ -33,8 +35,45 @@ class TestTurno(unittest.TestCase):
         self.assertIn("Juan Pérez", turno_str)
         self.assertIn("Dr. Carlos Gómez", turno_str)
         self.assertIn("Pediatría", turno_str)
-        self.assertIn("01/06/2026", turno_str)
+        self.assertIn("03/06/2030", turno_str)
 
+    def test_desde_registro_admite_turnos_pasados(self):
+        fecha_hora = datetime(2020, 1, 6, 10, 0)
+        with self.assertRaises(DatosInvalidosException):
+            Turno(self.paciente, self.medico, fecha_hora, self.especialidad)
+        turno = Turno.desde_registro(self.paciente, self.medico, fecha_hora, self.especialidad)
+        self.assertEqual(turno.obtener_fecha_hora(), fecha_hora)
 
-if _name_ == "_main_":
+    def test_duracion(self):
+        self.assertEqual(self.turno.obtener_duracion_minutos(), Especialidad.DURACION_PREDETERMINADA)
+        turno = Turno(self.paciente, self.medico, self.fecha_hora, self.especialidad, duracion_minutos=45)
+        self.assertEqual(turno.obtener_fecha_hora_fin(), datetime(2030, 6, 3, 10, 45))
+        self.assertEqual(turno.obtener_instante_fin() - turno.obtener_instante(), 45 * 60_000_000)
+        with self.assertRaises(DatosInvalidosException):
+            Turno(self.paciente, self.medico, self.fecha_hora, self.especialidad, duracion_minutos=0)
+
+
+class TestReceta(unittest.TestCase):
+    def setUp(self):
+        self.paciente = Paciente("Juan Pérez", "12345678", "12/12/1990")
+        self.medico = Medico("Dr. Carlos Gómez", "1234")
+
+    def test_conserva_la_escritura_de_cada_medicamento(self):
+        receta = Receta(self.paciente, self.medico, ["Clonazepam  0,5mg", " ", "clonazepam 0,5MG"])
+
+        self.assertEqual(receta.obtener_medicamentos(), ["Clonazepam 0,5mg", "clonazepam 0,5MG"])
+        self.assertIn("Clonazepam 0,5mg, clonazepam 0,5MG", str(receta))
+
+    def test_desde_registro_conserva_fecha(self):
+        fecha = datetime(2020, 1, 15, 9, 30)
+        receta = Receta.desde_registro(self.paciente, self.medico, ["Paracetamol"], fecha)
+        self.assertEqual(receta.obtener_fecha(), fecha)
+        self.assertEqual(receta.obtener_medicamentos(), ["Paracetamol"])
+
+    def test_sin_medicamentos(self):
+        with self.assertRaises(RecetaInvalidaException):
+            Receta(self.paciente, self.medico, ["  "])
+
+
+if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
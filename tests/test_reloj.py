@@ -0,0 +1,33 @@
+import unittest
+from datetime import datetime
+
+from src.reloj import RELOJ_SISTEMA, RelojFijo, a_instante, desde_instante
+
+
+class TestReloj(unittest.TestCase):
+
+    def test_instante_ida_y_vuelta(self):
+        fecha = datetime(2030, 6, 3, 10, 30, 15, 123456)
+        self.assertEqual(desde_instante(a_instante(fecha)), fecha)
+        self.assertEqual(a_instante(datetime(1970, 1, 1, 0, 1)), 60_000_000)
+        self.assertLess(a_instante(datetime(1969, 12, 31)), 0)
+
+    def test_instantes_ordenan_como_las_fechas(self):
+        fechas = [datetime(2030, 6, 3, 11, 0), datetime(1990, 1, 1), datetime(2030, 6, 3, 9, 0)]
+        self.assertEqual(sorted(fechas), sorted(fechas, key=a_instante))
+
+    def test_reloj_fijo(self):
+        fecha = datetime(2030, 6, 3, 10, 0)
+        reloj = RelojFijo(fecha)
+        self.assertEqual(reloj.ahora(), fecha)
+        self.assertEqual(reloj.instante(), a_instante(fecha))
+
+    def test_congelar(self):
+        antes = datetime.now()
+        congelado = RELOJ_SISTEMA.congelar()
+        self.assertGreaterEqual(congelado.ahora(), antes)
+        self.assertEqual(congelado.ahora(), congelado.ahora())
+
+
+if __name__ == "__main__":
+    unittest.main()
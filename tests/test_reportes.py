@@ -0,0 +1,96 @@
+import unittest
+from datetime import date, datetime, time
+from unittest import mock
+
+from src import reportes
+from src.clinica import Clinica
+from src.paciente import Paciente
+from src.medico import Medico
+from src.especialidad import Especialidad
+from src.reportes import ReporteOcupacion
+from src.excepciones import DatosInvalidosException, DependenciaNoDisponibleException
+
+
+@unittest.skipIf(reportes.np is None, "NumPy no está instalado")
+class TestReporteOcupacion(unittest.TestCase):
+
+    def setUp(self):
+        self.clinica = Clinica()
+        self.clinica.agregar_paciente(Paciente("Juan Pérez", "12345678", "12/12/1990"))
+        medico1 = Medico("Dr. Carlos Gómez", "1234")
+        medico1.agregar_especialidad(Especialidad("Psiquiatría", ["lunes", "miércoles"], duracion_minutos=45))
+        medico2 = Medico("Dra. María García", "5678")
+        medico2.agregar_especialidad(Especialidad("Cardiología", ["martes"]))
+        self.clinica.agregar_medicos_lote([medico1, medico2])
+
+        # Semana del lunes 3/6/2030
+        self.clinica.agendar_turno("12345678", "1234", "Psiquiatría", datetime(2030, 6, 3, 8, 0))
+        self.clinica.agendar_turno("12345678", "1234", "Psiquiatría", datetime(2030, 6, 3, 19, 30))
+        self.clinica.agendar_turno("12345678", "5678", "Cardiología", datetime(2030, 6, 4, 10, 0))
+        self.clinica.agendar_turno("12345678", "5678", "Cardiología", datetime(2030, 6, 4, 10, 30))
+        self.clinica.cancelar_turno("5678", datetime(2030, 6, 4, 10, 30))
+        self.reporte = ReporteOcupacion(self.clinica, date(2030, 6, 3), date(2030, 6, 10))
+
+    def test_ejes(self):
+        self.assertEqual(self.reporte.obtener_matriculas(), ["1234", "5678"])
+        self.assertEqual(self.reporte.obtener_dias()[1], date(2030, 6, 4))
+        self.assertEqual(self.reporte.obtener_bloques()[:2], [time(8, 0), time(8, 30)])
+        self.assertEqual(self.reporte.obtener_ocupacion().shape, (2, 7, 24))
+
+    def test_ocupacion_y_capacidad(self):
+        ocupacion = self.reporte.obtener_ocupacion()
+        capacidad = self.reporte.obtener_capacidad()
+
+        # El turno de 45 minutos de las 8:00 ocupa un bloque entero y la mitad del siguiente
+        self.assertEqual(ocupacion[0, 0, :3].tolist(), [30, 15, 0])
+        # El de las 19:30 termina después del cierre: sólo cuenta hasta las 20:00
+        self.assertEqual(ocupacion[0, 0, -1], 30)
+        # El turno cancelado no ocupa su bloque
+        self.assertEqual(ocupacion[1, 1, 4:6].tolist(), [30, 0])
+        self.assertEqual(capacidad[0, :, 0].tolist(), [30, 0, 30, 0, 0, 0, 0])
+        self.assertEqual(int(self.reporte.obtener_capacidad_ociosa()[0, 0].sum()), 24 * 30 - 75)
+        with self.assertRaises(ValueError):
+            ocupacion[0, 0, 0] = 0
+
+    def test_usa_la_duracion_guardada_en_cada_turno(self):
+        # Evento de un journal anterior a las duraciones: el turno dura los 30 minutos
+        # predeterminados aunque la especialidad del médico hoy dure 45
+        self.clinica._cargar_eventos([{"op": "turno", "dni": "12345678", "matricula": "1234",
+                                       "especialidad": "Psiquiatría", "fecha_hora": "2030-06-05T09:00:00"}])
+        reporte = ReporteOcupacion(self.clinica, date(2030, 6, 3), date(2030, 6, 10))
+
+        self.assertEqual(reporte.obtener_ocupacion()[0, 2, 2:4].tolist(), [30, 0])
+
+    def test_resumenes(self):
+        self.assertAlmostEqual(self.reporte.utilizacion(), (75 + 30) / (3 * 24 * 30))
+        self.assertEqual(self.reporte.utilizacion_por_medico().tolist(), [75 / (2 * 24 * 30), 30 / (24 * 30)])
+        por_dia_semana = self.reporte.utilizacion_por_dia_semana_y_bloque()
+        self.assertEqual(por_dia_semana.shape, (7, 24))
+        self.assertEqual(por_dia_semana[0, 1], 0.5)
+        self.assertTrue(all(valor != valor for valor in por_dia_semana[6]))  # NaN: nadie atiende
+        # Tres días-médico de capacidad; a igual utilización gana el bloque más temprano
+        self.assertEqual(self.reporte.horas_pico(2), [(time(8, 0), 1 / 3), (time(10, 0), 1 / 3)])
+
+    def test_clinica_vacia(self):
+        reporte = ReporteOcupacion(Clinica(), date(2030, 6, 3), date(2030, 6, 10))
+        self.assertEqual(reporte.obtener_ocupacion().shape, (0, 7, 24))
+        self.assertEqual(reporte.horas_pico(), [])
+
+    def test_parametros_invalidos(self):
+        for desde, hasta, bloque in ((date(2030, 6, 3), date(2030, 6, 3), 30),
+                                     (datetime(2030, 6, 3), date(2030, 6, 10), 30),
+                                     (date(2030, 6, 3), date(2030, 6, 10), 0)):
+            with self.assertRaises(DatosInvalidosException):
+                ReporteOcupacion(self.clinica, desde, hasta, bloque)
+
+
+class TestReporteSinNumPy(unittest.TestCase):
+
+    def test_sin_numpy(self):
+        with mock.patch.object(reportes, "np", None):
+            with self.assertRaises(DependenciaNoDisponibleException):
+                ReporteOcupacion(Clinica(), date(2030, 6, 3), date(2030, 6, 10))
+
+
+if __name__ == "__main__":
+    unittest.main()
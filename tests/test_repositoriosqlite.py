@@ -0,0 +1,156 @@
+import os
+import sqlite3
+import tempfile
+import unittest
+from datetime import datetime
+from unittest import mock
+
+from src.clinica import Clinica
+from src.journal import Journal
+from src.repositoriosqlite import RepositorioSQLite
+from src.paciente import Paciente
+from src.medico import Medico
+from src.especialidad import Especialidad
+from src.excepciones import TurnoOcupadoException, PacienteDuplicadoException, DatosInvalidosException
+
+
+class TestRepositorioSQLite(unittest.TestCase):
+
+    def setUp(self):
+        self.directorio = tempfile.TemporaryDirectory()
+        self.ruta = os.path.join(self.directorio.name, "clinica.db")
+        self.repositorios = []
+
+    def tearDown(self):
+        for repositorio in self.repositorios:
+            repositorio.cerrar()
+        self.directorio.cleanup()
+
+    def abrir(self) -> Clinica:
+        repositorio = RepositorioSQLite(self.ruta, tamano_pool=2)
+        self.repositorios.append(repositorio)
+        return Clinica(repositorio=repositorio)
+
+    def poblar(self, clinica: Clinica):
+        clinica.agregar_paciente(Paciente("Juan Pérez", "12345678", "12/12/1990"))
+        medico = Medico("Dr. Carlos Gómez", "1234")
+        medico.agregar_especialidad(Especialidad("Pediatría", ["lunes"]))
+        clinica.agregar_medico(medico)
+
+    def test_reabrir_recupera_los_datos(self):
+        clinica = self.abrir()
+        self.poblar(clinica)
+        clinica.obtener_medico_por_matricula("1234").agregar_especialidad(Especialidad("Cardiología", ["martes"]))
+        clinica.agendar_turno("12345678", "1234", "Pediatría", datetime(2030, 6, 3, 10, 0))
+        clinica.agendar_turnos_lote([("12345678", "1234", "Cardiología", datetime(2030, 6, 4, 10, 0))])
+        clinica.emitir_receta("12345678", "1234", ["Paracetamol", "Ibuprofeno"])
+        clinica.cerrar()
+
+        restaurada = self.abrir()
+        historia = restaurada.obtener_historia_clinica("12345678")
+        self.assertEqual([t.obtener_fecha_hora() for t in restaurada.obtener_turnos()],
+                         [datetime(2030, 6, 3, 10, 0), datetime(2030, 6, 4, 10, 0)])
+        self.assertEqual(len(historia.obtener_turnos()), 2)
+        self.assertEqual(historia.obtener_recetas()[0].obtener_medicamentos(), ["Paracetamol", "Ibuprofeno"])
+        self.assertEqual(restaurada.medicos_para("Cardiología", "martes")[0].obtener_matricula(), "1234")
+        with self.assertRaises(TurnoOcupadoException):
+            restaurada.agendar_turno("12345678", "1234", "Pediatría", datetime(2030, 6, 3, 10, 0))
+
+    def test_cancelaciones_persisten(self):
+        clinica = self.abrir()
+        self.poblar(clinica)
+        clinica.agregar_paciente(Paciente("Ana López", "87654321", "01/01/1985"))
+        clinica.agendar_turno("12345678", "1234", "Pediatría", datetime(2030, 6, 3, 10, 0))
+        clinica.cancelar_turno("1234", datetime(2030, 6, 3, 10, 0))
+        # La restricción única de la base ya no bloquea el horario liberado
+        clinica.agendar_turno("87654321", "1234", "Pediatría", datetime(2030, 6, 3, 10, 0))
+        clinica.reprogramar_turno("1234", datetime(2030, 6, 3, 10, 0), datetime(2030, 6, 10, 10, 0))
+        clinica.cerrar()
+
+        restaurada = self.abrir()
+        self.assertEqual([t.obtener_fecha_hora() for t in restaurada.obtener_turnos()], [datetime(2030, 6, 10, 10, 0)])
+        self.assertTrue(restaurada.obtener_historia_clinica("12345678").obtener_turnos()[0].esta_cancelado())
+        self.assertEqual([t.esta_cancelado() for t in restaurada.obtener_historia_clinica("87654321").obtener_turnos()],
+                         [True, False])
+        restaurada.agendar_turno("12345678", "1234", "Pediatría", datetime(2030, 6, 3, 10, 0))
+
+    def test_base_anterior_a_las_duraciones(self):
+        # Esquema de una base creada antes de que especialidades y turnos tuvieran duración
+        conexion = sqlite3.connect(self.ruta)
+        conexion.executescript("""
+            CREATE TABLE medicos (matricula TEXT PRIMARY KEY, nombre TEXT NOT NULL);
+            CREATE TABLE especialidades (id INTEGER PRIMARY KEY, matricula TEXT NOT NULL, tipo TEXT NOT NULL,
+                                         dias TEXT NOT NULL, UNIQUE (matricula, tipo));
+            CREATE TABLE turnos (id INTEGER PRIMARY KEY, dni TEXT NOT NULL, matricula TEXT NOT NULL,
+                                 especialidad TEXT NOT NULL, fecha_hora TEXT NOT NULL, UNIQUE (matricula, fecha_hora));
+            INSERT INTO medicos VALUES ('1234', 'Dr. Carlos Gómez');
+            INSERT INTO especialidades (matricula, tipo, dias) VALUES ('1234', 'Pediatría', '["lunes"]');
+        """)
+        conexion.close()
+
+        clinica = self.abrir()
+        clinica.agregar_paciente(Paciente("Juan Pérez", "12345678", "12/12/1990"))
+        self.assertEqual(clinica.obtener_medico_por_matricula("1234").obtener_duracion_para_dia(0), 30)
+        clinica.obtener_medico_por_matricula("1234").agregar_especialidad(Especialidad("Cardiología", ["martes"], 60))
+        clinica.agendar_turno("12345678", "1234", "Cardiología", datetime(2030, 6, 4, 10, 0))
+        clinica.cerrar()
+
+        restaurada = self.abrir()
+        self.assertEqual(restaurada.obtener_turnos()[0].obtener_duracion_minutos(), 60)
+        with self.assertRaises(TurnoOcupadoException):
+            restaurada.agendar_turno("12345678", "1234", "Cardiología", datetime(2030, 6, 4, 10, 30))
+
+    def test_restricciones_de_la_base(self):
+        """Dos clínicas sobre la misma base: la restricción única rechaza lo que la otra ya guardó."""
+        primera = self.abrir()
+        self.poblar(primera)
+        segunda = self.abrir()
+
+        primera.agendar_turno("12345678", "1234", "Pediatría", datetime(2030, 6, 3, 10, 0))
+        with self.assertRaises(TurnoOcupadoException):
+            segunda.agendar_turno("12345678", "1234", "Pediatría", datetime(2030, 6, 3, 10, 0))
+        with self.assertRaises(PacienteDuplicadoException):
+            segunda.agregar_paciente(Paciente("Ana López", "12345678", "01/01/1985"))
+        self.assertEqual(segunda.obtener_turnos(), [])
+
+    def test_lote_rechazado_no_guarda_nada(self):
+        primera = self.abrir()
+        self.poblar(primera)
+        segunda = self.abrir()
+        primera.agendar_turno("12345678", "1234", "Pediatría", datetime(2030, 6, 3, 11, 0))
+
+        with self.assertRaises(TurnoOcupadoException):
+            segunda.agendar_turnos_lote([
+                ("12345678", "1234", "Pediatría", datetime(2030, 6, 3, 10, 0)),
+                ("12345678", "1234", "Pediatría", datetime(2030, 6, 3, 11, 0)),
+            ])
+        self.assertEqual(len(self.abrir().obtener_turnos()), 1)
+
+    def test_falla_del_journal_no_guarda_en_la_base(self):
+        repositorio = RepositorioSQLite(self.ruta)
+        self.repositorios.append(repositorio)
+        with Journal(os.path.join(self.directorio.name, "clinica.journal")) as journal:
+            clinica = Clinica(journal=journal, repositorio=repositorio)
+            with mock.patch.object(journal, "registrar", side_effect=OSError("disco lleno")):
+                with self.assertRaises(OSError):
+                    clinica.agregar_paciente(Paciente("Juan Pérez", "12345678", "12/12/1990"))
+
+        self.assertEqual(clinica.obtener_pacientes(), [])
+        self.assertEqual(list(repositorio.leer_eventos()), [])
+
+    def test_tamano_pool_invalido(self):
+        with self.assertRaises(DatosInvalidosException):
+            RepositorioSQLite(self.ruta, tamano_pool=0)
+
+    def test_memoria_y_cerrado(self):
+        repositorio = RepositorioSQLite(":memory:")
+        repositorio.guardar({"op": "paciente", "nombre": "Juan Pérez", "dni": "12345678",
+                             "fecha_nacimiento": "12/12/1990"})
+        self.assertEqual([e["dni"] for e in repositorio.leer_eventos()], ["12345678"])
+        repositorio.cerrar()
+        with self.assertRaises(DatosInvalidosException):
+            repositorio.guardar({"op": "paciente"})
+
+
+if __name__ == "__main__":
+    unittest.main()